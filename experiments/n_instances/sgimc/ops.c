@@ -1724,7 +1724,7 @@ typedef struct {
 
 /* #### Code section: numeric_typedefs ### */
 
-/* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":770
+/* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":744
  * # in Cython to enable them only on the right systems.
  * 
  * ctypedef npy_int8       int8_t             # <<<<<<<<<<<<<<
@@ -1733,7 +1733,7 @@ typedef struct {
  */
 typedef npy_int8 __pyx_t_5numpy_int8_t;
 
-/* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":771
+/* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":745
  * 
  * ctypedef npy_int8       int8_t
  * ctypedef npy_int16      int16_t             # <<<<<<<<<<<<<<
@@ -1742,26 +1742,26 @@ typedef npy_int8 __pyx_t_5numpy_int8_t;
  */
 typedef npy_int16 __pyx_t_5numpy_int16_t;
 
-/* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":772
+/* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":746
  * ctypedef npy_int8       int8_t
  * ctypedef npy_int16      int16_t
  * ctypedef npy_int32      int32_t             # <<<<<<<<<<<<<<
  * ctypedef npy_int64      int64_t
- * #ctypedef npy_int96      int96_t
+ * 
  */
 typedef npy_int32 __pyx_t_5numpy_int32_t;
 
-/* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":773
+/* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":747
  * ctypedef npy_int16      int16_t
  * ctypedef npy_int32      int32_t
  * ctypedef npy_int64      int64_t             # <<<<<<<<<<<<<<
- * #ctypedef npy_int96      int96_t
- * #ctypedef npy_int128     int128_t
+ * 
+ * ctypedef npy_uint8      uint8_t
  */
 typedef npy_int64 __pyx_t_5numpy_int64_t;
 
-/* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":777
- * #ctypedef npy_int128     int128_t
+/* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":749
+ * ctypedef npy_int64      int64_t
  * 
  * ctypedef npy_uint8      uint8_t             # <<<<<<<<<<<<<<
  * ctypedef npy_uint16     uint16_t
@@ -1769,7 +1769,7 @@ typedef npy_int64 __pyx_t_5numpy_int64_t;
  */
 typedef npy_uint8 __pyx_t_5numpy_uint8_t;
 
-/* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":778
+/* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":750
  * 
  * ctypedef npy_uint8      uint8_t
  * ctypedef npy_uint16     uint16_t             # <<<<<<<<<<<<<<
@@ -1778,26 +1778,26 @@ typedef npy_uint8 __pyx_t_5numpy_uint8_t;
  */
 typedef npy_uint16 __pyx_t_5numpy_uint16_t;
 
-/* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":779
+/* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":751
  * ctypedef npy_uint8      uint8_t
  * ctypedef npy_uint16     uint16_t
  * ctypedef npy_uint32     uint32_t             # <<<<<<<<<<<<<<
  * ctypedef npy_uint64     uint64_t
- * #ctypedef npy_uint96     uint96_t
+ * 
  */
 typedef npy_uint32 __pyx_t_5numpy_uint32_t;
 
-/* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":780
+/* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":752
  * ctypedef npy_uint16     uint16_t
  * ctypedef npy_uint32     uint32_t
  * ctypedef npy_uint64     uint64_t             # <<<<<<<<<<<<<<
- * #ctypedef npy_uint96     uint96_t
- * #ctypedef npy_uint128    uint128_t
+ * 
+ * ctypedef npy_float32    float32_t
  */
 typedef npy_uint64 __pyx_t_5numpy_uint64_t;
 
-/* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":784
- * #ctypedef npy_uint128    uint128_t
+/* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":754
+ * ctypedef npy_uint64     uint64_t
  * 
  * ctypedef npy_float32    float32_t             # <<<<<<<<<<<<<<
  * ctypedef npy_float64    float64_t
@@ -1805,7 +1805,7 @@ typedef npy_uint64 __pyx_t_5numpy_uint64_t;
  */
 typedef npy_float32 __pyx_t_5numpy_float32_t;
 
-/* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":785
+/* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":755
  * 
  * ctypedef npy_float32    float32_t
  * ctypedef npy_float64    float64_t             # <<<<<<<<<<<<<<
@@ -1814,7 +1814,7 @@ typedef npy_float32 __pyx_t_5numpy_float32_t;
  */
 typedef npy_float64 __pyx_t_5numpy_float64_t;
 
-/* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":792
+/* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":762
  * ctypedef double complex complex128_t
  * 
  * ctypedef npy_longlong   longlong_t             # <<<<<<<<<<<<<<
@@ -1823,7 +1823,7 @@ typedef npy_float64 __pyx_t_5numpy_float64_t;
  */
 typedef npy_longlong __pyx_t_5numpy_longlong_t;
 
-/* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":793
+/* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":763
  * 
  * ctypedef npy_longlong   longlong_t
  * ctypedef npy_ulonglong  ulonglong_t             # <<<<<<<<<<<<<<
@@ -1832,7 +1832,7 @@ typedef npy_longlong __pyx_t_5numpy_longlong_t;
  */
 typedef npy_ulonglong __pyx_t_5numpy_ulonglong_t;
 
-/* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":795
+/* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":765
  * ctypedef npy_ulonglong  ulonglong_t
  * 
  * ctypedef npy_intp       intp_t             # <<<<<<<<<<<<<<
@@ -1841,7 +1841,7 @@ typedef npy_ulonglong __pyx_t_5numpy_ulonglong_t;
  */
 typedef npy_intp __pyx_t_5numpy_intp_t;
 
-/* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":796
+/* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":766
  * 
  * ctypedef npy_intp       intp_t
  * ctypedef npy_uintp      uintp_t             # <<<<<<<<<<<<<<
@@ -1850,7 +1850,7 @@ typedef npy_intp __pyx_t_5numpy_intp_t;
  */
 typedef npy_uintp __pyx_t_5numpy_uintp_t;
 
-/* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":798
+/* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":768
  * ctypedef npy_uintp      uintp_t
  * 
  * ctypedef npy_double     float_t             # <<<<<<<<<<<<<<
@@ -1859,7 +1859,7 @@ typedef npy_uintp __pyx_t_5numpy_uintp_t;
  */
 typedef npy_double __pyx_t_5numpy_float_t;
 
-/* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":799
+/* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":769
  * 
  * ctypedef npy_double     float_t
  * ctypedef npy_double     double_t             # <<<<<<<<<<<<<<
@@ -1868,7 +1868,7 @@ typedef npy_double __pyx_t_5numpy_float_t;
  */
 typedef npy_double __pyx_t_5numpy_double_t;
 
-/* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":800
+/* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":770
  * ctypedef npy_double     float_t
  * ctypedef npy_double     double_t
  * ctypedef npy_longdouble longdouble_t             # <<<<<<<<<<<<<<
@@ -1965,24 +1965,6 @@ struct __pyx_opt_args_7cpython_11contextvars_get_value_no_default {
   PyObject *default_value;
 };
 
-/* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1096
- * 
- * # Iterator API added in v1.6
- * ctypedef int (*NpyIter_IterNextFunc)(NpyIter* it) noexcept nogil             # <<<<<<<<<<<<<<
- * ctypedef void (*NpyIter_GetMultiIndexFunc)(NpyIter* it, npy_intp* outcoords) noexcept nogil
- * 
- */
-typedef int (*__pyx_t_5numpy_NpyIter_IterNextFunc)(NpyIter *);
-
-/* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1097
- * # Iterator API added in v1.6
- * ctypedef int (*NpyIter_IterNextFunc)(NpyIter* it) noexcept nogil
- * ctypedef void (*NpyIter_GetMultiIndexFunc)(NpyIter* it, npy_intp* outcoords) noexcept nogil             # <<<<<<<<<<<<<<
- * 
- * cdef extern from "numpy/arrayobject.h":
- */
-typedef void (*__pyx_t_5numpy_NpyIter_GetMultiIndexFunc)(NpyIter *, npy_intp *);
-
 /* "View.MemoryView":114
  * @cython.collection_type("sequence")
  * @cname("__pyx_array")
@@ -3001,6 +2983,9 @@ static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dc_dou
 /* ObjectToMemviewSlice.proto */
 static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dcd__double(PyObject *, int writable_flag);
 
+/* ObjectToMemviewSlice.proto */
+static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dc_double__const__(PyObject *, int writable_flag);
+
 /* MemviewDtypeToObject.proto */
 static CYTHON_INLINE PyObject *__pyx_memview_get_double(const char *itemp);
 static CYTHON_INLINE int __pyx_memview_set_double(const char *itemp, PyObject *obj);
@@ -3360,6 +3345,7 @@ static PyObject *contiguous = 0;
 static PyObject *indirect_contiguous = 0;
 static int __pyx_memoryview_thread_locks_used;
 static PyThread_type_lock __pyx_memoryview_thread_locks[8];
+static CYTHON_INLINE double __pyx_f_5sgimc_3ops_sigmoid(double); /*proto*/
 static CYTHON_INLINE double __pyx_fuse_1__pyx_f_5sgimc_3ops_soft_threshold(double, double); /*proto*/
 static int __pyx_array_allocate_buffer(struct __pyx_array_obj *); /*proto*/
 static struct __pyx_array_obj *__pyx_array_new(PyObject *, Py_ssize_t, char *, char *, char *); /*proto*/
@@ -3397,6 +3383,7 @@ static void __pyx_memoryview__slice_assign_scalar(char *, Py_ssize_t *, Py_ssize
 static PyObject *__pyx_unpickle_Enum__set_state(struct __pyx_MemviewEnum_obj *, PyObject *); /*proto*/
 /* #### Code section: typeinfo ### */
 static __Pyx_TypeInfo __Pyx_TypeInfo_double = { "double", NULL, sizeof(double), { 0 }, 0, 'R', 0, 0 };
+static __Pyx_TypeInfo __Pyx_TypeInfo_double__const__ = { "const double", NULL, sizeof(double const ), { 0 }, 0, 'R', 0, 0 };
 static __Pyx_TypeInfo __Pyx_TypeInfo_int = { "int", NULL, sizeof(int), { 0 }, 0, __PYX_IS_UNSIGNED(int) ? 'U' : 'I', __PYX_IS_UNSIGNED(int), 0 };
 /* #### Code section: before_global_var ### */
 #define __Pyx_MODULE_NAME "sgimc.ops"
@@ -3429,6 +3416,8 @@ static const char __pyx_k_c[] = "c";
 static const char __pyx_k_i[] = "i";
 static const char __pyx_k_j[] = "j";
 static const char __pyx_k_k[] = "k";
+static const char __pyx_k_n[] = "n";
+static const char __pyx_k_z[] = "z";
 static const char __pyx_k_Sj[] = "Sj";
 static const char __pyx_k_Sp[] = "Sp";
 static const char __pyx_k_Xj[] = "Xj";
@@ -3441,7 +3430,7 @@ static const char __pyx_k__7[] = ")";
 static const char __pyx_k_gc[] = "gc";
 static const char __pyx_k_id[] = "id";
 static const char __pyx_k_np[] = "np";
-static const char __pyx_k__45[] = "?";
+static const char __pyx_k__56[] = "?";
 static const char __pyx_k_abc[] = "abc";
 static const char __pyx_k_and[] = " and ";
 static const char __pyx_k_d_1[] = "d_1";
@@ -3475,12 +3464,15 @@ static const char __pyx_k_ASCII[] = "ASCII";
 static const char __pyx_k_class[] = "__class__";
 static const char __pyx_k_count[] = "count";
 static const char __pyx_k_dtype[] = "dtype";
+static const char __pyx_k_empty[] = "empty";
 static const char __pyx_k_error[] = "error";
 static const char __pyx_k_flags[] = "flags";
 static const char __pyx_k_index[] = "index";
+static const char __pyx_k_logit[] = "logit";
 static const char __pyx_k_numpy[] = "numpy";
 static const char __pyx_k_order[] = "order";
 static const char __pyx_k_range[] = "range";
+static const char __pyx_k_resid[] = "resid";
 static const char __pyx_k_shape[] = "shape";
 static const char __pyx_k_start[] = "start";
 static const char __pyx_k_zeros[] = "zeros";
@@ -3490,22 +3482,26 @@ static const char __pyx_k_encode[] = "encode";
 static const char __pyx_k_format[] = "format";
 static const char __pyx_k_import[] = "__import__";
 static const char __pyx_k_indptr[] = "indptr";
+static const char __pyx_k_margin[] = "margin";
 static const char __pyx_k_name_2[] = "__name__";
 static const char __pyx_k_pickle[] = "pickle";
 static const char __pyx_k_reduce[] = "__reduce__";
 static const char __pyx_k_shrink[] = "shrink";
 static const char __pyx_k_struct[] = "struct";
+static const char __pyx_k_target[] = "target";
 static const char __pyx_k_unpack[] = "unpack";
 static const char __pyx_k_update[] = "update";
 static const char __pyx_k_C_group[] = "C_group";
 static const char __pyx_k_C_lasso[] = "C_lasso";
 static const char __pyx_k_C_ridge[] = "C_ridge";
 static const char __pyx_k_disable[] = "disable";
+static const char __pyx_k_epsilon[] = "epsilon";
 static const char __pyx_k_errcode[] = "errcode";
 static const char __pyx_k_fortran[] = "fortran";
 static const char __pyx_k_has_omp[] = "has_omp";
 static const char __pyx_k_indices[] = "indices";
 static const char __pyx_k_memview[] = "memview";
+static const char __pyx_k_predict[] = "predict";
 static const char __pyx_k_Ellipsis[] = "Ellipsis";
 static const char __pyx_k_Sequence[] = "Sequence";
 static const char __pyx_k_getstate[] = "__getstate__";
@@ -3529,6 +3525,8 @@ static const char __pyx_k_csr_matrix[] = "csr_matrix";
 static const char __pyx_k_dense_op_d[] = "_dense_op_d";
 static const char __pyx_k_dense_op_s[] = "_dense_op_s";
 static const char __pyx_k_empty_like[] = "empty_like";
+static const char __pyx_k_huber_grad[] = "huber_grad";
+static const char __pyx_k_huber_loss[] = "huber_loss";
 static const char __pyx_k_pyx_result[] = "__pyx_result";
 static const char __pyx_k_pyx_vtable[] = "__pyx_vtable__";
 static const char __pyx_k_shrink_row[] = "shrink_row";
@@ -3545,6 +3543,9 @@ static const char __pyx_k_scipy_sparse[] = "scipy.sparse";
 static const char __pyx_k_stringsource[] = "<stringsource>";
 static const char __pyx_k_version_info[] = "version_info";
 static const char __pyx_k_class_getitem[] = "__class_getitem__";
+static const char __pyx_k_logistic_grad[] = "logistic_grad";
+static const char __pyx_k_logistic_hess[] = "logistic_hess";
+static const char __pyx_k_logistic_loss[] = "logistic_loss";
 static const char __pyx_k_reduce_cython[] = "__reduce_cython__";
 static const char __pyx_k_sgimc_ops_pyx[] = "sgimc/ops.pyx";
 static const char __pyx_k_AssertionError[] = "AssertionError";
@@ -3573,6 +3574,8 @@ static const char __pyx_k_itemsize_0_for_cython_array[] = "itemsize <= 0 for cyt
 static const char __pyx_k_unable_to_allocate_array_data[] = "unable to allocate array data.";
 static const char __pyx_k_strided_and_direct_or_indirect[] = "<strided and direct or indirect>";
 static const char __pyx_k_X_and_Z_have_the_same_number_of[] = "`X` and `Z` have the same number of columns.";
+static const char __pyx_k_logit_and_target_must_have_equa[] = "`logit` and `target` must have equal length.";
+static const char __pyx_k_predict_and_target_must_have_eq[] = "`predict` and `target` must have equal length.";
 static const char __pyx_k_All_dimensions_preceding_dimensi[] = "All dimensions preceding dimension %d must be indexed and not sliced";
 static const char __pyx_k_Buffer_view_does_not_expose_stri[] = "Buffer view does not expose strides";
 static const char __pyx_k_Can_only_create_a_buffer_that_is[] = "Can only create a buffer that is contiguous in memory.";
@@ -3639,10 +3642,15 @@ static PyObject *__pyx_pf_5sgimc_3ops_6diag_op_d(CYTHON_UNUSED PyObject *__pyx_s
 static PyObject *__pyx_pf_5sgimc_3ops_8diag_op_s(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_R, __Pyx_memviewslice __pyx_v_X, __Pyx_memviewslice __pyx_v_Z, __Pyx_memviewslice __pyx_v_S); /* proto */
 static PyObject *__pyx_pf_5sgimc_3ops_10shrink(CYTHON_UNUSED PyObject *__pyx_self, __Pyx_memviewslice __pyx_v_D, double __pyx_v_C_lasso, double __pyx_v_C_group, double __pyx_v_C_ridge); /* proto */
 static PyObject *__pyx_pf_5sgimc_3ops_12shrink_row(CYTHON_UNUSED PyObject *__pyx_self, __Pyx_memviewslice __pyx_v_D, double __pyx_v_C_lasso, double __pyx_v_C_group, double __pyx_v_C_ridge); /* proto */
-static PyObject *__pyx_pf_5sgimc_3ops_14_dense_op_d(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_R, __Pyx_memviewslice __pyx_v_X, __Pyx_memviewslice __pyx_v_Z, __Pyx_memviewslice __pyx_v_D, __Pyx_memviewslice __pyx_v_S, int __pyx_v_n_threads); /* proto */
-static PyObject *__pyx_pf_5sgimc_3ops_16_sparse_op_d(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_R, PyObject *__pyx_v_X, __Pyx_memviewslice __pyx_v_Z, __Pyx_memviewslice __pyx_v_D, __Pyx_memviewslice __pyx_v_S, int __pyx_v_n_threads); /* proto */
-static PyObject *__pyx_pf_5sgimc_3ops_18_dense_op_s(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_R, __Pyx_memviewslice __pyx_v_X, __Pyx_memviewslice __pyx_v_Z, __Pyx_memviewslice __pyx_v_S, __Pyx_memviewslice __pyx_v_D, int __pyx_v_n_threads); /* proto */
-static PyObject *__pyx_pf_5sgimc_3ops_20_sparse_op_s(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_R, PyObject *__pyx_v_X, __Pyx_memviewslice __pyx_v_Z, __Pyx_memviewslice __pyx_v_S, __Pyx_memviewslice __pyx_v_D, int __pyx_v_n_threads); /* proto */
+static PyObject *__pyx_pf_5sgimc_3ops_14huber_loss(CYTHON_UNUSED PyObject *__pyx_self, __Pyx_memviewslice __pyx_v_predict, __Pyx_memviewslice __pyx_v_target, double __pyx_v_epsilon); /* proto */
+static PyObject *__pyx_pf_5sgimc_3ops_16huber_grad(CYTHON_UNUSED PyObject *__pyx_self, __Pyx_memviewslice __pyx_v_predict, __Pyx_memviewslice __pyx_v_target, double __pyx_v_epsilon); /* proto */
+static PyObject *__pyx_pf_5sgimc_3ops_18logistic_loss(CYTHON_UNUSED PyObject *__pyx_self, __Pyx_memviewslice __pyx_v_logit, __Pyx_memviewslice __pyx_v_target); /* proto */
+static PyObject *__pyx_pf_5sgimc_3ops_20logistic_grad(CYTHON_UNUSED PyObject *__pyx_self, __Pyx_memviewslice __pyx_v_logit, __Pyx_memviewslice __pyx_v_target); /* proto */
+static PyObject *__pyx_pf_5sgimc_3ops_22logistic_hess(CYTHON_UNUSED PyObject *__pyx_self, __Pyx_memviewslice __pyx_v_logit); /* proto */
+static PyObject *__pyx_pf_5sgimc_3ops_24_dense_op_d(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_R, __Pyx_memviewslice __pyx_v_X, __Pyx_memviewslice __pyx_v_Z, __Pyx_memviewslice __pyx_v_D, __Pyx_memviewslice __pyx_v_S, int __pyx_v_n_threads); /* proto */
+static PyObject *__pyx_pf_5sgimc_3ops_26_sparse_op_d(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_R, PyObject *__pyx_v_X, __Pyx_memviewslice __pyx_v_Z, __Pyx_memviewslice __pyx_v_D, __Pyx_memviewslice __pyx_v_S, int __pyx_v_n_threads); /* proto */
+static PyObject *__pyx_pf_5sgimc_3ops_28_dense_op_s(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_R, __Pyx_memviewslice __pyx_v_X, __Pyx_memviewslice __pyx_v_Z, __Pyx_memviewslice __pyx_v_S, __Pyx_memviewslice __pyx_v_D, int __pyx_v_n_threads); /* proto */
+static PyObject *__pyx_pf_5sgimc_3ops_30_sparse_op_s(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_R, PyObject *__pyx_v_X, __Pyx_memviewslice __pyx_v_Z, __Pyx_memviewslice __pyx_v_S, __Pyx_memviewslice __pyx_v_D, int __pyx_v_n_threads); /* proto */
 static PyObject *__pyx_tp_new_array(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
 static PyObject *__pyx_tp_new_Enum(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
 static PyObject *__pyx_tp_new_memoryview(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
@@ -3852,7 +3860,7 @@ typedef struct {
   PyObject *__pyx_n_s_Z;
   PyObject *__pyx_kp_u__2;
   PyObject *__pyx_n_s__3;
-  PyObject *__pyx_n_s__45;
+  PyObject *__pyx_n_s__56;
   PyObject *__pyx_kp_u__6;
   PyObject *__pyx_kp_u__7;
   PyObject *__pyx_n_s_abc;
@@ -3882,10 +3890,12 @@ typedef struct {
   PyObject *__pyx_n_s_double;
   PyObject *__pyx_n_s_dtype;
   PyObject *__pyx_n_s_dtype_is_object;
+  PyObject *__pyx_n_s_empty;
   PyObject *__pyx_n_s_empty_like;
   PyObject *__pyx_kp_u_enable;
   PyObject *__pyx_n_s_encode;
   PyObject *__pyx_n_s_enumerate;
+  PyObject *__pyx_n_s_epsilon;
   PyObject *__pyx_n_s_errcode;
   PyObject *__pyx_n_s_error;
   PyObject *__pyx_n_s_flags;
@@ -3897,6 +3907,8 @@ typedef struct {
   PyObject *__pyx_kp_u_got;
   PyObject *__pyx_kp_u_got_differing_extents_in_dimensi;
   PyObject *__pyx_n_s_has_omp;
+  PyObject *__pyx_n_s_huber_grad;
+  PyObject *__pyx_n_s_huber_loss;
   PyObject *__pyx_n_s_i;
   PyObject *__pyx_n_s_id;
   PyObject *__pyx_n_s_import;
@@ -3910,9 +3922,16 @@ typedef struct {
   PyObject *__pyx_kp_s_itemsize_0_for_cython_array;
   PyObject *__pyx_n_s_j;
   PyObject *__pyx_n_s_k;
+  PyObject *__pyx_n_s_logistic_grad;
+  PyObject *__pyx_n_s_logistic_hess;
+  PyObject *__pyx_n_s_logistic_loss;
+  PyObject *__pyx_n_s_logit;
+  PyObject *__pyx_kp_s_logit_and_target_must_have_equa;
   PyObject *__pyx_n_s_main;
+  PyObject *__pyx_n_s_margin;
   PyObject *__pyx_n_s_memview;
   PyObject *__pyx_n_s_mode;
+  PyObject *__pyx_n_s_n;
   PyObject *__pyx_n_s_n_1;
   PyObject *__pyx_n_s_n_2;
   PyObject *__pyx_n_s_n_threads;
@@ -3935,6 +3954,8 @@ typedef struct {
   PyObject *__pyx_n_s_out;
   PyObject *__pyx_n_s_pack;
   PyObject *__pyx_n_s_pickle;
+  PyObject *__pyx_n_s_predict;
+  PyObject *__pyx_kp_s_predict_and_target_must_have_eq;
   PyObject *__pyx_n_s_pyx_PickleError;
   PyObject *__pyx_n_s_pyx_checksum;
   PyObject *__pyx_n_s_pyx_result;
@@ -3947,6 +3968,7 @@ typedef struct {
   PyObject *__pyx_n_s_reduce_cython;
   PyObject *__pyx_n_s_reduce_ex;
   PyObject *__pyx_n_s_register;
+  PyObject *__pyx_n_s_resid;
   PyObject *__pyx_n_s_scipy_sparse;
   PyObject *__pyx_n_s_setstate;
   PyObject *__pyx_n_s_setstate_cython;
@@ -3969,6 +3991,7 @@ typedef struct {
   PyObject *__pyx_kp_s_stringsource;
   PyObject *__pyx_n_s_struct;
   PyObject *__pyx_n_s_sys;
+  PyObject *__pyx_n_s_target;
   PyObject *__pyx_n_s_test;
   PyObject *__pyx_n_s_tmp;
   PyObject *__pyx_kp_s_unable_to_allocate_array_data;
@@ -3976,6 +3999,7 @@ typedef struct {
   PyObject *__pyx_n_s_unpack;
   PyObject *__pyx_n_s_update;
   PyObject *__pyx_n_s_version_info;
+  PyObject *__pyx_n_s_z;
   PyObject *__pyx_n_s_zeros;
   PyObject *__pyx_int_0;
   PyObject *__pyx_int_1;
@@ -4001,7 +4025,8 @@ typedef struct {
   PyObject *__pyx_tuple__20;
   PyObject *__pyx_tuple__21;
   PyObject *__pyx_tuple__22;
-  PyObject *__pyx_tuple__25;
+  PyObject *__pyx_tuple__23;
+  PyObject *__pyx_tuple__24;
   PyObject *__pyx_tuple__27;
   PyObject *__pyx_tuple__29;
   PyObject *__pyx_tuple__31;
@@ -4009,10 +4034,14 @@ typedef struct {
   PyObject *__pyx_tuple__35;
   PyObject *__pyx_tuple__37;
   PyObject *__pyx_tuple__39;
-  PyObject *__pyx_tuple__41;
-  PyObject *__pyx_tuple__43;
-  PyObject *__pyx_codeobj__23;
-  PyObject *__pyx_codeobj__24;
+  PyObject *__pyx_tuple__42;
+  PyObject *__pyx_tuple__44;
+  PyObject *__pyx_tuple__46;
+  PyObject *__pyx_tuple__48;
+  PyObject *__pyx_tuple__50;
+  PyObject *__pyx_tuple__52;
+  PyObject *__pyx_tuple__54;
+  PyObject *__pyx_codeobj__25;
   PyObject *__pyx_codeobj__26;
   PyObject *__pyx_codeobj__28;
   PyObject *__pyx_codeobj__30;
@@ -4021,8 +4050,14 @@ typedef struct {
   PyObject *__pyx_codeobj__36;
   PyObject *__pyx_codeobj__38;
   PyObject *__pyx_codeobj__40;
-  PyObject *__pyx_codeobj__42;
-  PyObject *__pyx_codeobj__44;
+  PyObject *__pyx_codeobj__41;
+  PyObject *__pyx_codeobj__43;
+  PyObject *__pyx_codeobj__45;
+  PyObject *__pyx_codeobj__47;
+  PyObject *__pyx_codeobj__49;
+  PyObject *__pyx_codeobj__51;
+  PyObject *__pyx_codeobj__53;
+  PyObject *__pyx_codeobj__55;
 } __pyx_mstate;
 
 #if CYTHON_USE_MODULE_STATE
@@ -4141,7 +4176,7 @@ static int __pyx_m_clear(PyObject *m) {
   Py_CLEAR(clear_module_state->__pyx_n_s_Z);
   Py_CLEAR(clear_module_state->__pyx_kp_u__2);
   Py_CLEAR(clear_module_state->__pyx_n_s__3);
-  Py_CLEAR(clear_module_state->__pyx_n_s__45);
+  Py_CLEAR(clear_module_state->__pyx_n_s__56);
   Py_CLEAR(clear_module_state->__pyx_kp_u__6);
   Py_CLEAR(clear_module_state->__pyx_kp_u__7);
   Py_CLEAR(clear_module_state->__pyx_n_s_abc);
@@ -4171,10 +4206,12 @@ static int __pyx_m_clear(PyObject *m) {
   Py_CLEAR(clear_module_state->__pyx_n_s_double);
   Py_CLEAR(clear_module_state->__pyx_n_s_dtype);
   Py_CLEAR(clear_module_state->__pyx_n_s_dtype_is_object);
+  Py_CLEAR(clear_module_state->__pyx_n_s_empty);
   Py_CLEAR(clear_module_state->__pyx_n_s_empty_like);
   Py_CLEAR(clear_module_state->__pyx_kp_u_enable);
   Py_CLEAR(clear_module_state->__pyx_n_s_encode);
   Py_CLEAR(clear_module_state->__pyx_n_s_enumerate);
+  Py_CLEAR(clear_module_state->__pyx_n_s_epsilon);
   Py_CLEAR(clear_module_state->__pyx_n_s_errcode);
   Py_CLEAR(clear_module_state->__pyx_n_s_error);
   Py_CLEAR(clear_module_state->__pyx_n_s_flags);
@@ -4186,6 +4223,8 @@ static int __pyx_m_clear(PyObject *m) {
   Py_CLEAR(clear_module_state->__pyx_kp_u_got);
   Py_CLEAR(clear_module_state->__pyx_kp_u_got_differing_extents_in_dimensi);
   Py_CLEAR(clear_module_state->__pyx_n_s_has_omp);
+  Py_CLEAR(clear_module_state->__pyx_n_s_huber_grad);
+  Py_CLEAR(clear_module_state->__pyx_n_s_huber_loss);
   Py_CLEAR(clear_module_state->__pyx_n_s_i);
   Py_CLEAR(clear_module_state->__pyx_n_s_id);
   Py_CLEAR(clear_module_state->__pyx_n_s_import);
@@ -4199,9 +4238,16 @@ static int __pyx_m_clear(PyObject *m) {
   Py_CLEAR(clear_module_state->__pyx_kp_s_itemsize_0_for_cython_array);
   Py_CLEAR(clear_module_state->__pyx_n_s_j);
   Py_CLEAR(clear_module_state->__pyx_n_s_k);
+  Py_CLEAR(clear_module_state->__pyx_n_s_logistic_grad);
+  Py_CLEAR(clear_module_state->__pyx_n_s_logistic_hess);
+  Py_CLEAR(clear_module_state->__pyx_n_s_logistic_loss);
+  Py_CLEAR(clear_module_state->__pyx_n_s_logit);
+  Py_CLEAR(clear_module_state->__pyx_kp_s_logit_and_target_must_have_equa);
   Py_CLEAR(clear_module_state->__pyx_n_s_main);
+  Py_CLEAR(clear_module_state->__pyx_n_s_margin);
   Py_CLEAR(clear_module_state->__pyx_n_s_memview);
   Py_CLEAR(clear_module_state->__pyx_n_s_mode);
+  Py_CLEAR(clear_module_state->__pyx_n_s_n);
   Py_CLEAR(clear_module_state->__pyx_n_s_n_1);
   Py_CLEAR(clear_module_state->__pyx_n_s_n_2);
   Py_CLEAR(clear_module_state->__pyx_n_s_n_threads);
@@ -4224,6 +4270,8 @@ static int __pyx_m_clear(PyObject *m) {
   Py_CLEAR(clear_module_state->__pyx_n_s_out);
   Py_CLEAR(clear_module_state->__pyx_n_s_pack);
   Py_CLEAR(clear_module_state->__pyx_n_s_pickle);
+  Py_CLEAR(clear_module_state->__pyx_n_s_predict);
+  Py_CLEAR(clear_module_state->__pyx_kp_s_predict_and_target_must_have_eq);
   Py_CLEAR(clear_module_state->__pyx_n_s_pyx_PickleError);
   Py_CLEAR(clear_module_state->__pyx_n_s_pyx_checksum);
   Py_CLEAR(clear_module_state->__pyx_n_s_pyx_result);
@@ -4236,6 +4284,7 @@ static int __pyx_m_clear(PyObject *m) {
   Py_CLEAR(clear_module_state->__pyx_n_s_reduce_cython);
   Py_CLEAR(clear_module_state->__pyx_n_s_reduce_ex);
   Py_CLEAR(clear_module_state->__pyx_n_s_register);
+  Py_CLEAR(clear_module_state->__pyx_n_s_resid);
   Py_CLEAR(clear_module_state->__pyx_n_s_scipy_sparse);
   Py_CLEAR(clear_module_state->__pyx_n_s_setstate);
   Py_CLEAR(clear_module_state->__pyx_n_s_setstate_cython);
@@ -4258,6 +4307,7 @@ static int __pyx_m_clear(PyObject *m) {
   Py_CLEAR(clear_module_state->__pyx_kp_s_stringsource);
   Py_CLEAR(clear_module_state->__pyx_n_s_struct);
   Py_CLEAR(clear_module_state->__pyx_n_s_sys);
+  Py_CLEAR(clear_module_state->__pyx_n_s_target);
   Py_CLEAR(clear_module_state->__pyx_n_s_test);
   Py_CLEAR(clear_module_state->__pyx_n_s_tmp);
   Py_CLEAR(clear_module_state->__pyx_kp_s_unable_to_allocate_array_data);
@@ -4265,6 +4315,7 @@ static int __pyx_m_clear(PyObject *m) {
   Py_CLEAR(clear_module_state->__pyx_n_s_unpack);
   Py_CLEAR(clear_module_state->__pyx_n_s_update);
   Py_CLEAR(clear_module_state->__pyx_n_s_version_info);
+  Py_CLEAR(clear_module_state->__pyx_n_s_z);
   Py_CLEAR(clear_module_state->__pyx_n_s_zeros);
   Py_CLEAR(clear_module_state->__pyx_int_0);
   Py_CLEAR(clear_module_state->__pyx_int_1);
@@ -4290,7 +4341,8 @@ static int __pyx_m_clear(PyObject *m) {
   Py_CLEAR(clear_module_state->__pyx_tuple__20);
   Py_CLEAR(clear_module_state->__pyx_tuple__21);
   Py_CLEAR(clear_module_state->__pyx_tuple__22);
-  Py_CLEAR(clear_module_state->__pyx_tuple__25);
+  Py_CLEAR(clear_module_state->__pyx_tuple__23);
+  Py_CLEAR(clear_module_state->__pyx_tuple__24);
   Py_CLEAR(clear_module_state->__pyx_tuple__27);
   Py_CLEAR(clear_module_state->__pyx_tuple__29);
   Py_CLEAR(clear_module_state->__pyx_tuple__31);
@@ -4298,10 +4350,14 @@ static int __pyx_m_clear(PyObject *m) {
   Py_CLEAR(clear_module_state->__pyx_tuple__35);
   Py_CLEAR(clear_module_state->__pyx_tuple__37);
   Py_CLEAR(clear_module_state->__pyx_tuple__39);
-  Py_CLEAR(clear_module_state->__pyx_tuple__41);
-  Py_CLEAR(clear_module_state->__pyx_tuple__43);
-  Py_CLEAR(clear_module_state->__pyx_codeobj__23);
-  Py_CLEAR(clear_module_state->__pyx_codeobj__24);
+  Py_CLEAR(clear_module_state->__pyx_tuple__42);
+  Py_CLEAR(clear_module_state->__pyx_tuple__44);
+  Py_CLEAR(clear_module_state->__pyx_tuple__46);
+  Py_CLEAR(clear_module_state->__pyx_tuple__48);
+  Py_CLEAR(clear_module_state->__pyx_tuple__50);
+  Py_CLEAR(clear_module_state->__pyx_tuple__52);
+  Py_CLEAR(clear_module_state->__pyx_tuple__54);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__25);
   Py_CLEAR(clear_module_state->__pyx_codeobj__26);
   Py_CLEAR(clear_module_state->__pyx_codeobj__28);
   Py_CLEAR(clear_module_state->__pyx_codeobj__30);
@@ -4310,8 +4366,14 @@ static int __pyx_m_clear(PyObject *m) {
   Py_CLEAR(clear_module_state->__pyx_codeobj__36);
   Py_CLEAR(clear_module_state->__pyx_codeobj__38);
   Py_CLEAR(clear_module_state->__pyx_codeobj__40);
-  Py_CLEAR(clear_module_state->__pyx_codeobj__42);
-  Py_CLEAR(clear_module_state->__pyx_codeobj__44);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__41);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__43);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__45);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__47);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__49);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__51);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__53);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__55);
   return 0;
 }
 #endif
@@ -4408,7 +4470,7 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
   Py_VISIT(traverse_module_state->__pyx_n_s_Z);
   Py_VISIT(traverse_module_state->__pyx_kp_u__2);
   Py_VISIT(traverse_module_state->__pyx_n_s__3);
-  Py_VISIT(traverse_module_state->__pyx_n_s__45);
+  Py_VISIT(traverse_module_state->__pyx_n_s__56);
   Py_VISIT(traverse_module_state->__pyx_kp_u__6);
   Py_VISIT(traverse_module_state->__pyx_kp_u__7);
   Py_VISIT(traverse_module_state->__pyx_n_s_abc);
@@ -4438,10 +4500,12 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
   Py_VISIT(traverse_module_state->__pyx_n_s_double);
   Py_VISIT(traverse_module_state->__pyx_n_s_dtype);
   Py_VISIT(traverse_module_state->__pyx_n_s_dtype_is_object);
+  Py_VISIT(traverse_module_state->__pyx_n_s_empty);
   Py_VISIT(traverse_module_state->__pyx_n_s_empty_like);
   Py_VISIT(traverse_module_state->__pyx_kp_u_enable);
   Py_VISIT(traverse_module_state->__pyx_n_s_encode);
   Py_VISIT(traverse_module_state->__pyx_n_s_enumerate);
+  Py_VISIT(traverse_module_state->__pyx_n_s_epsilon);
   Py_VISIT(traverse_module_state->__pyx_n_s_errcode);
   Py_VISIT(traverse_module_state->__pyx_n_s_error);
   Py_VISIT(traverse_module_state->__pyx_n_s_flags);
@@ -4453,6 +4517,8 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
   Py_VISIT(traverse_module_state->__pyx_kp_u_got);
   Py_VISIT(traverse_module_state->__pyx_kp_u_got_differing_extents_in_dimensi);
   Py_VISIT(traverse_module_state->__pyx_n_s_has_omp);
+  Py_VISIT(traverse_module_state->__pyx_n_s_huber_grad);
+  Py_VISIT(traverse_module_state->__pyx_n_s_huber_loss);
   Py_VISIT(traverse_module_state->__pyx_n_s_i);
   Py_VISIT(traverse_module_state->__pyx_n_s_id);
   Py_VISIT(traverse_module_state->__pyx_n_s_import);
@@ -4466,9 +4532,16 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
   Py_VISIT(traverse_module_state->__pyx_kp_s_itemsize_0_for_cython_array);
   Py_VISIT(traverse_module_state->__pyx_n_s_j);
   Py_VISIT(traverse_module_state->__pyx_n_s_k);
+  Py_VISIT(traverse_module_state->__pyx_n_s_logistic_grad);
+  Py_VISIT(traverse_module_state->__pyx_n_s_logistic_hess);
+  Py_VISIT(traverse_module_state->__pyx_n_s_logistic_loss);
+  Py_VISIT(traverse_module_state->__pyx_n_s_logit);
+  Py_VISIT(traverse_module_state->__pyx_kp_s_logit_and_target_must_have_equa);
   Py_VISIT(traverse_module_state->__pyx_n_s_main);
+  Py_VISIT(traverse_module_state->__pyx_n_s_margin);
   Py_VISIT(traverse_module_state->__pyx_n_s_memview);
   Py_VISIT(traverse_module_state->__pyx_n_s_mode);
+  Py_VISIT(traverse_module_state->__pyx_n_s_n);
   Py_VISIT(traverse_module_state->__pyx_n_s_n_1);
   Py_VISIT(traverse_module_state->__pyx_n_s_n_2);
   Py_VISIT(traverse_module_state->__pyx_n_s_n_threads);
@@ -4491,6 +4564,8 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
   Py_VISIT(traverse_module_state->__pyx_n_s_out);
   Py_VISIT(traverse_module_state->__pyx_n_s_pack);
   Py_VISIT(traverse_module_state->__pyx_n_s_pickle);
+  Py_VISIT(traverse_module_state->__pyx_n_s_predict);
+  Py_VISIT(traverse_module_state->__pyx_kp_s_predict_and_target_must_have_eq);
   Py_VISIT(traverse_module_state->__pyx_n_s_pyx_PickleError);
   Py_VISIT(traverse_module_state->__pyx_n_s_pyx_checksum);
   Py_VISIT(traverse_module_state->__pyx_n_s_pyx_result);
@@ -4503,6 +4578,7 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
   Py_VISIT(traverse_module_state->__pyx_n_s_reduce_cython);
   Py_VISIT(traverse_module_state->__pyx_n_s_reduce_ex);
   Py_VISIT(traverse_module_state->__pyx_n_s_register);
+  Py_VISIT(traverse_module_state->__pyx_n_s_resid);
   Py_VISIT(traverse_module_state->__pyx_n_s_scipy_sparse);
   Py_VISIT(traverse_module_state->__pyx_n_s_setstate);
   Py_VISIT(traverse_module_state->__pyx_n_s_setstate_cython);
@@ -4525,6 +4601,7 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
   Py_VISIT(traverse_module_state->__pyx_kp_s_stringsource);
   Py_VISIT(traverse_module_state->__pyx_n_s_struct);
   Py_VISIT(traverse_module_state->__pyx_n_s_sys);
+  Py_VISIT(traverse_module_state->__pyx_n_s_target);
   Py_VISIT(traverse_module_state->__pyx_n_s_test);
   Py_VISIT(traverse_module_state->__pyx_n_s_tmp);
   Py_VISIT(traverse_module_state->__pyx_kp_s_unable_to_allocate_array_data);
@@ -4532,6 +4609,7 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
   Py_VISIT(traverse_module_state->__pyx_n_s_unpack);
   Py_VISIT(traverse_module_state->__pyx_n_s_update);
   Py_VISIT(traverse_module_state->__pyx_n_s_version_info);
+  Py_VISIT(traverse_module_state->__pyx_n_s_z);
   Py_VISIT(traverse_module_state->__pyx_n_s_zeros);
   Py_VISIT(traverse_module_state->__pyx_int_0);
   Py_VISIT(traverse_module_state->__pyx_int_1);
@@ -4557,7 +4635,8 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
   Py_VISIT(traverse_module_state->__pyx_tuple__20);
   Py_VISIT(traverse_module_state->__pyx_tuple__21);
   Py_VISIT(traverse_module_state->__pyx_tuple__22);
-  Py_VISIT(traverse_module_state->__pyx_tuple__25);
+  Py_VISIT(traverse_module_state->__pyx_tuple__23);
+  Py_VISIT(traverse_module_state->__pyx_tuple__24);
   Py_VISIT(traverse_module_state->__pyx_tuple__27);
   Py_VISIT(traverse_module_state->__pyx_tuple__29);
   Py_VISIT(traverse_module_state->__pyx_tuple__31);
@@ -4565,10 +4644,14 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
   Py_VISIT(traverse_module_state->__pyx_tuple__35);
   Py_VISIT(traverse_module_state->__pyx_tuple__37);
   Py_VISIT(traverse_module_state->__pyx_tuple__39);
-  Py_VISIT(traverse_module_state->__pyx_tuple__41);
-  Py_VISIT(traverse_module_state->__pyx_tuple__43);
-  Py_VISIT(traverse_module_state->__pyx_codeobj__23);
-  Py_VISIT(traverse_module_state->__pyx_codeobj__24);
+  Py_VISIT(traverse_module_state->__pyx_tuple__42);
+  Py_VISIT(traverse_module_state->__pyx_tuple__44);
+  Py_VISIT(traverse_module_state->__pyx_tuple__46);
+  Py_VISIT(traverse_module_state->__pyx_tuple__48);
+  Py_VISIT(traverse_module_state->__pyx_tuple__50);
+  Py_VISIT(traverse_module_state->__pyx_tuple__52);
+  Py_VISIT(traverse_module_state->__pyx_tuple__54);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__25);
   Py_VISIT(traverse_module_state->__pyx_codeobj__26);
   Py_VISIT(traverse_module_state->__pyx_codeobj__28);
   Py_VISIT(traverse_module_state->__pyx_codeobj__30);
@@ -4577,8 +4660,14 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
   Py_VISIT(traverse_module_state->__pyx_codeobj__36);
   Py_VISIT(traverse_module_state->__pyx_codeobj__38);
   Py_VISIT(traverse_module_state->__pyx_codeobj__40);
-  Py_VISIT(traverse_module_state->__pyx_codeobj__42);
-  Py_VISIT(traverse_module_state->__pyx_codeobj__44);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__41);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__43);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__45);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__47);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__49);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__51);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__53);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__55);
   return 0;
 }
 #endif
@@ -4785,7 +4874,7 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
 #define __pyx_n_s_Z __pyx_mstate_global->__pyx_n_s_Z
 #define __pyx_kp_u__2 __pyx_mstate_global->__pyx_kp_u__2
 #define __pyx_n_s__3 __pyx_mstate_global->__pyx_n_s__3
-#define __pyx_n_s__45 __pyx_mstate_global->__pyx_n_s__45
+#define __pyx_n_s__56 __pyx_mstate_global->__pyx_n_s__56
 #define __pyx_kp_u__6 __pyx_mstate_global->__pyx_kp_u__6
 #define __pyx_kp_u__7 __pyx_mstate_global->__pyx_kp_u__7
 #define __pyx_n_s_abc __pyx_mstate_global->__pyx_n_s_abc
@@ -4815,10 +4904,12 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
 #define __pyx_n_s_double __pyx_mstate_global->__pyx_n_s_double
 #define __pyx_n_s_dtype __pyx_mstate_global->__pyx_n_s_dtype
 #define __pyx_n_s_dtype_is_object __pyx_mstate_global->__pyx_n_s_dtype_is_object
+#define __pyx_n_s_empty __pyx_mstate_global->__pyx_n_s_empty
 #define __pyx_n_s_empty_like __pyx_mstate_global->__pyx_n_s_empty_like
 #define __pyx_kp_u_enable __pyx_mstate_global->__pyx_kp_u_enable
 #define __pyx_n_s_encode __pyx_mstate_global->__pyx_n_s_encode
 #define __pyx_n_s_enumerate __pyx_mstate_global->__pyx_n_s_enumerate
+#define __pyx_n_s_epsilon __pyx_mstate_global->__pyx_n_s_epsilon
 #define __pyx_n_s_errcode __pyx_mstate_global->__pyx_n_s_errcode
 #define __pyx_n_s_error __pyx_mstate_global->__pyx_n_s_error
 #define __pyx_n_s_flags __pyx_mstate_global->__pyx_n_s_flags
@@ -4830,6 +4921,8 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
 #define __pyx_kp_u_got __pyx_mstate_global->__pyx_kp_u_got
 #define __pyx_kp_u_got_differing_extents_in_dimensi __pyx_mstate_global->__pyx_kp_u_got_differing_extents_in_dimensi
 #define __pyx_n_s_has_omp __pyx_mstate_global->__pyx_n_s_has_omp
+#define __pyx_n_s_huber_grad __pyx_mstate_global->__pyx_n_s_huber_grad
+#define __pyx_n_s_huber_loss __pyx_mstate_global->__pyx_n_s_huber_loss
 #define __pyx_n_s_i __pyx_mstate_global->__pyx_n_s_i
 #define __pyx_n_s_id __pyx_mstate_global->__pyx_n_s_id
 #define __pyx_n_s_import __pyx_mstate_global->__pyx_n_s_import
@@ -4843,9 +4936,16 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
 #define __pyx_kp_s_itemsize_0_for_cython_array __pyx_mstate_global->__pyx_kp_s_itemsize_0_for_cython_array
 #define __pyx_n_s_j __pyx_mstate_global->__pyx_n_s_j
 #define __pyx_n_s_k __pyx_mstate_global->__pyx_n_s_k
+#define __pyx_n_s_logistic_grad __pyx_mstate_global->__pyx_n_s_logistic_grad
+#define __pyx_n_s_logistic_hess __pyx_mstate_global->__pyx_n_s_logistic_hess
+#define __pyx_n_s_logistic_loss __pyx_mstate_global->__pyx_n_s_logistic_loss
+#define __pyx_n_s_logit __pyx_mstate_global->__pyx_n_s_logit
+#define __pyx_kp_s_logit_and_target_must_have_equa __pyx_mstate_global->__pyx_kp_s_logit_and_target_must_have_equa
 #define __pyx_n_s_main __pyx_mstate_global->__pyx_n_s_main
+#define __pyx_n_s_margin __pyx_mstate_global->__pyx_n_s_margin
 #define __pyx_n_s_memview __pyx_mstate_global->__pyx_n_s_memview
 #define __pyx_n_s_mode __pyx_mstate_global->__pyx_n_s_mode
+#define __pyx_n_s_n __pyx_mstate_global->__pyx_n_s_n
 #define __pyx_n_s_n_1 __pyx_mstate_global->__pyx_n_s_n_1
 #define __pyx_n_s_n_2 __pyx_mstate_global->__pyx_n_s_n_2
 #define __pyx_n_s_n_threads __pyx_mstate_global->__pyx_n_s_n_threads
@@ -4868,6 +4968,8 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
 #define __pyx_n_s_out __pyx_mstate_global->__pyx_n_s_out
 #define __pyx_n_s_pack __pyx_mstate_global->__pyx_n_s_pack
 #define __pyx_n_s_pickle __pyx_mstate_global->__pyx_n_s_pickle
+#define __pyx_n_s_predict __pyx_mstate_global->__pyx_n_s_predict
+#define __pyx_kp_s_predict_and_target_must_have_eq __pyx_mstate_global->__pyx_kp_s_predict_and_target_must_have_eq
 #define __pyx_n_s_pyx_PickleError __pyx_mstate_global->__pyx_n_s_pyx_PickleError
 #define __pyx_n_s_pyx_checksum __pyx_mstate_global->__pyx_n_s_pyx_checksum
 #define __pyx_n_s_pyx_result __pyx_mstate_global->__pyx_n_s_pyx_result
@@ -4880,6 +4982,7 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
 #define __pyx_n_s_reduce_cython __pyx_mstate_global->__pyx_n_s_reduce_cython
 #define __pyx_n_s_reduce_ex __pyx_mstate_global->__pyx_n_s_reduce_ex
 #define __pyx_n_s_register __pyx_mstate_global->__pyx_n_s_register
+#define __pyx_n_s_resid __pyx_mstate_global->__pyx_n_s_resid
 #define __pyx_n_s_scipy_sparse __pyx_mstate_global->__pyx_n_s_scipy_sparse
 #define __pyx_n_s_setstate __pyx_mstate_global->__pyx_n_s_setstate
 #define __pyx_n_s_setstate_cython __pyx_mstate_global->__pyx_n_s_setstate_cython
@@ -4902,6 +5005,7 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
 #define __pyx_kp_s_stringsource __pyx_mstate_global->__pyx_kp_s_stringsource
 #define __pyx_n_s_struct __pyx_mstate_global->__pyx_n_s_struct
 #define __pyx_n_s_sys __pyx_mstate_global->__pyx_n_s_sys
+#define __pyx_n_s_target __pyx_mstate_global->__pyx_n_s_target
 #define __pyx_n_s_test __pyx_mstate_global->__pyx_n_s_test
 #define __pyx_n_s_tmp __pyx_mstate_global->__pyx_n_s_tmp
 #define __pyx_kp_s_unable_to_allocate_array_data __pyx_mstate_global->__pyx_kp_s_unable_to_allocate_array_data
@@ -4909,6 +5013,7 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
 #define __pyx_n_s_unpack __pyx_mstate_global->__pyx_n_s_unpack
 #define __pyx_n_s_update __pyx_mstate_global->__pyx_n_s_update
 #define __pyx_n_s_version_info __pyx_mstate_global->__pyx_n_s_version_info
+#define __pyx_n_s_z __pyx_mstate_global->__pyx_n_s_z
 #define __pyx_n_s_zeros __pyx_mstate_global->__pyx_n_s_zeros
 #define __pyx_int_0 __pyx_mstate_global->__pyx_int_0
 #define __pyx_int_1 __pyx_mstate_global->__pyx_int_1
@@ -4934,7 +5039,8 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
 #define __pyx_tuple__20 __pyx_mstate_global->__pyx_tuple__20
 #define __pyx_tuple__21 __pyx_mstate_global->__pyx_tuple__21
 #define __pyx_tuple__22 __pyx_mstate_global->__pyx_tuple__22
-#define __pyx_tuple__25 __pyx_mstate_global->__pyx_tuple__25
+#define __pyx_tuple__23 __pyx_mstate_global->__pyx_tuple__23
+#define __pyx_tuple__24 __pyx_mstate_global->__pyx_tuple__24
 #define __pyx_tuple__27 __pyx_mstate_global->__pyx_tuple__27
 #define __pyx_tuple__29 __pyx_mstate_global->__pyx_tuple__29
 #define __pyx_tuple__31 __pyx_mstate_global->__pyx_tuple__31
@@ -4942,10 +5048,14 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
 #define __pyx_tuple__35 __pyx_mstate_global->__pyx_tuple__35
 #define __pyx_tuple__37 __pyx_mstate_global->__pyx_tuple__37
 #define __pyx_tuple__39 __pyx_mstate_global->__pyx_tuple__39
-#define __pyx_tuple__41 __pyx_mstate_global->__pyx_tuple__41
-#define __pyx_tuple__43 __pyx_mstate_global->__pyx_tuple__43
-#define __pyx_codeobj__23 __pyx_mstate_global->__pyx_codeobj__23
-#define __pyx_codeobj__24 __pyx_mstate_global->__pyx_codeobj__24
+#define __pyx_tuple__42 __pyx_mstate_global->__pyx_tuple__42
+#define __pyx_tuple__44 __pyx_mstate_global->__pyx_tuple__44
+#define __pyx_tuple__46 __pyx_mstate_global->__pyx_tuple__46
+#define __pyx_tuple__48 __pyx_mstate_global->__pyx_tuple__48
+#define __pyx_tuple__50 __pyx_mstate_global->__pyx_tuple__50
+#define __pyx_tuple__52 __pyx_mstate_global->__pyx_tuple__52
+#define __pyx_tuple__54 __pyx_mstate_global->__pyx_tuple__54
+#define __pyx_codeobj__25 __pyx_mstate_global->__pyx_codeobj__25
 #define __pyx_codeobj__26 __pyx_mstate_global->__pyx_codeobj__26
 #define __pyx_codeobj__28 __pyx_mstate_global->__pyx_codeobj__28
 #define __pyx_codeobj__30 __pyx_mstate_global->__pyx_codeobj__30
@@ -4954,8 +5064,14 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
 #define __pyx_codeobj__36 __pyx_mstate_global->__pyx_codeobj__36
 #define __pyx_codeobj__38 __pyx_mstate_global->__pyx_codeobj__38
 #define __pyx_codeobj__40 __pyx_mstate_global->__pyx_codeobj__40
-#define __pyx_codeobj__42 __pyx_mstate_global->__pyx_codeobj__42
-#define __pyx_codeobj__44 __pyx_mstate_global->__pyx_codeobj__44
+#define __pyx_codeobj__41 __pyx_mstate_global->__pyx_codeobj__41
+#define __pyx_codeobj__43 __pyx_mstate_global->__pyx_codeobj__43
+#define __pyx_codeobj__45 __pyx_mstate_global->__pyx_codeobj__45
+#define __pyx_codeobj__47 __pyx_mstate_global->__pyx_codeobj__47
+#define __pyx_codeobj__49 __pyx_mstate_global->__pyx_codeobj__49
+#define __pyx_codeobj__51 __pyx_mstate_global->__pyx_codeobj__51
+#define __pyx_codeobj__53 __pyx_mstate_global->__pyx_codeobj__53
+#define __pyx_codeobj__55 __pyx_mstate_global->__pyx_codeobj__55
 /* #### Code section: module_code ### */
 
 /* "View.MemoryView":131
@@ -18586,7 +18702,7 @@ static PyObject *__pyx_unpickle_Enum__set_state(struct __pyx_MemviewEnum_obj *__
   return __pyx_r;
 }
 
-/* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":286
+/* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":244
  * 
  *         @property
  *         cdef inline npy_intp itemsize(self) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -18597,7 +18713,7 @@ static PyObject *__pyx_unpickle_Enum__set_state(struct __pyx_MemviewEnum_obj *__
 static CYTHON_INLINE npy_intp __pyx_f_5numpy_5dtype_8itemsize_itemsize(PyArray_Descr *__pyx_v_self) {
   npy_intp __pyx_r;
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":287
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":245
  *         @property
  *         cdef inline npy_intp itemsize(self) noexcept nogil:
  *             return PyDataType_ELSIZE(self)             # <<<<<<<<<<<<<<
@@ -18607,7 +18723,7 @@ static CYTHON_INLINE npy_intp __pyx_f_5numpy_5dtype_8itemsize_itemsize(PyArray_D
   __pyx_r = PyDataType_ELSIZE(__pyx_v_self);
   goto __pyx_L0;
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":286
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":244
  * 
  *         @property
  *         cdef inline npy_intp itemsize(self) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -18620,7 +18736,7 @@ static CYTHON_INLINE npy_intp __pyx_f_5numpy_5dtype_8itemsize_itemsize(PyArray_D
   return __pyx_r;
 }
 
-/* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":290
+/* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":248
  * 
  *         @property
  *         cdef inline npy_intp alignment(self) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -18631,7 +18747,7 @@ static CYTHON_INLINE npy_intp __pyx_f_5numpy_5dtype_8itemsize_itemsize(PyArray_D
 static CYTHON_INLINE npy_intp __pyx_f_5numpy_5dtype_9alignment_alignment(PyArray_Descr *__pyx_v_self) {
   npy_intp __pyx_r;
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":291
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":249
  *         @property
  *         cdef inline npy_intp alignment(self) noexcept nogil:
  *             return PyDataType_ALIGNMENT(self)             # <<<<<<<<<<<<<<
@@ -18641,7 +18757,7 @@ static CYTHON_INLINE npy_intp __pyx_f_5numpy_5dtype_9alignment_alignment(PyArray
   __pyx_r = PyDataType_ALIGNMENT(__pyx_v_self);
   goto __pyx_L0;
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":290
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":248
  * 
  *         @property
  *         cdef inline npy_intp alignment(self) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -18654,7 +18770,7 @@ static CYTHON_INLINE npy_intp __pyx_f_5numpy_5dtype_9alignment_alignment(PyArray
   return __pyx_r;
 }
 
-/* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":296
+/* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":254
  *         # for this using PyDataType_HASFIELDS.
  *         @property
  *         cdef inline object fields(self):             # <<<<<<<<<<<<<<
@@ -18668,7 +18784,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_5dtype_6fields_fields(PyArray_Desc
   PyObject *__pyx_t_1;
   __Pyx_RefNannySetupContext("fields", 1);
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":297
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":255
  *         @property
  *         cdef inline object fields(self):
  *             return <object>PyDataType_FIELDS(self)             # <<<<<<<<<<<<<<
@@ -18681,7 +18797,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_5dtype_6fields_fields(PyArray_Desc
   __pyx_r = ((PyObject *)__pyx_t_1);
   goto __pyx_L0;
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":296
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":254
  *         # for this using PyDataType_HASFIELDS.
  *         @property
  *         cdef inline object fields(self):             # <<<<<<<<<<<<<<
@@ -18696,7 +18812,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_5dtype_6fields_fields(PyArray_Desc
   return __pyx_r;
 }
 
-/* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":300
+/* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":258
  * 
  *         @property
  *         cdef inline tuple names(self):             # <<<<<<<<<<<<<<
@@ -18710,7 +18826,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_5dtype_5names_names(PyArray_Descr
   PyObject *__pyx_t_1;
   __Pyx_RefNannySetupContext("names", 1);
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":301
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":259
  *         @property
  *         cdef inline tuple names(self):
  *             return <tuple>PyDataType_NAMES(self)             # <<<<<<<<<<<<<<
@@ -18723,7 +18839,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_5dtype_5names_names(PyArray_Descr
   __pyx_r = ((PyObject*)__pyx_t_1);
   goto __pyx_L0;
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":300
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":258
  * 
  *         @property
  *         cdef inline tuple names(self):             # <<<<<<<<<<<<<<
@@ -18738,7 +18854,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_5dtype_5names_names(PyArray_Descr
   return __pyx_r;
 }
 
-/* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":307
+/* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":265
  *         # this field via the inline helper method PyDataType_SHAPE.
  *         @property
  *         cdef inline PyArray_ArrayDescr* subarray(self) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -18749,7 +18865,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_5dtype_5names_names(PyArray_Descr
 static CYTHON_INLINE PyArray_ArrayDescr *__pyx_f_5numpy_5dtype_8subarray_subarray(PyArray_Descr *__pyx_v_self) {
   PyArray_ArrayDescr *__pyx_r;
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":308
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":266
  *         @property
  *         cdef inline PyArray_ArrayDescr* subarray(self) noexcept nogil:
  *             return PyDataType_SUBARRAY(self)             # <<<<<<<<<<<<<<
@@ -18759,7 +18875,7 @@ static CYTHON_INLINE PyArray_ArrayDescr *__pyx_f_5numpy_5dtype_8subarray_subarra
   __pyx_r = PyDataType_SUBARRAY(__pyx_v_self);
   goto __pyx_L0;
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":307
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":265
  *         # this field via the inline helper method PyDataType_SHAPE.
  *         @property
  *         cdef inline PyArray_ArrayDescr* subarray(self) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -18772,7 +18888,7 @@ static CYTHON_INLINE PyArray_ArrayDescr *__pyx_f_5numpy_5dtype_8subarray_subarra
   return __pyx_r;
 }
 
-/* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":311
+/* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":269
  * 
  *         @property
  *         cdef inline npy_uint64 flags(self) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -18783,7 +18899,7 @@ static CYTHON_INLINE PyArray_ArrayDescr *__pyx_f_5numpy_5dtype_8subarray_subarra
 static CYTHON_INLINE npy_uint64 __pyx_f_5numpy_5dtype_5flags_flags(PyArray_Descr *__pyx_v_self) {
   npy_uint64 __pyx_r;
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":313
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":271
  *         cdef inline npy_uint64 flags(self) noexcept nogil:
  *             """The data types flags."""
  *             return PyDataType_FLAGS(self)             # <<<<<<<<<<<<<<
@@ -18793,7 +18909,7 @@ static CYTHON_INLINE npy_uint64 __pyx_f_5numpy_5dtype_5flags_flags(PyArray_Descr
   __pyx_r = PyDataType_FLAGS(__pyx_v_self);
   goto __pyx_L0;
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":311
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":269
  * 
  *         @property
  *         cdef inline npy_uint64 flags(self) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -18806,7 +18922,7 @@ static CYTHON_INLINE npy_uint64 __pyx_f_5numpy_5dtype_5flags_flags(PyArray_Descr
   return __pyx_r;
 }
 
-/* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":323
+/* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":281
  * 
  *         @property
  *         cdef inline int numiter(self) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -18817,7 +18933,7 @@ static CYTHON_INLINE npy_uint64 __pyx_f_5numpy_5dtype_5flags_flags(PyArray_Descr
 static CYTHON_INLINE int __pyx_f_5numpy_9broadcast_7numiter_numiter(PyArrayMultiIterObject *__pyx_v_self) {
   int __pyx_r;
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":325
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":283
  *         cdef inline int numiter(self) noexcept nogil:
  *             """The number of arrays that need to be broadcast to the same shape."""
  *             return PyArray_MultiIter_NUMITER(self)             # <<<<<<<<<<<<<<
@@ -18827,7 +18943,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_9broadcast_7numiter_numiter(PyArrayMulti
   __pyx_r = PyArray_MultiIter_NUMITER(__pyx_v_self);
   goto __pyx_L0;
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":323
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":281
  * 
  *         @property
  *         cdef inline int numiter(self) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -18840,7 +18956,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_9broadcast_7numiter_numiter(PyArrayMulti
   return __pyx_r;
 }
 
-/* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":328
+/* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":286
  * 
  *         @property
  *         cdef inline npy_intp size(self) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -18851,7 +18967,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_9broadcast_7numiter_numiter(PyArrayMulti
 static CYTHON_INLINE npy_intp __pyx_f_5numpy_9broadcast_4size_size(PyArrayMultiIterObject *__pyx_v_self) {
   npy_intp __pyx_r;
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":330
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":288
  *         cdef inline npy_intp size(self) noexcept nogil:
  *             """The total broadcasted size."""
  *             return PyArray_MultiIter_SIZE(self)             # <<<<<<<<<<<<<<
@@ -18861,7 +18977,7 @@ static CYTHON_INLINE npy_intp __pyx_f_5numpy_9broadcast_4size_size(PyArrayMultiI
   __pyx_r = PyArray_MultiIter_SIZE(__pyx_v_self);
   goto __pyx_L0;
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":328
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":286
  * 
  *         @property
  *         cdef inline npy_intp size(self) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -18874,7 +18990,7 @@ static CYTHON_INLINE npy_intp __pyx_f_5numpy_9broadcast_4size_size(PyArrayMultiI
   return __pyx_r;
 }
 
-/* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":333
+/* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":291
  * 
  *         @property
  *         cdef inline npy_intp index(self) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -18885,7 +19001,7 @@ static CYTHON_INLINE npy_intp __pyx_f_5numpy_9broadcast_4size_size(PyArrayMultiI
 static CYTHON_INLINE npy_intp __pyx_f_5numpy_9broadcast_5index_index(PyArrayMultiIterObject *__pyx_v_self) {
   npy_intp __pyx_r;
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":335
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":293
  *         cdef inline npy_intp index(self) noexcept nogil:
  *             """The current (1-d) index into the broadcasted result."""
  *             return PyArray_MultiIter_INDEX(self)             # <<<<<<<<<<<<<<
@@ -18895,7 +19011,7 @@ static CYTHON_INLINE npy_intp __pyx_f_5numpy_9broadcast_5index_index(PyArrayMult
   __pyx_r = PyArray_MultiIter_INDEX(__pyx_v_self);
   goto __pyx_L0;
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":333
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":291
  * 
  *         @property
  *         cdef inline npy_intp index(self) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -18908,7 +19024,7 @@ static CYTHON_INLINE npy_intp __pyx_f_5numpy_9broadcast_5index_index(PyArrayMult
   return __pyx_r;
 }
 
-/* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":338
+/* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":296
  * 
  *         @property
  *         cdef inline int nd(self) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -18919,7 +19035,7 @@ static CYTHON_INLINE npy_intp __pyx_f_5numpy_9broadcast_5index_index(PyArrayMult
 static CYTHON_INLINE int __pyx_f_5numpy_9broadcast_2nd_nd(PyArrayMultiIterObject *__pyx_v_self) {
   int __pyx_r;
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":340
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":298
  *         cdef inline int nd(self) noexcept nogil:
  *             """The number of dimensions in the broadcasted result."""
  *             return PyArray_MultiIter_NDIM(self)             # <<<<<<<<<<<<<<
@@ -18929,7 +19045,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_9broadcast_2nd_nd(PyArrayMultiIterObject
   __pyx_r = PyArray_MultiIter_NDIM(__pyx_v_self);
   goto __pyx_L0;
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":338
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":296
  * 
  *         @property
  *         cdef inline int nd(self) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -18942,7 +19058,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_9broadcast_2nd_nd(PyArrayMultiIterObject
   return __pyx_r;
 }
 
-/* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":343
+/* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":301
  * 
  *         @property
  *         cdef inline npy_intp* dimensions(self) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -18953,7 +19069,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_9broadcast_2nd_nd(PyArrayMultiIterObject
 static CYTHON_INLINE npy_intp *__pyx_f_5numpy_9broadcast_10dimensions_dimensions(PyArrayMultiIterObject *__pyx_v_self) {
   npy_intp *__pyx_r;
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":345
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":303
  *         cdef inline npy_intp* dimensions(self) noexcept nogil:
  *             """The shape of the broadcasted result."""
  *             return PyArray_MultiIter_DIMS(self)             # <<<<<<<<<<<<<<
@@ -18963,7 +19079,7 @@ static CYTHON_INLINE npy_intp *__pyx_f_5numpy_9broadcast_10dimensions_dimensions
   __pyx_r = PyArray_MultiIter_DIMS(__pyx_v_self);
   goto __pyx_L0;
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":343
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":301
  * 
  *         @property
  *         cdef inline npy_intp* dimensions(self) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -18976,7 +19092,7 @@ static CYTHON_INLINE npy_intp *__pyx_f_5numpy_9broadcast_10dimensions_dimensions
   return __pyx_r;
 }
 
-/* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":348
+/* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":306
  * 
  *         @property
  *         cdef inline void** iters(self) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -18987,7 +19103,7 @@ static CYTHON_INLINE npy_intp *__pyx_f_5numpy_9broadcast_10dimensions_dimensions
 static CYTHON_INLINE void **__pyx_f_5numpy_9broadcast_5iters_iters(PyArrayMultiIterObject *__pyx_v_self) {
   void **__pyx_r;
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":351
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":309
  *             """An array of iterator objects that holds the iterators for the arrays to be broadcast together.
  *             On return, the iterators are adjusted for broadcasting."""
  *             return PyArray_MultiIter_ITERS(self)             # <<<<<<<<<<<<<<
@@ -18997,7 +19113,7 @@ static CYTHON_INLINE void **__pyx_f_5numpy_9broadcast_5iters_iters(PyArrayMultiI
   __pyx_r = PyArray_MultiIter_ITERS(__pyx_v_self);
   goto __pyx_L0;
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":348
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":306
  * 
  *         @property
  *         cdef inline void** iters(self) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -19010,7 +19126,7 @@ static CYTHON_INLINE void **__pyx_f_5numpy_9broadcast_5iters_iters(PyArrayMultiI
   return __pyx_r;
 }
 
-/* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":366
+/* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":324
  * 
  *         @property
  *         cdef inline PyObject* base(self) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -19021,7 +19137,7 @@ static CYTHON_INLINE void **__pyx_f_5numpy_9broadcast_5iters_iters(PyArrayMultiI
 static CYTHON_INLINE PyObject *__pyx_f_5numpy_7ndarray_4base_base(PyArrayObject *__pyx_v_self) {
   PyObject *__pyx_r;
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":369
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":327
  *             """Returns a borrowed reference to the object owning the data/memory.
  *             """
  *             return PyArray_BASE(self)             # <<<<<<<<<<<<<<
@@ -19031,7 +19147,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_7ndarray_4base_base(PyArrayObject
   __pyx_r = PyArray_BASE(__pyx_v_self);
   goto __pyx_L0;
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":366
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":324
  * 
  *         @property
  *         cdef inline PyObject* base(self) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -19044,7 +19160,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_7ndarray_4base_base(PyArrayObject
   return __pyx_r;
 }
 
-/* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":372
+/* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":330
  * 
  *         @property
  *         cdef inline dtype descr(self):             # <<<<<<<<<<<<<<
@@ -19058,7 +19174,7 @@ static CYTHON_INLINE PyArray_Descr *__pyx_f_5numpy_7ndarray_5descr_descr(PyArray
   PyArray_Descr *__pyx_t_1;
   __Pyx_RefNannySetupContext("descr", 1);
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":375
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":333
  *             """Returns an owned reference to the dtype of the array.
  *             """
  *             return <dtype>PyArray_DESCR(self)             # <<<<<<<<<<<<<<
@@ -19071,7 +19187,7 @@ static CYTHON_INLINE PyArray_Descr *__pyx_f_5numpy_7ndarray_5descr_descr(PyArray
   __pyx_r = ((PyArray_Descr *)__pyx_t_1);
   goto __pyx_L0;
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":372
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":330
  * 
  *         @property
  *         cdef inline dtype descr(self):             # <<<<<<<<<<<<<<
@@ -19086,7 +19202,7 @@ static CYTHON_INLINE PyArray_Descr *__pyx_f_5numpy_7ndarray_5descr_descr(PyArray
   return __pyx_r;
 }
 
-/* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":378
+/* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":336
  * 
  *         @property
  *         cdef inline int ndim(self) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -19097,7 +19213,7 @@ static CYTHON_INLINE PyArray_Descr *__pyx_f_5numpy_7ndarray_5descr_descr(PyArray
 static CYTHON_INLINE int __pyx_f_5numpy_7ndarray_4ndim_ndim(PyArrayObject *__pyx_v_self) {
   int __pyx_r;
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":381
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":339
  *             """Returns the number of dimensions in the array.
  *             """
  *             return PyArray_NDIM(self)             # <<<<<<<<<<<<<<
@@ -19107,7 +19223,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_7ndarray_4ndim_ndim(PyArrayObject *__pyx
   __pyx_r = PyArray_NDIM(__pyx_v_self);
   goto __pyx_L0;
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":378
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":336
  * 
  *         @property
  *         cdef inline int ndim(self) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -19120,7 +19236,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_7ndarray_4ndim_ndim(PyArrayObject *__pyx
   return __pyx_r;
 }
 
-/* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":384
+/* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":342
  * 
  *         @property
  *         cdef inline npy_intp *shape(self) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -19131,7 +19247,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_7ndarray_4ndim_ndim(PyArrayObject *__pyx
 static CYTHON_INLINE npy_intp *__pyx_f_5numpy_7ndarray_5shape_shape(PyArrayObject *__pyx_v_self) {
   npy_intp *__pyx_r;
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":389
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":347
  *             Can return NULL for 0-dimensional arrays.
  *             """
  *             return PyArray_DIMS(self)             # <<<<<<<<<<<<<<
@@ -19141,7 +19257,7 @@ static CYTHON_INLINE npy_intp *__pyx_f_5numpy_7ndarray_5shape_shape(PyArrayObjec
   __pyx_r = PyArray_DIMS(__pyx_v_self);
   goto __pyx_L0;
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":384
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":342
  * 
  *         @property
  *         cdef inline npy_intp *shape(self) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -19154,7 +19270,7 @@ static CYTHON_INLINE npy_intp *__pyx_f_5numpy_7ndarray_5shape_shape(PyArrayObjec
   return __pyx_r;
 }
 
-/* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":392
+/* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":350
  * 
  *         @property
  *         cdef inline npy_intp *strides(self) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -19165,7 +19281,7 @@ static CYTHON_INLINE npy_intp *__pyx_f_5numpy_7ndarray_5shape_shape(PyArrayObjec
 static CYTHON_INLINE npy_intp *__pyx_f_5numpy_7ndarray_7strides_strides(PyArrayObject *__pyx_v_self) {
   npy_intp *__pyx_r;
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":396
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":354
  *             The number of elements matches the number of dimensions of the array (ndim).
  *             """
  *             return PyArray_STRIDES(self)             # <<<<<<<<<<<<<<
@@ -19175,7 +19291,7 @@ static CYTHON_INLINE npy_intp *__pyx_f_5numpy_7ndarray_7strides_strides(PyArrayO
   __pyx_r = PyArray_STRIDES(__pyx_v_self);
   goto __pyx_L0;
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":392
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":350
  * 
  *         @property
  *         cdef inline npy_intp *strides(self) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -19188,7 +19304,7 @@ static CYTHON_INLINE npy_intp *__pyx_f_5numpy_7ndarray_7strides_strides(PyArrayO
   return __pyx_r;
 }
 
-/* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":399
+/* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":357
  * 
  *         @property
  *         cdef inline npy_intp size(self) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -19199,7 +19315,7 @@ static CYTHON_INLINE npy_intp *__pyx_f_5numpy_7ndarray_7strides_strides(PyArrayO
 static CYTHON_INLINE npy_intp __pyx_f_5numpy_7ndarray_4size_size(PyArrayObject *__pyx_v_self) {
   npy_intp __pyx_r;
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":402
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":360
  *             """Returns the total size (in number of elements) of the array.
  *             """
  *             return PyArray_SIZE(self)             # <<<<<<<<<<<<<<
@@ -19209,7 +19325,7 @@ static CYTHON_INLINE npy_intp __pyx_f_5numpy_7ndarray_4size_size(PyArrayObject *
   __pyx_r = PyArray_SIZE(__pyx_v_self);
   goto __pyx_L0;
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":399
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":357
  * 
  *         @property
  *         cdef inline npy_intp size(self) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -19222,7 +19338,7 @@ static CYTHON_INLINE npy_intp __pyx_f_5numpy_7ndarray_4size_size(PyArrayObject *
   return __pyx_r;
 }
 
-/* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":405
+/* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":363
  * 
  *         @property
  *         cdef inline char* data(self) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -19233,7 +19349,7 @@ static CYTHON_INLINE npy_intp __pyx_f_5numpy_7ndarray_4size_size(PyArrayObject *
 static CYTHON_INLINE char *__pyx_f_5numpy_7ndarray_4data_data(PyArrayObject *__pyx_v_self) {
   char *__pyx_r;
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":411
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":369
  *             of `PyArray_DATA()` instead, which returns a 'void*'.
  *             """
  *             return PyArray_BYTES(self)             # <<<<<<<<<<<<<<
@@ -19243,7 +19359,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy_7ndarray_4data_data(PyArrayObject *__p
   __pyx_r = PyArray_BYTES(__pyx_v_self);
   goto __pyx_L0;
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":405
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":363
  * 
  *         @property
  *         cdef inline char* data(self) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -19256,7 +19372,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy_7ndarray_4data_data(PyArrayObject *__p
   return __pyx_r;
 }
 
-/* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":807
+/* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":777
  * ctypedef long double complex clongdouble_t
  * 
  * cdef inline object PyArray_MultiIterNew1(a):             # <<<<<<<<<<<<<<
@@ -19273,7 +19389,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew1(PyObject *__
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("PyArray_MultiIterNew1", 1);
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":808
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":778
  * 
  * cdef inline object PyArray_MultiIterNew1(a):
  *     return PyArray_MultiIterNew(1, <void*>a)             # <<<<<<<<<<<<<<
@@ -19281,13 +19397,13 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew1(PyObject *__
  * cdef inline object PyArray_MultiIterNew2(a, b):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyArray_MultiIterNew(1, ((void *)__pyx_v_a)); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 808, __pyx_L1_error)
+  __pyx_t_1 = PyArray_MultiIterNew(1, ((void *)__pyx_v_a)); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 778, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":807
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":777
  * ctypedef long double complex clongdouble_t
  * 
  * cdef inline object PyArray_MultiIterNew1(a):             # <<<<<<<<<<<<<<
@@ -19306,7 +19422,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew1(PyObject *__
   return __pyx_r;
 }
 
-/* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":810
+/* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":780
  *     return PyArray_MultiIterNew(1, <void*>a)
  * 
  * cdef inline object PyArray_MultiIterNew2(a, b):             # <<<<<<<<<<<<<<
@@ -19323,7 +19439,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew2(PyObject *__
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("PyArray_MultiIterNew2", 1);
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":811
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":781
  * 
  * cdef inline object PyArray_MultiIterNew2(a, b):
  *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)             # <<<<<<<<<<<<<<
@@ -19331,13 +19447,13 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew2(PyObject *__
  * cdef inline object PyArray_MultiIterNew3(a, b, c):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyArray_MultiIterNew(2, ((void *)__pyx_v_a), ((void *)__pyx_v_b)); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 811, __pyx_L1_error)
+  __pyx_t_1 = PyArray_MultiIterNew(2, ((void *)__pyx_v_a), ((void *)__pyx_v_b)); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 781, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":810
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":780
  *     return PyArray_MultiIterNew(1, <void*>a)
  * 
  * cdef inline object PyArray_MultiIterNew2(a, b):             # <<<<<<<<<<<<<<
@@ -19356,7 +19472,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew2(PyObject *__
   return __pyx_r;
 }
 
-/* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":813
+/* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":783
  *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)
  * 
  * cdef inline object PyArray_MultiIterNew3(a, b, c):             # <<<<<<<<<<<<<<
@@ -19373,7 +19489,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew3(PyObject *__
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("PyArray_MultiIterNew3", 1);
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":814
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":784
  * 
  * cdef inline object PyArray_MultiIterNew3(a, b, c):
  *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)             # <<<<<<<<<<<<<<
@@ -19381,13 +19497,13 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew3(PyObject *__
  * cdef inline object PyArray_MultiIterNew4(a, b, c, d):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyArray_MultiIterNew(3, ((void *)__pyx_v_a), ((void *)__pyx_v_b), ((void *)__pyx_v_c)); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 814, __pyx_L1_error)
+  __pyx_t_1 = PyArray_MultiIterNew(3, ((void *)__pyx_v_a), ((void *)__pyx_v_b), ((void *)__pyx_v_c)); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 784, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":813
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":783
  *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)
  * 
  * cdef inline object PyArray_MultiIterNew3(a, b, c):             # <<<<<<<<<<<<<<
@@ -19406,7 +19522,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew3(PyObject *__
   return __pyx_r;
 }
 
-/* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":816
+/* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":786
  *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)
  * 
  * cdef inline object PyArray_MultiIterNew4(a, b, c, d):             # <<<<<<<<<<<<<<
@@ -19423,7 +19539,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew4(PyObject *__
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("PyArray_MultiIterNew4", 1);
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":817
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":787
  * 
  * cdef inline object PyArray_MultiIterNew4(a, b, c, d):
  *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)             # <<<<<<<<<<<<<<
@@ -19431,13 +19547,13 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew4(PyObject *__
  * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyArray_MultiIterNew(4, ((void *)__pyx_v_a), ((void *)__pyx_v_b), ((void *)__pyx_v_c), ((void *)__pyx_v_d)); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 817, __pyx_L1_error)
+  __pyx_t_1 = PyArray_MultiIterNew(4, ((void *)__pyx_v_a), ((void *)__pyx_v_b), ((void *)__pyx_v_c), ((void *)__pyx_v_d)); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 787, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":816
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":786
  *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)
  * 
  * cdef inline object PyArray_MultiIterNew4(a, b, c, d):             # <<<<<<<<<<<<<<
@@ -19456,7 +19572,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew4(PyObject *__
   return __pyx_r;
 }
 
-/* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":819
+/* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":789
  *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)
  * 
  * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):             # <<<<<<<<<<<<<<
@@ -19473,7 +19589,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew5(PyObject *__
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("PyArray_MultiIterNew5", 1);
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":820
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":790
  * 
  * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):
  *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)             # <<<<<<<<<<<<<<
@@ -19481,13 +19597,13 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew5(PyObject *__
  * cdef inline tuple PyDataType_SHAPE(dtype d):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyArray_MultiIterNew(5, ((void *)__pyx_v_a), ((void *)__pyx_v_b), ((void *)__pyx_v_c), ((void *)__pyx_v_d), ((void *)__pyx_v_e)); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 820, __pyx_L1_error)
+  __pyx_t_1 = PyArray_MultiIterNew(5, ((void *)__pyx_v_a), ((void *)__pyx_v_b), ((void *)__pyx_v_c), ((void *)__pyx_v_d), ((void *)__pyx_v_e)); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 790, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":819
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":789
  *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)
  * 
  * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):             # <<<<<<<<<<<<<<
@@ -19506,7 +19622,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew5(PyObject *__
   return __pyx_r;
 }
 
-/* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":822
+/* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":792
  *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)
  * 
  * cdef inline tuple PyDataType_SHAPE(dtype d):             # <<<<<<<<<<<<<<
@@ -19521,7 +19637,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyDataType_SHAPE(PyArray_Descr *__
   PyObject *__pyx_t_2;
   __Pyx_RefNannySetupContext("PyDataType_SHAPE", 1);
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":823
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":793
  * 
  * cdef inline tuple PyDataType_SHAPE(dtype d):
  *     if PyDataType_HASSUBARRAY(d):             # <<<<<<<<<<<<<<
@@ -19531,7 +19647,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyDataType_SHAPE(PyArray_Descr *__
   __pyx_t_1 = PyDataType_HASSUBARRAY(__pyx_v_d);
   if (__pyx_t_1) {
 
-    /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":824
+    /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":794
  * cdef inline tuple PyDataType_SHAPE(dtype d):
  *     if PyDataType_HASSUBARRAY(d):
  *         return <tuple>d.subarray.shape             # <<<<<<<<<<<<<<
@@ -19544,7 +19660,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyDataType_SHAPE(PyArray_Descr *__
     __pyx_r = ((PyObject*)__pyx_t_2);
     goto __pyx_L0;
 
-    /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":823
+    /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":793
  * 
  * cdef inline tuple PyDataType_SHAPE(dtype d):
  *     if PyDataType_HASSUBARRAY(d):             # <<<<<<<<<<<<<<
@@ -19553,7 +19669,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyDataType_SHAPE(PyArray_Descr *__
  */
   }
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":826
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":796
  *         return <tuple>d.subarray.shape
  *     else:
  *         return ()             # <<<<<<<<<<<<<<
@@ -19567,7 +19683,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyDataType_SHAPE(PyArray_Descr *__
     goto __pyx_L0;
   }
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":822
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":792
  *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)
  * 
  * cdef inline tuple PyDataType_SHAPE(dtype d):             # <<<<<<<<<<<<<<
@@ -19582,7 +19698,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyDataType_SHAPE(PyArray_Descr *__
   return __pyx_r;
 }
 
-/* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1010
+/* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":995
  *     int _import_umath() except -1
  * 
  * cdef inline void set_array_base(ndarray arr, object base) except *:             # <<<<<<<<<<<<<<
@@ -19596,7 +19712,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1011
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":996
  * 
  * cdef inline void set_array_base(ndarray arr, object base) except *:
  *     Py_INCREF(base) # important to do this before stealing the reference below!             # <<<<<<<<<<<<<<
@@ -19605,16 +19721,16 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
  */
   Py_INCREF(__pyx_v_base);
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1012
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":997
  * cdef inline void set_array_base(ndarray arr, object base) except *:
  *     Py_INCREF(base) # important to do this before stealing the reference below!
  *     PyArray_SetBaseObject(arr, base)             # <<<<<<<<<<<<<<
  * 
  * cdef inline object get_array_base(ndarray arr):
  */
-  __pyx_t_1 = PyArray_SetBaseObject(__pyx_v_arr, __pyx_v_base); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(2, 1012, __pyx_L1_error)
+  __pyx_t_1 = PyArray_SetBaseObject(__pyx_v_arr, __pyx_v_base); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(2, 997, __pyx_L1_error)
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1010
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":995
  *     int _import_umath() except -1
  * 
  * cdef inline void set_array_base(ndarray arr, object base) except *:             # <<<<<<<<<<<<<<
@@ -19629,7 +19745,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
   __pyx_L0:;
 }
 
-/* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1014
+/* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":999
  *     PyArray_SetBaseObject(arr, base)
  * 
  * cdef inline object get_array_base(ndarray arr):             # <<<<<<<<<<<<<<
@@ -19644,7 +19760,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
   int __pyx_t_1;
   __Pyx_RefNannySetupContext("get_array_base", 1);
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1015
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1000
  * 
  * cdef inline object get_array_base(ndarray arr):
  *     base = PyArray_BASE(arr)             # <<<<<<<<<<<<<<
@@ -19653,7 +19769,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
  */
   __pyx_v_base = PyArray_BASE(__pyx_v_arr);
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1016
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1001
  * cdef inline object get_array_base(ndarray arr):
  *     base = PyArray_BASE(arr)
  *     if base is NULL:             # <<<<<<<<<<<<<<
@@ -19663,7 +19779,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
   __pyx_t_1 = (__pyx_v_base == NULL);
   if (__pyx_t_1) {
 
-    /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1017
+    /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1002
  *     base = PyArray_BASE(arr)
  *     if base is NULL:
  *         return None             # <<<<<<<<<<<<<<
@@ -19674,7 +19790,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
     __pyx_r = Py_None; __Pyx_INCREF(Py_None);
     goto __pyx_L0;
 
-    /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1016
+    /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1001
  * cdef inline object get_array_base(ndarray arr):
  *     base = PyArray_BASE(arr)
  *     if base is NULL:             # <<<<<<<<<<<<<<
@@ -19683,7 +19799,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
  */
   }
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1018
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1003
  *     if base is NULL:
  *         return None
  *     return <object>base             # <<<<<<<<<<<<<<
@@ -19695,7 +19811,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
   __pyx_r = ((PyObject *)__pyx_v_base);
   goto __pyx_L0;
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1014
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":999
  *     PyArray_SetBaseObject(arr, base)
  * 
  * cdef inline object get_array_base(ndarray arr):             # <<<<<<<<<<<<<<
@@ -19710,7 +19826,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
   return __pyx_r;
 }
 
-/* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1022
+/* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1007
  * # Versions of the import_* functions which are more suitable for
  * # Cython code.
  * cdef inline int import_array() except -1:             # <<<<<<<<<<<<<<
@@ -19734,7 +19850,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_array(void) {
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("import_array", 1);
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1023
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1008
  * # Cython code.
  * cdef inline int import_array() except -1:
  *     try:             # <<<<<<<<<<<<<<
@@ -19750,16 +19866,16 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_array(void) {
     __Pyx_XGOTREF(__pyx_t_3);
     /*try:*/ {
 
-      /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1024
+      /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1009
  * cdef inline int import_array() except -1:
  *     try:
  *         __pyx_import_array()             # <<<<<<<<<<<<<<
  *     except Exception:
  *         raise ImportError("numpy._core.multiarray failed to import")
  */
-      __pyx_t_4 = _import_array(); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(2, 1024, __pyx_L3_error)
+      __pyx_t_4 = _import_array(); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(2, 1009, __pyx_L3_error)
 
-      /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1023
+      /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1008
  * # Cython code.
  * cdef inline int import_array() except -1:
  *     try:             # <<<<<<<<<<<<<<
@@ -19773,7 +19889,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_array(void) {
     goto __pyx_L8_try_end;
     __pyx_L3_error:;
 
-    /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1025
+    /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1010
  *     try:
  *         __pyx_import_array()
  *     except Exception:             # <<<<<<<<<<<<<<
@@ -19783,27 +19899,27 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_array(void) {
     __pyx_t_4 = __Pyx_PyErr_ExceptionMatches(((PyObject *)(&((PyTypeObject*)PyExc_Exception)[0])));
     if (__pyx_t_4) {
       __Pyx_AddTraceback("numpy.import_array", __pyx_clineno, __pyx_lineno, __pyx_filename);
-      if (__Pyx_GetException(&__pyx_t_5, &__pyx_t_6, &__pyx_t_7) < 0) __PYX_ERR(2, 1025, __pyx_L5_except_error)
+      if (__Pyx_GetException(&__pyx_t_5, &__pyx_t_6, &__pyx_t_7) < 0) __PYX_ERR(2, 1010, __pyx_L5_except_error)
       __Pyx_XGOTREF(__pyx_t_5);
       __Pyx_XGOTREF(__pyx_t_6);
       __Pyx_XGOTREF(__pyx_t_7);
 
-      /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1026
+      /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1011
  *         __pyx_import_array()
  *     except Exception:
  *         raise ImportError("numpy._core.multiarray failed to import")             # <<<<<<<<<<<<<<
  * 
  * cdef inline int import_umath() except -1:
  */
-      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__9, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(2, 1026, __pyx_L5_except_error)
+      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__9, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(2, 1011, __pyx_L5_except_error)
       __Pyx_GOTREF(__pyx_t_8);
       __Pyx_Raise(__pyx_t_8, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-      __PYX_ERR(2, 1026, __pyx_L5_except_error)
+      __PYX_ERR(2, 1011, __pyx_L5_except_error)
     }
     goto __pyx_L5_except_error;
 
-    /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1023
+    /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1008
  * # Cython code.
  * cdef inline int import_array() except -1:
  *     try:             # <<<<<<<<<<<<<<
@@ -19819,7 +19935,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_array(void) {
     __pyx_L8_try_end:;
   }
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1022
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1007
  * # Versions of the import_* functions which are more suitable for
  * # Cython code.
  * cdef inline int import_array() except -1:             # <<<<<<<<<<<<<<
@@ -19842,7 +19958,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_array(void) {
   return __pyx_r;
 }
 
-/* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1028
+/* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1013
  *         raise ImportError("numpy._core.multiarray failed to import")
  * 
  * cdef inline int import_umath() except -1:             # <<<<<<<<<<<<<<
@@ -19866,7 +19982,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_umath(void) {
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("import_umath", 1);
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1029
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1014
  * 
  * cdef inline int import_umath() except -1:
  *     try:             # <<<<<<<<<<<<<<
@@ -19882,16 +19998,16 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_umath(void) {
     __Pyx_XGOTREF(__pyx_t_3);
     /*try:*/ {
 
-      /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1030
+      /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1015
  * cdef inline int import_umath() except -1:
  *     try:
  *         _import_umath()             # <<<<<<<<<<<<<<
  *     except Exception:
  *         raise ImportError("numpy._core.umath failed to import")
  */
-      __pyx_t_4 = _import_umath(); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(2, 1030, __pyx_L3_error)
+      __pyx_t_4 = _import_umath(); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(2, 1015, __pyx_L3_error)
 
-      /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1029
+      /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1014
  * 
  * cdef inline int import_umath() except -1:
  *     try:             # <<<<<<<<<<<<<<
@@ -19905,7 +20021,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_umath(void) {
     goto __pyx_L8_try_end;
     __pyx_L3_error:;
 
-    /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1031
+    /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1016
  *     try:
  *         _import_umath()
  *     except Exception:             # <<<<<<<<<<<<<<
@@ -19915,27 +20031,27 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_umath(void) {
     __pyx_t_4 = __Pyx_PyErr_ExceptionMatches(((PyObject *)(&((PyTypeObject*)PyExc_Exception)[0])));
     if (__pyx_t_4) {
       __Pyx_AddTraceback("numpy.import_umath", __pyx_clineno, __pyx_lineno, __pyx_filename);
-      if (__Pyx_GetException(&__pyx_t_5, &__pyx_t_6, &__pyx_t_7) < 0) __PYX_ERR(2, 1031, __pyx_L5_except_error)
+      if (__Pyx_GetException(&__pyx_t_5, &__pyx_t_6, &__pyx_t_7) < 0) __PYX_ERR(2, 1016, __pyx_L5_except_error)
       __Pyx_XGOTREF(__pyx_t_5);
       __Pyx_XGOTREF(__pyx_t_6);
       __Pyx_XGOTREF(__pyx_t_7);
 
-      /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1032
+      /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1017
  *         _import_umath()
  *     except Exception:
  *         raise ImportError("numpy._core.umath failed to import")             # <<<<<<<<<<<<<<
  * 
  * cdef inline int import_ufunc() except -1:
  */
-      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__10, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(2, 1032, __pyx_L5_except_error)
+      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__10, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(2, 1017, __pyx_L5_except_error)
       __Pyx_GOTREF(__pyx_t_8);
       __Pyx_Raise(__pyx_t_8, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-      __PYX_ERR(2, 1032, __pyx_L5_except_error)
+      __PYX_ERR(2, 1017, __pyx_L5_except_error)
     }
     goto __pyx_L5_except_error;
 
-    /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1029
+    /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1014
  * 
  * cdef inline int import_umath() except -1:
  *     try:             # <<<<<<<<<<<<<<
@@ -19951,7 +20067,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_umath(void) {
     __pyx_L8_try_end:;
   }
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1028
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1013
  *         raise ImportError("numpy._core.multiarray failed to import")
  * 
  * cdef inline int import_umath() except -1:             # <<<<<<<<<<<<<<
@@ -19974,7 +20090,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_umath(void) {
   return __pyx_r;
 }
 
-/* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1034
+/* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1019
  *         raise ImportError("numpy._core.umath failed to import")
  * 
  * cdef inline int import_ufunc() except -1:             # <<<<<<<<<<<<<<
@@ -19998,7 +20114,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_ufunc(void) {
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("import_ufunc", 1);
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1035
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1020
  * 
  * cdef inline int import_ufunc() except -1:
  *     try:             # <<<<<<<<<<<<<<
@@ -20014,16 +20130,16 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_ufunc(void) {
     __Pyx_XGOTREF(__pyx_t_3);
     /*try:*/ {
 
-      /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1036
+      /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1021
  * cdef inline int import_ufunc() except -1:
  *     try:
  *         _import_umath()             # <<<<<<<<<<<<<<
  *     except Exception:
  *         raise ImportError("numpy._core.umath failed to import")
  */
-      __pyx_t_4 = _import_umath(); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(2, 1036, __pyx_L3_error)
+      __pyx_t_4 = _import_umath(); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(2, 1021, __pyx_L3_error)
 
-      /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1035
+      /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1020
  * 
  * cdef inline int import_ufunc() except -1:
  *     try:             # <<<<<<<<<<<<<<
@@ -20037,7 +20153,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_ufunc(void) {
     goto __pyx_L8_try_end;
     __pyx_L3_error:;
 
-    /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1037
+    /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1022
  *     try:
  *         _import_umath()
  *     except Exception:             # <<<<<<<<<<<<<<
@@ -20047,27 +20163,27 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_ufunc(void) {
     __pyx_t_4 = __Pyx_PyErr_ExceptionMatches(((PyObject *)(&((PyTypeObject*)PyExc_Exception)[0])));
     if (__pyx_t_4) {
       __Pyx_AddTraceback("numpy.import_ufunc", __pyx_clineno, __pyx_lineno, __pyx_filename);
-      if (__Pyx_GetException(&__pyx_t_5, &__pyx_t_6, &__pyx_t_7) < 0) __PYX_ERR(2, 1037, __pyx_L5_except_error)
+      if (__Pyx_GetException(&__pyx_t_5, &__pyx_t_6, &__pyx_t_7) < 0) __PYX_ERR(2, 1022, __pyx_L5_except_error)
       __Pyx_XGOTREF(__pyx_t_5);
       __Pyx_XGOTREF(__pyx_t_6);
       __Pyx_XGOTREF(__pyx_t_7);
 
-      /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1038
+      /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1023
  *         _import_umath()
  *     except Exception:
  *         raise ImportError("numpy._core.umath failed to import")             # <<<<<<<<<<<<<<
  * 
  * 
  */
-      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__10, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(2, 1038, __pyx_L5_except_error)
+      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__10, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(2, 1023, __pyx_L5_except_error)
       __Pyx_GOTREF(__pyx_t_8);
       __Pyx_Raise(__pyx_t_8, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-      __PYX_ERR(2, 1038, __pyx_L5_except_error)
+      __PYX_ERR(2, 1023, __pyx_L5_except_error)
     }
     goto __pyx_L5_except_error;
 
-    /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1035
+    /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1020
  * 
  * cdef inline int import_ufunc() except -1:
  *     try:             # <<<<<<<<<<<<<<
@@ -20083,7 +20199,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_ufunc(void) {
     __pyx_L8_try_end:;
   }
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1034
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1019
  *         raise ImportError("numpy._core.umath failed to import")
  * 
  * cdef inline int import_ufunc() except -1:             # <<<<<<<<<<<<<<
@@ -20106,7 +20222,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_ufunc(void) {
   return __pyx_r;
 }
 
-/* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1041
+/* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1026
  * 
  * 
  * cdef inline bint is_timedelta64_object(object obj) noexcept:             # <<<<<<<<<<<<<<
@@ -20117,7 +20233,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_ufunc(void) {
 static CYTHON_INLINE int __pyx_f_5numpy_is_timedelta64_object(PyObject *__pyx_v_obj) {
   int __pyx_r;
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1053
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1038
  *     bool
  *     """
  *     return PyObject_TypeCheck(obj, &PyTimedeltaArrType_Type)             # <<<<<<<<<<<<<<
@@ -20127,7 +20243,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_is_timedelta64_object(PyObject *__pyx_v_
   __pyx_r = PyObject_TypeCheck(__pyx_v_obj, (&PyTimedeltaArrType_Type));
   goto __pyx_L0;
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1041
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1026
  * 
  * 
  * cdef inline bint is_timedelta64_object(object obj) noexcept:             # <<<<<<<<<<<<<<
@@ -20140,7 +20256,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_is_timedelta64_object(PyObject *__pyx_v_
   return __pyx_r;
 }
 
-/* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1056
+/* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1041
  * 
  * 
  * cdef inline bint is_datetime64_object(object obj) noexcept:             # <<<<<<<<<<<<<<
@@ -20151,7 +20267,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_is_timedelta64_object(PyObject *__pyx_v_
 static CYTHON_INLINE int __pyx_f_5numpy_is_datetime64_object(PyObject *__pyx_v_obj) {
   int __pyx_r;
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1068
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1053
  *     bool
  *     """
  *     return PyObject_TypeCheck(obj, &PyDatetimeArrType_Type)             # <<<<<<<<<<<<<<
@@ -20161,7 +20277,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_is_datetime64_object(PyObject *__pyx_v_o
   __pyx_r = PyObject_TypeCheck(__pyx_v_obj, (&PyDatetimeArrType_Type));
   goto __pyx_L0;
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1056
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1041
  * 
  * 
  * cdef inline bint is_datetime64_object(object obj) noexcept:             # <<<<<<<<<<<<<<
@@ -20174,7 +20290,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_is_datetime64_object(PyObject *__pyx_v_o
   return __pyx_r;
 }
 
-/* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1071
+/* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1056
  * 
  * 
  * cdef inline npy_datetime get_datetime64_value(object obj) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -20185,7 +20301,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_is_datetime64_object(PyObject *__pyx_v_o
 static CYTHON_INLINE npy_datetime __pyx_f_5numpy_get_datetime64_value(PyObject *__pyx_v_obj) {
   npy_datetime __pyx_r;
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1078
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1063
  *     also needed.  That can be found using `get_datetime64_unit`.
  *     """
  *     return (<PyDatetimeScalarObject*>obj).obval             # <<<<<<<<<<<<<<
@@ -20195,7 +20311,7 @@ static CYTHON_INLINE npy_datetime __pyx_f_5numpy_get_datetime64_value(PyObject *
   __pyx_r = ((PyDatetimeScalarObject *)__pyx_v_obj)->obval;
   goto __pyx_L0;
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1071
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1056
  * 
  * 
  * cdef inline npy_datetime get_datetime64_value(object obj) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -20208,7 +20324,7 @@ static CYTHON_INLINE npy_datetime __pyx_f_5numpy_get_datetime64_value(PyObject *
   return __pyx_r;
 }
 
-/* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1081
+/* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1066
  * 
  * 
  * cdef inline npy_timedelta get_timedelta64_value(object obj) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -20219,7 +20335,7 @@ static CYTHON_INLINE npy_datetime __pyx_f_5numpy_get_datetime64_value(PyObject *
 static CYTHON_INLINE npy_timedelta __pyx_f_5numpy_get_timedelta64_value(PyObject *__pyx_v_obj) {
   npy_timedelta __pyx_r;
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1085
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1070
  *     returns the int64 value underlying scalar numpy timedelta64 object
  *     """
  *     return (<PyTimedeltaScalarObject*>obj).obval             # <<<<<<<<<<<<<<
@@ -20229,7 +20345,7 @@ static CYTHON_INLINE npy_timedelta __pyx_f_5numpy_get_timedelta64_value(PyObject
   __pyx_r = ((PyTimedeltaScalarObject *)__pyx_v_obj)->obval;
   goto __pyx_L0;
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1081
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1066
  * 
  * 
  * cdef inline npy_timedelta get_timedelta64_value(object obj) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -20242,7 +20358,7 @@ static CYTHON_INLINE npy_timedelta __pyx_f_5numpy_get_timedelta64_value(PyObject
   return __pyx_r;
 }
 
-/* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1088
+/* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1073
  * 
  * 
  * cdef inline NPY_DATETIMEUNIT get_datetime64_unit(object obj) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -20253,7 +20369,7 @@ static CYTHON_INLINE npy_timedelta __pyx_f_5numpy_get_timedelta64_value(PyObject
 static CYTHON_INLINE NPY_DATETIMEUNIT __pyx_f_5numpy_get_datetime64_unit(PyObject *__pyx_v_obj) {
   NPY_DATETIMEUNIT __pyx_r;
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1092
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1077
  *     returns the unit part of the dtype for a numpy datetime64 object.
  *     """
  *     return <NPY_DATETIMEUNIT>(<PyDatetimeScalarObject*>obj).obmeta.base             # <<<<<<<<<<<<<<
@@ -20263,7 +20379,7 @@ static CYTHON_INLINE NPY_DATETIMEUNIT __pyx_f_5numpy_get_datetime64_unit(PyObjec
   __pyx_r = ((NPY_DATETIMEUNIT)((PyDatetimeScalarObject *)__pyx_v_obj)->obmeta.base);
   goto __pyx_L0;
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1088
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1073
  * 
  * 
  * cdef inline NPY_DATETIMEUNIT get_datetime64_unit(object obj) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -23780,44 +23896,116 @@ static PyObject *__pyx_pf_5sgimc_3ops_12shrink_row(CYTHON_UNUSED PyObject *__pyx
 /* "sgimc/ops.pyx":438
  * 
  * 
- * def _dense_op_d(object R,             # <<<<<<<<<<<<<<
- *                 double[:, ::1] X,
- *                 double[:, ::1] Z,
+ * cdef inline double sigmoid(double x) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     """Compute the logistic sigmoid without overflow."""
+ *     cdef double z
+ */
+
+static CYTHON_INLINE double __pyx_f_5sgimc_3ops_sigmoid(double __pyx_v_x) {
+  double __pyx_v_z;
+  double __pyx_r;
+  int __pyx_t_1;
+
+  /* "sgimc/ops.pyx":441
+ *     """Compute the logistic sigmoid without overflow."""
+ *     cdef double z
+ *     if x >= 0:             # <<<<<<<<<<<<<<
+ *         return 1. / (1. + exp(-x))
+ *     # end if
+ */
+  __pyx_t_1 = (__pyx_v_x >= 0.0);
+  if (__pyx_t_1) {
+
+    /* "sgimc/ops.pyx":442
+ *     cdef double z
+ *     if x >= 0:
+ *         return 1. / (1. + exp(-x))             # <<<<<<<<<<<<<<
+ *     # end if
+ *     z = exp(x)
+ */
+    __pyx_r = (1. / (1. + exp((-__pyx_v_x))));
+    goto __pyx_L0;
+
+    /* "sgimc/ops.pyx":441
+ *     """Compute the logistic sigmoid without overflow."""
+ *     cdef double z
+ *     if x >= 0:             # <<<<<<<<<<<<<<
+ *         return 1. / (1. + exp(-x))
+ *     # end if
+ */
+  }
+
+  /* "sgimc/ops.pyx":444
+ *         return 1. / (1. + exp(-x))
+ *     # end if
+ *     z = exp(x)             # <<<<<<<<<<<<<<
+ *     return z / (1. + z)
+ * 
+ */
+  __pyx_v_z = exp(__pyx_v_x);
+
+  /* "sgimc/ops.pyx":445
+ *     # end if
+ *     z = exp(x)
+ *     return z / (1. + z)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = (__pyx_v_z / (1. + __pyx_v_z));
+  goto __pyx_L0;
+
+  /* "sgimc/ops.pyx":438
+ * 
+ * 
+ * cdef inline double sigmoid(double x) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     """Compute the logistic sigmoid without overflow."""
+ *     cdef double z
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "sgimc/ops.pyx":448
+ * 
+ * 
+ * def huber_loss(const double[::1] predict,             # <<<<<<<<<<<<<<
+ *                const double[::1] target,
+ *                double epsilon):
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_5sgimc_3ops_15_dense_op_d(PyObject *__pyx_self, 
+static PyObject *__pyx_pw_5sgimc_3ops_15huber_loss(PyObject *__pyx_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-static PyMethodDef __pyx_mdef_5sgimc_3ops_15_dense_op_d = {"_dense_op_d", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_5sgimc_3ops_15_dense_op_d, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_5sgimc_3ops_15_dense_op_d(PyObject *__pyx_self, 
+PyDoc_STRVAR(__pyx_doc_5sgimc_3ops_14huber_loss, "Compute the Huber loss of the residuals `predict - target`.\n\n    Parameters\n    ----------\n    predict : 1d array, shape = [n,]\n        The predicted values.\n\n    target : 1d array, shape = [n,]\n        The target values.\n\n    epsilon : float\n        Positive threshold, at which the loss turns from quadratic to linear.\n\n    Returns\n    -------\n    out : 1d array, shape = [n,]\n        The elementwise loss values.\n    ");
+static PyMethodDef __pyx_mdef_5sgimc_3ops_15huber_loss = {"huber_loss", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_5sgimc_3ops_15huber_loss, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_5sgimc_3ops_14huber_loss};
+static PyObject *__pyx_pw_5sgimc_3ops_15huber_loss(PyObject *__pyx_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ) {
-  PyObject *__pyx_v_R = 0;
-  __Pyx_memviewslice __pyx_v_X = { 0, 0, { 0 }, { 0 }, { 0 } };
-  __Pyx_memviewslice __pyx_v_Z = { 0, 0, { 0 }, { 0 }, { 0 } };
-  __Pyx_memviewslice __pyx_v_D = { 0, 0, { 0 }, { 0 }, { 0 } };
-  __Pyx_memviewslice __pyx_v_S = { 0, 0, { 0 }, { 0 }, { 0 } };
-  int __pyx_v_n_threads;
+  __Pyx_memviewslice __pyx_v_predict = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_target = { 0, 0, { 0 }, { 0 }, { 0 } };
+  double __pyx_v_epsilon;
   #if !CYTHON_METH_FASTCALL
   CYTHON_UNUSED Py_ssize_t __pyx_nargs;
   #endif
   CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject* values[6] = {0,0,0,0,0,0};
+  PyObject* values[3] = {0,0,0};
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("_dense_op_d (wrapper)", 0);
+  __Pyx_RefNannySetupContext("huber_loss (wrapper)", 0);
   #if !CYTHON_METH_FASTCALL
   #if CYTHON_ASSUME_SAFE_MACROS
   __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
@@ -23827,16 +24015,10 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   #endif
   __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
   {
-    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_R,&__pyx_n_s_X,&__pyx_n_s_Z,&__pyx_n_s_D,&__pyx_n_s_S,&__pyx_n_s_n_threads,0};
+    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_predict,&__pyx_n_s_target,&__pyx_n_s_epsilon,0};
     if (__pyx_kwds) {
       Py_ssize_t kw_args;
       switch (__pyx_nargs) {
-        case  6: values[5] = __Pyx_Arg_FASTCALL(__pyx_args, 5);
-        CYTHON_FALLTHROUGH;
-        case  5: values[4] = __Pyx_Arg_FASTCALL(__pyx_args, 4);
-        CYTHON_FALLTHROUGH;
-        case  4: values[3] = __Pyx_Arg_FASTCALL(__pyx_args, 3);
-        CYTHON_FALLTHROUGH;
         case  3: values[2] = __Pyx_Arg_FASTCALL(__pyx_args, 2);
         CYTHON_FALLTHROUGH;
         case  2: values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
@@ -23849,91 +24031,51 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
       kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
       switch (__pyx_nargs) {
         case  0:
-        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_R)) != 0)) {
+        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_predict)) != 0)) {
           (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 438, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 448, __pyx_L3_error)
         else goto __pyx_L5_argtuple_error;
         CYTHON_FALLTHROUGH;
         case  1:
-        if (likely((values[1] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_X)) != 0)) {
+        if (likely((values[1] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_target)) != 0)) {
           (void)__Pyx_Arg_NewRef_FASTCALL(values[1]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 438, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 448, __pyx_L3_error)
         else {
-          __Pyx_RaiseArgtupleInvalid("_dense_op_d", 0, 5, 6, 1); __PYX_ERR(0, 438, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("huber_loss", 1, 3, 3, 1); __PYX_ERR(0, 448, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  2:
-        if (likely((values[2] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_Z)) != 0)) {
+        if (likely((values[2] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_epsilon)) != 0)) {
           (void)__Pyx_Arg_NewRef_FASTCALL(values[2]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 438, __pyx_L3_error)
-        else {
-          __Pyx_RaiseArgtupleInvalid("_dense_op_d", 0, 5, 6, 2); __PYX_ERR(0, 438, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  3:
-        if (likely((values[3] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_D)) != 0)) {
-          (void)__Pyx_Arg_NewRef_FASTCALL(values[3]);
-          kw_args--;
-        }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 438, __pyx_L3_error)
-        else {
-          __Pyx_RaiseArgtupleInvalid("_dense_op_d", 0, 5, 6, 3); __PYX_ERR(0, 438, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  4:
-        if (likely((values[4] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_S)) != 0)) {
-          (void)__Pyx_Arg_NewRef_FASTCALL(values[4]);
-          kw_args--;
-        }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 438, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 448, __pyx_L3_error)
         else {
-          __Pyx_RaiseArgtupleInvalid("_dense_op_d", 0, 5, 6, 4); __PYX_ERR(0, 438, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  5:
-        if (kw_args > 0) {
-          PyObject* value = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_n_threads);
-          if (value) { values[5] = __Pyx_Arg_NewRef_FASTCALL(value); kw_args--; }
-          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 438, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("huber_loss", 1, 3, 3, 2); __PYX_ERR(0, 448, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
         const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "_dense_op_d") < 0)) __PYX_ERR(0, 438, __pyx_L3_error)
-      }
-    } else {
-      switch (__pyx_nargs) {
-        case  6: values[5] = __Pyx_Arg_FASTCALL(__pyx_args, 5);
-        CYTHON_FALLTHROUGH;
-        case  5: values[4] = __Pyx_Arg_FASTCALL(__pyx_args, 4);
-        values[3] = __Pyx_Arg_FASTCALL(__pyx_args, 3);
-        values[2] = __Pyx_Arg_FASTCALL(__pyx_args, 2);
-        values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
-        values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-        break;
-        default: goto __pyx_L5_argtuple_error;
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "huber_loss") < 0)) __PYX_ERR(0, 448, __pyx_L3_error)
       }
-    }
-    __pyx_v_R = values[0];
-    __pyx_v_X = __Pyx_PyObject_to_MemoryviewSlice_d_dc_double(values[1], PyBUF_WRITABLE); if (unlikely(!__pyx_v_X.memview)) __PYX_ERR(0, 439, __pyx_L3_error)
-    __pyx_v_Z = __Pyx_PyObject_to_MemoryviewSlice_d_dc_double(values[2], PyBUF_WRITABLE); if (unlikely(!__pyx_v_Z.memview)) __PYX_ERR(0, 440, __pyx_L3_error)
-    __pyx_v_D = __Pyx_PyObject_to_MemoryviewSlice_d_dc_double(values[3], PyBUF_WRITABLE); if (unlikely(!__pyx_v_D.memview)) __PYX_ERR(0, 441, __pyx_L3_error)
-    __pyx_v_S = __Pyx_PyObject_to_MemoryviewSlice_dc_double(values[4], PyBUF_WRITABLE); if (unlikely(!__pyx_v_S.memview)) __PYX_ERR(0, 442, __pyx_L3_error)
-    if (values[5]) {
-      __pyx_v_n_threads = __Pyx_PyInt_As_int(values[5]); if (unlikely((__pyx_v_n_threads == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 443, __pyx_L3_error)
+    } else if (unlikely(__pyx_nargs != 3)) {
+      goto __pyx_L5_argtuple_error;
     } else {
-      __pyx_v_n_threads = ((int)((int)1));
+      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+      values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
+      values[2] = __Pyx_Arg_FASTCALL(__pyx_args, 2);
     }
+    __pyx_v_predict = __Pyx_PyObject_to_MemoryviewSlice_dc_double__const__(values[0], 0); if (unlikely(!__pyx_v_predict.memview)) __PYX_ERR(0, 448, __pyx_L3_error)
+    __pyx_v_target = __Pyx_PyObject_to_MemoryviewSlice_dc_double__const__(values[1], 0); if (unlikely(!__pyx_v_target.memview)) __PYX_ERR(0, 449, __pyx_L3_error)
+    __pyx_v_epsilon = __pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_epsilon == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 450, __pyx_L3_error)
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("_dense_op_d", 0, 5, 6, __pyx_nargs); __PYX_ERR(0, 438, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("huber_loss", 1, 3, 3, __pyx_nargs); __PYX_ERR(0, 448, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -23943,21 +24085,17 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
       __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
     }
   }
-  __PYX_XCLEAR_MEMVIEW(&__pyx_v_X, 1);
-  __PYX_XCLEAR_MEMVIEW(&__pyx_v_Z, 1);
-  __PYX_XCLEAR_MEMVIEW(&__pyx_v_D, 1);
-  __PYX_XCLEAR_MEMVIEW(&__pyx_v_S, 1);
-  __Pyx_AddTraceback("sgimc.ops._dense_op_d", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_predict, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_target, 1);
+  __Pyx_AddTraceback("sgimc.ops.huber_loss", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_5sgimc_3ops_14_dense_op_d(__pyx_self, __pyx_v_R, __pyx_v_X, __pyx_v_Z, __pyx_v_D, __pyx_v_S, __pyx_v_n_threads);
+  __pyx_r = __pyx_pf_5sgimc_3ops_14huber_loss(__pyx_self, __pyx_v_predict, __pyx_v_target, __pyx_v_epsilon);
 
   /* function exit code */
-  __PYX_XCLEAR_MEMVIEW(&__pyx_v_X, 1);
-  __PYX_XCLEAR_MEMVIEW(&__pyx_v_Z, 1);
-  __PYX_XCLEAR_MEMVIEW(&__pyx_v_D, 1);
-  __PYX_XCLEAR_MEMVIEW(&__pyx_v_S, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_predict, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_target, 1);
   {
     Py_ssize_t __pyx_temp;
     for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
@@ -23968,292 +24106,286 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_5sgimc_3ops_14_dense_op_d(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_R, __Pyx_memviewslice __pyx_v_X, __Pyx_memviewslice __pyx_v_Z, __Pyx_memviewslice __pyx_v_D, __Pyx_memviewslice __pyx_v_S, int __pyx_v_n_threads) {
-  int __pyx_v_errcode;
-  int __pyx_v_n_1;
-  int __pyx_v_n_2;
-  int __pyx_v_d_1;
-  int __pyx_v_k;
-  __Pyx_memviewslice __pyx_v_Sp = { 0, 0, { 0 }, { 0 }, { 0 } };
-  __Pyx_memviewslice __pyx_v_Sj = { 0, 0, { 0 }, { 0 }, { 0 } };
+static PyObject *__pyx_pf_5sgimc_3ops_14huber_loss(CYTHON_UNUSED PyObject *__pyx_self, __Pyx_memviewslice __pyx_v_predict, __Pyx_memviewslice __pyx_v_target, double __pyx_v_epsilon) {
+  Py_ssize_t __pyx_v_i;
+  Py_ssize_t __pyx_v_n;
+  double __pyx_v_resid;
+  __Pyx_memviewslice __pyx_v_out = { 0, 0, { 0 }, { 0 }, { 0 } };
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_memviewslice __pyx_t_2 = { 0, 0, { 0 }, { 0 }, { 0 } };
-  int __pyx_t_3;
-  Py_ssize_t __pyx_t_4;
-  Py_ssize_t __pyx_t_5;
-  Py_ssize_t __pyx_t_6;
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  __Pyx_memviewslice __pyx_t_6 = { 0, 0, { 0 }, { 0 }, { 0 } };
   Py_ssize_t __pyx_t_7;
   Py_ssize_t __pyx_t_8;
   Py_ssize_t __pyx_t_9;
   Py_ssize_t __pyx_t_10;
   Py_ssize_t __pyx_t_11;
-  Py_ssize_t __pyx_t_12;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("_dense_op_d", 1);
-
-  /* "sgimc/ops.pyx":444
- *                 double[::1] S,
- *                 int n_threads=1):
- *     cdef int errcode = -1             # <<<<<<<<<<<<<<
- *     cdef int n_1 = X.shape[0], n_2 = Z.shape[0]
- *     cdef int d_1 = X.shape[1], k = Z.shape[1]
- */
-  __pyx_v_errcode = -1;
-
-  /* "sgimc/ops.pyx":445
- *                 int n_threads=1):
- *     cdef int errcode = -1
- *     cdef int n_1 = X.shape[0], n_2 = Z.shape[0]             # <<<<<<<<<<<<<<
- *     cdef int d_1 = X.shape[1], k = Z.shape[1]
- *     cdef int[::1] Sp = R.indptr, Sj = R.indices
- */
-  __pyx_v_n_1 = (__pyx_v_X.shape[0]);
-  __pyx_v_n_2 = (__pyx_v_Z.shape[0]);
+  __Pyx_RefNannySetupContext("huber_loss", 1);
 
-  /* "sgimc/ops.pyx":446
- *     cdef int errcode = -1
- *     cdef int n_1 = X.shape[0], n_2 = Z.shape[0]
- *     cdef int d_1 = X.shape[1], k = Z.shape[1]             # <<<<<<<<<<<<<<
- *     cdef int[::1] Sp = R.indptr, Sj = R.indices
+  /* "sgimc/ops.pyx":469
+ *         The elementwise loss values.
+ *     """
+ *     cdef Py_ssize_t i, n = predict.shape[0]             # <<<<<<<<<<<<<<
+ *     cdef double resid
  * 
  */
-  __pyx_v_d_1 = (__pyx_v_X.shape[1]);
-  __pyx_v_k = (__pyx_v_Z.shape[1]);
+  __pyx_v_n = (__pyx_v_predict.shape[0]);
 
-  /* "sgimc/ops.pyx":447
- *     cdef int n_1 = X.shape[0], n_2 = Z.shape[0]
- *     cdef int d_1 = X.shape[1], k = Z.shape[1]
- *     cdef int[::1] Sp = R.indptr, Sj = R.indices             # <<<<<<<<<<<<<<
+  /* "sgimc/ops.pyx":472
+ *     cdef double resid
  * 
- *     if n_threads != 1:
- */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_R, __pyx_n_s_indptr); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 447, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(__pyx_t_1, PyBUF_WRITABLE); if (unlikely(!__pyx_t_2.memview)) __PYX_ERR(0, 447, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_v_Sp = __pyx_t_2;
-  __pyx_t_2.memview = NULL;
-  __pyx_t_2.data = NULL;
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_R, __pyx_n_s_indices); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 447, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(__pyx_t_1, PyBUF_WRITABLE); if (unlikely(!__pyx_t_2.memview)) __PYX_ERR(0, 447, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_v_Sj = __pyx_t_2;
-  __pyx_t_2.memview = NULL;
-  __pyx_t_2.data = NULL;
-
-  /* "sgimc/ops.pyx":449
- *     cdef int[::1] Sp = R.indptr, Sj = R.indices
+ *     if target.shape[0] != n:             # <<<<<<<<<<<<<<
+ *         raise TypeError("""`predict` and `target` must have equal length.""")
  * 
- *     if n_threads != 1:             # <<<<<<<<<<<<<<
- *         errcode = __omp_dense_op_d(
- *             n_1, d_1, &X[0, 0],
- */
-  __pyx_t_3 = (__pyx_v_n_threads != 1);
-  if (__pyx_t_3) {
-
-    /* "sgimc/ops.pyx":451
- *     if n_threads != 1:
- *         errcode = __omp_dense_op_d(
- *             n_1, d_1, &X[0, 0],             # <<<<<<<<<<<<<<
- *             n_2, k, &Z[0, 0],
- *             &D[0, 0],
  */
-    __pyx_t_4 = 0;
-    __pyx_t_5 = 0;
+  __pyx_t_1 = ((__pyx_v_target.shape[0]) != __pyx_v_n);
+  if (unlikely(__pyx_t_1)) {
 
-    /* "sgimc/ops.pyx":452
- *         errcode = __omp_dense_op_d(
- *             n_1, d_1, &X[0, 0],
- *             n_2, k, &Z[0, 0],             # <<<<<<<<<<<<<<
- *             &D[0, 0],
- *             &Sp[0], &Sj[0], &S[0],
+    /* "sgimc/ops.pyx":473
+ * 
+ *     if target.shape[0] != n:
+ *         raise TypeError("""`predict` and `target` must have equal length.""")             # <<<<<<<<<<<<<<
+ * 
+ *     cdef double[::1] out = np.empty(n, dtype="double")
  */
-    __pyx_t_6 = 0;
-    __pyx_t_7 = 0;
+    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__13, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 473, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __PYX_ERR(0, 473, __pyx_L1_error)
 
-    /* "sgimc/ops.pyx":453
- *             n_1, d_1, &X[0, 0],
- *             n_2, k, &Z[0, 0],
- *             &D[0, 0],             # <<<<<<<<<<<<<<
- *             &Sp[0], &Sj[0], &S[0],
- *             n_threads)
+    /* "sgimc/ops.pyx":472
+ *     cdef double resid
+ * 
+ *     if target.shape[0] != n:             # <<<<<<<<<<<<<<
+ *         raise TypeError("""`predict` and `target` must have equal length.""")
+ * 
  */
-    __pyx_t_8 = 0;
-    __pyx_t_9 = 0;
+  }
 
-    /* "sgimc/ops.pyx":454
- *             n_2, k, &Z[0, 0],
- *             &D[0, 0],
- *             &Sp[0], &Sj[0], &S[0],             # <<<<<<<<<<<<<<
- *             n_threads)
- *     else:
+  /* "sgimc/ops.pyx":475
+ *         raise TypeError("""`predict` and `target` must have equal length.""")
+ * 
+ *     cdef double[::1] out = np.empty(n, dtype="double")             # <<<<<<<<<<<<<<
+ * 
+ *     with nogil:
  */
-    __pyx_t_10 = 0;
-    __pyx_t_11 = 0;
-    __pyx_t_12 = 0;
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 475, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_empty); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 475, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = PyInt_FromSsize_t(__pyx_v_n); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 475, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 475, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_2);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_2)) __PYX_ERR(0, 475, __pyx_L1_error);
+  __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 475, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_t_2, __pyx_n_s_dtype, __pyx_n_s_double) < 0) __PYX_ERR(0, 475, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_4, __pyx_t_2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 475, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_6 = __Pyx_PyObject_to_MemoryviewSlice_dc_double(__pyx_t_5, PyBUF_WRITABLE); if (unlikely(!__pyx_t_6.memview)) __PYX_ERR(0, 475, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_v_out = __pyx_t_6;
+  __pyx_t_6.memview = NULL;
+  __pyx_t_6.data = NULL;
 
-    /* "sgimc/ops.pyx":450
+  /* "sgimc/ops.pyx":477
+ *     cdef double[::1] out = np.empty(n, dtype="double")
  * 
- *     if n_threads != 1:
- *         errcode = __omp_dense_op_d(             # <<<<<<<<<<<<<<
- *             n_1, d_1, &X[0, 0],
- *             n_2, k, &Z[0, 0],
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for i in range(n):
+ *             resid = fabs(predict[i] - target[i])
  */
-    __pyx_v_errcode = omp_dense_op_d(__pyx_v_n_1, __pyx_v_d_1, (&(*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_X.data + __pyx_t_4 * __pyx_v_X.strides[0]) )) + __pyx_t_5)) )))), __pyx_v_n_2, __pyx_v_k, (&(*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_Z.data + __pyx_t_6 * __pyx_v_Z.strides[0]) )) + __pyx_t_7)) )))), (&(*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_D.data + __pyx_t_8 * __pyx_v_D.strides[0]) )) + __pyx_t_9)) )))), (&(*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_Sp.data) + __pyx_t_10)) )))), (&(*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_Sj.data) + __pyx_t_11)) )))), (&(*((double *) ( /* dim=0 */ ((char *) (((double *) __pyx_v_S.data) + __pyx_t_12)) )))), __pyx_v_n_threads);
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      _save = NULL;
+      Py_UNBLOCK_THREADS
+      __Pyx_FastGIL_Remember();
+      #endif
+      /*try:*/ {
 
-    /* "sgimc/ops.pyx":449
- *     cdef int[::1] Sp = R.indptr, Sj = R.indices
+        /* "sgimc/ops.pyx":478
  * 
- *     if n_threads != 1:             # <<<<<<<<<<<<<<
- *         errcode = __omp_dense_op_d(
- *             n_1, d_1, &X[0, 0],
+ *     with nogil:
+ *         for i in range(n):             # <<<<<<<<<<<<<<
+ *             resid = fabs(predict[i] - target[i])
+ *             if resid > epsilon:
  */
-    goto __pyx_L3;
-  }
+        __pyx_t_7 = __pyx_v_n;
+        __pyx_t_8 = __pyx_t_7;
+        for (__pyx_t_9 = 0; __pyx_t_9 < __pyx_t_8; __pyx_t_9+=1) {
+          __pyx_v_i = __pyx_t_9;
 
-  /* "sgimc/ops.pyx":457
- *             n_threads)
- *     else:
- *         errcode = __op_dense_d(             # <<<<<<<<<<<<<<
- *             n_1, d_1, &X[0, 0],
- *             n_2, k, &Z[0, 0],
+          /* "sgimc/ops.pyx":479
+ *     with nogil:
+ *         for i in range(n):
+ *             resid = fabs(predict[i] - target[i])             # <<<<<<<<<<<<<<
+ *             if resid > epsilon:
+ *                 out[i] = epsilon * (resid - epsilon / 2)
+ */
+          __pyx_t_10 = __pyx_v_i;
+          __pyx_t_11 = __pyx_v_i;
+          __pyx_v_resid = fabs(((*((double const  *) ( /* dim=0 */ ((char *) (((double const  *) __pyx_v_predict.data) + __pyx_t_10)) ))) - (*((double const  *) ( /* dim=0 */ ((char *) (((double const  *) __pyx_v_target.data) + __pyx_t_11)) )))));
+
+          /* "sgimc/ops.pyx":480
+ *         for i in range(n):
+ *             resid = fabs(predict[i] - target[i])
+ *             if resid > epsilon:             # <<<<<<<<<<<<<<
+ *                 out[i] = epsilon * (resid - epsilon / 2)
+ *             else:
  */
-  /*else*/ {
+          __pyx_t_1 = (__pyx_v_resid > __pyx_v_epsilon);
+          if (__pyx_t_1) {
 
-    /* "sgimc/ops.pyx":458
- *     else:
- *         errcode = __op_dense_d(
- *             n_1, d_1, &X[0, 0],             # <<<<<<<<<<<<<<
- *             n_2, k, &Z[0, 0],
- *             &D[0, 0],
+            /* "sgimc/ops.pyx":481
+ *             resid = fabs(predict[i] - target[i])
+ *             if resid > epsilon:
+ *                 out[i] = epsilon * (resid - epsilon / 2)             # <<<<<<<<<<<<<<
+ *             else:
+ *                 out[i] = 0.5 * resid * resid
  */
-    __pyx_t_12 = 0;
-    __pyx_t_11 = 0;
+            __pyx_t_11 = __pyx_v_i;
+            *((double *) ( /* dim=0 */ ((char *) (((double *) __pyx_v_out.data) + __pyx_t_11)) )) = (__pyx_v_epsilon * (__pyx_v_resid - (__pyx_v_epsilon / 2.0)));
 
-    /* "sgimc/ops.pyx":459
- *         errcode = __op_dense_d(
- *             n_1, d_1, &X[0, 0],
- *             n_2, k, &Z[0, 0],             # <<<<<<<<<<<<<<
- *             &D[0, 0],
- *             &Sp[0], &Sj[0], &S[0])
+            /* "sgimc/ops.pyx":480
+ *         for i in range(n):
+ *             resid = fabs(predict[i] - target[i])
+ *             if resid > epsilon:             # <<<<<<<<<<<<<<
+ *                 out[i] = epsilon * (resid - epsilon / 2)
+ *             else:
  */
-    __pyx_t_10 = 0;
-    __pyx_t_9 = 0;
+            goto __pyx_L9;
+          }
 
-    /* "sgimc/ops.pyx":460
- *             n_1, d_1, &X[0, 0],
- *             n_2, k, &Z[0, 0],
- *             &D[0, 0],             # <<<<<<<<<<<<<<
- *             &Sp[0], &Sj[0], &S[0])
- *     # end if
+          /* "sgimc/ops.pyx":483
+ *                 out[i] = epsilon * (resid - epsilon / 2)
+ *             else:
+ *                 out[i] = 0.5 * resid * resid             # <<<<<<<<<<<<<<
+ *             # end if
+ *         # end for
  */
-    __pyx_t_8 = 0;
-    __pyx_t_7 = 0;
+          /*else*/ {
+            __pyx_t_11 = __pyx_v_i;
+            *((double *) ( /* dim=0 */ ((char *) (((double *) __pyx_v_out.data) + __pyx_t_11)) )) = ((0.5 * __pyx_v_resid) * __pyx_v_resid);
+          }
+          __pyx_L9:;
+        }
+      }
 
-    /* "sgimc/ops.pyx":461
- *             n_2, k, &Z[0, 0],
- *             &D[0, 0],
- *             &Sp[0], &Sj[0], &S[0])             # <<<<<<<<<<<<<<
- *     # end if
+      /* "sgimc/ops.pyx":477
+ *     cdef double[::1] out = np.empty(n, dtype="double")
  * 
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for i in range(n):
+ *             resid = fabs(predict[i] - target[i])
  */
-    __pyx_t_6 = 0;
-    __pyx_t_5 = 0;
-    __pyx_t_4 = 0;
-
-    /* "sgimc/ops.pyx":457
- *             n_threads)
- *     else:
- *         errcode = __op_dense_d(             # <<<<<<<<<<<<<<
- *             n_1, d_1, &X[0, 0],
- *             n_2, k, &Z[0, 0],
- */
-    __pyx_v_errcode = dense_op_d(__pyx_v_n_1, __pyx_v_d_1, (&(*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_X.data + __pyx_t_12 * __pyx_v_X.strides[0]) )) + __pyx_t_11)) )))), __pyx_v_n_2, __pyx_v_k, (&(*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_Z.data + __pyx_t_10 * __pyx_v_Z.strides[0]) )) + __pyx_t_9)) )))), (&(*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_D.data + __pyx_t_8 * __pyx_v_D.strides[0]) )) + __pyx_t_7)) )))), (&(*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_Sp.data) + __pyx_t_6)) )))), (&(*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_Sj.data) + __pyx_t_5)) )))), (&(*((double *) ( /* dim=0 */ ((char *) (((double *) __pyx_v_S.data) + __pyx_t_4)) )))));
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          __Pyx_FastGIL_Forget();
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L6;
+        }
+        __pyx_L6:;
+      }
   }
-  __pyx_L3:;
 
-  /* "sgimc/ops.pyx":464
- *     # end if
+  /* "sgimc/ops.pyx":488
+ *     # end with
  * 
- *     return errcode             # <<<<<<<<<<<<<<
+ *     return out.base             # <<<<<<<<<<<<<<
  * 
  * 
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_errcode); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 464, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
+  __pyx_t_5 = __pyx_memoryview_fromslice(__pyx_v_out, 1, (PyObject *(*)(char *)) __pyx_memview_get_double, (int (*)(char *, PyObject *)) __pyx_memview_set_double, 0);; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 488, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_base); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 488, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
   goto __pyx_L0;
 
-  /* "sgimc/ops.pyx":438
+  /* "sgimc/ops.pyx":448
  * 
  * 
- * def _dense_op_d(object R,             # <<<<<<<<<<<<<<
- *                 double[:, ::1] X,
- *                 double[:, ::1] Z,
+ * def huber_loss(const double[::1] predict,             # <<<<<<<<<<<<<<
+ *                const double[::1] target,
+ *                double epsilon):
  */
 
   /* function exit code */
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __PYX_XCLEAR_MEMVIEW(&__pyx_t_2, 1);
-  __Pyx_AddTraceback("sgimc.ops._dense_op_d", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_6, 1);
+  __Pyx_AddTraceback("sgimc.ops.huber_loss", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
-  __PYX_XCLEAR_MEMVIEW(&__pyx_v_Sp, 1);
-  __PYX_XCLEAR_MEMVIEW(&__pyx_v_Sj, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_out, 1);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "sgimc/ops.pyx":467
+/* "sgimc/ops.pyx":491
  * 
  * 
- * def _sparse_op_d(object R,             # <<<<<<<<<<<<<<
- *                  object X,
- *                  double[:, ::1] Z,
+ * def huber_grad(const double[::1] predict,             # <<<<<<<<<<<<<<
+ *                const double[::1] target,
+ *                double epsilon):
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_5sgimc_3ops_17_sparse_op_d(PyObject *__pyx_self, 
+static PyObject *__pyx_pw_5sgimc_3ops_17huber_grad(PyObject *__pyx_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-static PyMethodDef __pyx_mdef_5sgimc_3ops_17_sparse_op_d = {"_sparse_op_d", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_5sgimc_3ops_17_sparse_op_d, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_5sgimc_3ops_17_sparse_op_d(PyObject *__pyx_self, 
+PyDoc_STRVAR(__pyx_doc_5sgimc_3ops_16huber_grad, "Compute the derivative of the Huber loss w.r.t. `predict`.\n\n    Parameters\n    ----------\n    predict : 1d array, shape = [n,]\n        The predicted values.\n\n    target : 1d array, shape = [n,]\n        The target values.\n\n    epsilon : float\n        Positive threshold, at which the loss turns from quadratic to linear.\n\n    Returns\n    -------\n    out : 1d array, shape = [n,]\n        The residuals clipped to `[-epsilon, epsilon]`.\n    ");
+static PyMethodDef __pyx_mdef_5sgimc_3ops_17huber_grad = {"huber_grad", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_5sgimc_3ops_17huber_grad, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_5sgimc_3ops_16huber_grad};
+static PyObject *__pyx_pw_5sgimc_3ops_17huber_grad(PyObject *__pyx_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ) {
-  PyObject *__pyx_v_R = 0;
-  PyObject *__pyx_v_X = 0;
-  __Pyx_memviewslice __pyx_v_Z = { 0, 0, { 0 }, { 0 }, { 0 } };
-  __Pyx_memviewslice __pyx_v_D = { 0, 0, { 0 }, { 0 }, { 0 } };
-  __Pyx_memviewslice __pyx_v_S = { 0, 0, { 0 }, { 0 }, { 0 } };
-  int __pyx_v_n_threads;
+  __Pyx_memviewslice __pyx_v_predict = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_target = { 0, 0, { 0 }, { 0 }, { 0 } };
+  double __pyx_v_epsilon;
   #if !CYTHON_METH_FASTCALL
   CYTHON_UNUSED Py_ssize_t __pyx_nargs;
   #endif
   CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject* values[6] = {0,0,0,0,0,0};
+  PyObject* values[3] = {0,0,0};
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("_sparse_op_d (wrapper)", 0);
+  __Pyx_RefNannySetupContext("huber_grad (wrapper)", 0);
   #if !CYTHON_METH_FASTCALL
   #if CYTHON_ASSUME_SAFE_MACROS
   __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
@@ -24263,16 +24395,10 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   #endif
   __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
   {
-    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_R,&__pyx_n_s_X,&__pyx_n_s_Z,&__pyx_n_s_D,&__pyx_n_s_S,&__pyx_n_s_n_threads,0};
+    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_predict,&__pyx_n_s_target,&__pyx_n_s_epsilon,0};
     if (__pyx_kwds) {
       Py_ssize_t kw_args;
       switch (__pyx_nargs) {
-        case  6: values[5] = __Pyx_Arg_FASTCALL(__pyx_args, 5);
-        CYTHON_FALLTHROUGH;
-        case  5: values[4] = __Pyx_Arg_FASTCALL(__pyx_args, 4);
-        CYTHON_FALLTHROUGH;
-        case  4: values[3] = __Pyx_Arg_FASTCALL(__pyx_args, 3);
-        CYTHON_FALLTHROUGH;
         case  3: values[2] = __Pyx_Arg_FASTCALL(__pyx_args, 2);
         CYTHON_FALLTHROUGH;
         case  2: values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
@@ -24285,91 +24411,51 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
       kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
       switch (__pyx_nargs) {
         case  0:
-        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_R)) != 0)) {
+        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_predict)) != 0)) {
           (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 467, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 491, __pyx_L3_error)
         else goto __pyx_L5_argtuple_error;
         CYTHON_FALLTHROUGH;
         case  1:
-        if (likely((values[1] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_X)) != 0)) {
+        if (likely((values[1] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_target)) != 0)) {
           (void)__Pyx_Arg_NewRef_FASTCALL(values[1]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 467, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 491, __pyx_L3_error)
         else {
-          __Pyx_RaiseArgtupleInvalid("_sparse_op_d", 0, 5, 6, 1); __PYX_ERR(0, 467, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("huber_grad", 1, 3, 3, 1); __PYX_ERR(0, 491, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  2:
-        if (likely((values[2] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_Z)) != 0)) {
+        if (likely((values[2] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_epsilon)) != 0)) {
           (void)__Pyx_Arg_NewRef_FASTCALL(values[2]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 467, __pyx_L3_error)
-        else {
-          __Pyx_RaiseArgtupleInvalid("_sparse_op_d", 0, 5, 6, 2); __PYX_ERR(0, 467, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  3:
-        if (likely((values[3] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_D)) != 0)) {
-          (void)__Pyx_Arg_NewRef_FASTCALL(values[3]);
-          kw_args--;
-        }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 467, __pyx_L3_error)
-        else {
-          __Pyx_RaiseArgtupleInvalid("_sparse_op_d", 0, 5, 6, 3); __PYX_ERR(0, 467, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  4:
-        if (likely((values[4] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_S)) != 0)) {
-          (void)__Pyx_Arg_NewRef_FASTCALL(values[4]);
-          kw_args--;
-        }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 467, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 491, __pyx_L3_error)
         else {
-          __Pyx_RaiseArgtupleInvalid("_sparse_op_d", 0, 5, 6, 4); __PYX_ERR(0, 467, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  5:
-        if (kw_args > 0) {
-          PyObject* value = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_n_threads);
-          if (value) { values[5] = __Pyx_Arg_NewRef_FASTCALL(value); kw_args--; }
-          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 467, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("huber_grad", 1, 3, 3, 2); __PYX_ERR(0, 491, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
         const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "_sparse_op_d") < 0)) __PYX_ERR(0, 467, __pyx_L3_error)
-      }
-    } else {
-      switch (__pyx_nargs) {
-        case  6: values[5] = __Pyx_Arg_FASTCALL(__pyx_args, 5);
-        CYTHON_FALLTHROUGH;
-        case  5: values[4] = __Pyx_Arg_FASTCALL(__pyx_args, 4);
-        values[3] = __Pyx_Arg_FASTCALL(__pyx_args, 3);
-        values[2] = __Pyx_Arg_FASTCALL(__pyx_args, 2);
-        values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
-        values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-        break;
-        default: goto __pyx_L5_argtuple_error;
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "huber_grad") < 0)) __PYX_ERR(0, 491, __pyx_L3_error)
       }
-    }
-    __pyx_v_R = values[0];
-    __pyx_v_X = values[1];
-    __pyx_v_Z = __Pyx_PyObject_to_MemoryviewSlice_d_dc_double(values[2], PyBUF_WRITABLE); if (unlikely(!__pyx_v_Z.memview)) __PYX_ERR(0, 469, __pyx_L3_error)
-    __pyx_v_D = __Pyx_PyObject_to_MemoryviewSlice_d_dc_double(values[3], PyBUF_WRITABLE); if (unlikely(!__pyx_v_D.memview)) __PYX_ERR(0, 470, __pyx_L3_error)
-    __pyx_v_S = __Pyx_PyObject_to_MemoryviewSlice_dc_double(values[4], PyBUF_WRITABLE); if (unlikely(!__pyx_v_S.memview)) __PYX_ERR(0, 471, __pyx_L3_error)
-    if (values[5]) {
-      __pyx_v_n_threads = __Pyx_PyInt_As_int(values[5]); if (unlikely((__pyx_v_n_threads == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 472, __pyx_L3_error)
+    } else if (unlikely(__pyx_nargs != 3)) {
+      goto __pyx_L5_argtuple_error;
     } else {
-      __pyx_v_n_threads = ((int)((int)1));
+      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+      values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
+      values[2] = __Pyx_Arg_FASTCALL(__pyx_args, 2);
     }
+    __pyx_v_predict = __Pyx_PyObject_to_MemoryviewSlice_dc_double__const__(values[0], 0); if (unlikely(!__pyx_v_predict.memview)) __PYX_ERR(0, 491, __pyx_L3_error)
+    __pyx_v_target = __Pyx_PyObject_to_MemoryviewSlice_dc_double__const__(values[1], 0); if (unlikely(!__pyx_v_target.memview)) __PYX_ERR(0, 492, __pyx_L3_error)
+    __pyx_v_epsilon = __pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_epsilon == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 493, __pyx_L3_error)
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("_sparse_op_d", 0, 5, 6, __pyx_nargs); __PYX_ERR(0, 467, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("huber_grad", 1, 3, 3, __pyx_nargs); __PYX_ERR(0, 491, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -24379,19 +24465,17 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
       __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
     }
   }
-  __PYX_XCLEAR_MEMVIEW(&__pyx_v_Z, 1);
-  __PYX_XCLEAR_MEMVIEW(&__pyx_v_D, 1);
-  __PYX_XCLEAR_MEMVIEW(&__pyx_v_S, 1);
-  __Pyx_AddTraceback("sgimc.ops._sparse_op_d", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_predict, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_target, 1);
+  __Pyx_AddTraceback("sgimc.ops.huber_grad", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_5sgimc_3ops_16_sparse_op_d(__pyx_self, __pyx_v_R, __pyx_v_X, __pyx_v_Z, __pyx_v_D, __pyx_v_S, __pyx_v_n_threads);
+  __pyx_r = __pyx_pf_5sgimc_3ops_16huber_grad(__pyx_self, __pyx_v_predict, __pyx_v_target, __pyx_v_epsilon);
 
   /* function exit code */
-  __PYX_XCLEAR_MEMVIEW(&__pyx_v_Z, 1);
-  __PYX_XCLEAR_MEMVIEW(&__pyx_v_D, 1);
-  __PYX_XCLEAR_MEMVIEW(&__pyx_v_S, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_predict, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_target, 1);
   {
     Py_ssize_t __pyx_temp;
     for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
@@ -24402,143 +24486,2005 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_5sgimc_3ops_16_sparse_op_d(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_R, PyObject *__pyx_v_X, __Pyx_memviewslice __pyx_v_Z, __Pyx_memviewslice __pyx_v_D, __Pyx_memviewslice __pyx_v_S, int __pyx_v_n_threads) {
-  int __pyx_v_errcode;
-  int __pyx_v_n_1;
-  int __pyx_v_n_2;
-  int __pyx_v_d_1;
-  int __pyx_v_k;
-  __Pyx_memviewslice __pyx_v_Sp = { 0, 0, { 0 }, { 0 }, { 0 } };
-  __Pyx_memviewslice __pyx_v_Sj = { 0, 0, { 0 }, { 0 }, { 0 } };
-  __Pyx_memviewslice __pyx_v_Xp = { 0, 0, { 0 }, { 0 }, { 0 } };
-  __Pyx_memviewslice __pyx_v_Xj = { 0, 0, { 0 }, { 0 }, { 0 } };
-  __Pyx_memviewslice __pyx_v_Xx = { 0, 0, { 0 }, { 0 }, { 0 } };
+static PyObject *__pyx_pf_5sgimc_3ops_16huber_grad(CYTHON_UNUSED PyObject *__pyx_self, __Pyx_memviewslice __pyx_v_predict, __Pyx_memviewslice __pyx_v_target, double __pyx_v_epsilon) {
+  Py_ssize_t __pyx_v_i;
+  Py_ssize_t __pyx_v_n;
+  double __pyx_v_resid;
+  __Pyx_memviewslice __pyx_v_out = { 0, 0, { 0 }, { 0 }, { 0 } };
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_1;
   PyObject *__pyx_t_2 = NULL;
-  int __pyx_t_3;
-  __Pyx_memviewslice __pyx_t_4 = { 0, 0, { 0 }, { 0 }, { 0 } };
-  __Pyx_memviewslice __pyx_t_5 = { 0, 0, { 0 }, { 0 }, { 0 } };
-  int __pyx_t_6;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  __Pyx_memviewslice __pyx_t_6 = { 0, 0, { 0 }, { 0 }, { 0 } };
   Py_ssize_t __pyx_t_7;
   Py_ssize_t __pyx_t_8;
   Py_ssize_t __pyx_t_9;
   Py_ssize_t __pyx_t_10;
   Py_ssize_t __pyx_t_11;
-  Py_ssize_t __pyx_t_12;
-  Py_ssize_t __pyx_t_13;
-  Py_ssize_t __pyx_t_14;
-  Py_ssize_t __pyx_t_15;
-  Py_ssize_t __pyx_t_16;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("_sparse_op_d", 1);
+  __Pyx_RefNannySetupContext("huber_grad", 1);
 
-  /* "sgimc/ops.pyx":473
- *                  double[::1] S,
- *                  int n_threads=1):
- *     cdef int errcode = -1             # <<<<<<<<<<<<<<
- *     cdef int n_1 = X.shape[0], n_2 = Z.shape[0]
- *     cdef int d_1 = X.shape[1], k = Z.shape[1]
+  /* "sgimc/ops.pyx":512
+ *         The residuals clipped to `[-epsilon, epsilon]`.
+ *     """
+ *     cdef Py_ssize_t i, n = predict.shape[0]             # <<<<<<<<<<<<<<
+ *     cdef double resid
+ * 
  */
-  __pyx_v_errcode = -1;
+  __pyx_v_n = (__pyx_v_predict.shape[0]);
 
-  /* "sgimc/ops.pyx":474
- *                  int n_threads=1):
- *     cdef int errcode = -1
- *     cdef int n_1 = X.shape[0], n_2 = Z.shape[0]             # <<<<<<<<<<<<<<
- *     cdef int d_1 = X.shape[1], k = Z.shape[1]
- *     cdef int[::1] Sp = R.indptr, Sj = R.indices
+  /* "sgimc/ops.pyx":515
+ *     cdef double resid
+ * 
+ *     if target.shape[0] != n:             # <<<<<<<<<<<<<<
+ *         raise TypeError("""`predict` and `target` must have equal length.""")
+ * 
  */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_X, __pyx_n_s_shape); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 474, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_GetItemInt(__pyx_t_1, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 474, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_3 = __Pyx_PyInt_As_int(__pyx_t_2); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 474, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_v_n_1 = __pyx_t_3;
-  __pyx_v_n_2 = (__pyx_v_Z.shape[0]);
+  __pyx_t_1 = ((__pyx_v_target.shape[0]) != __pyx_v_n);
+  if (unlikely(__pyx_t_1)) {
 
-  /* "sgimc/ops.pyx":475
- *     cdef int errcode = -1
- *     cdef int n_1 = X.shape[0], n_2 = Z.shape[0]
- *     cdef int d_1 = X.shape[1], k = Z.shape[1]             # <<<<<<<<<<<<<<
- *     cdef int[::1] Sp = R.indptr, Sj = R.indices
- *     cdef int[::1] Xp = X.indptr, Xj = X.indices
- */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_X, __pyx_n_s_shape); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 475, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_1 = __Pyx_GetItemInt(__pyx_t_2, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 475, __pyx_L1_error)
+    /* "sgimc/ops.pyx":516
+ * 
+ *     if target.shape[0] != n:
+ *         raise TypeError("""`predict` and `target` must have equal length.""")             # <<<<<<<<<<<<<<
+ * 
+ *     cdef double[::1] out = np.empty(n, dtype="double")
+ */
+    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__13, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 516, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __PYX_ERR(0, 516, __pyx_L1_error)
+
+    /* "sgimc/ops.pyx":515
+ *     cdef double resid
+ * 
+ *     if target.shape[0] != n:             # <<<<<<<<<<<<<<
+ *         raise TypeError("""`predict` and `target` must have equal length.""")
+ * 
+ */
+  }
+
+  /* "sgimc/ops.pyx":518
+ *         raise TypeError("""`predict` and `target` must have equal length.""")
+ * 
+ *     cdef double[::1] out = np.empty(n, dtype="double")             # <<<<<<<<<<<<<<
+ * 
+ *     with nogil:
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 518, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_empty); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 518, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = PyInt_FromSsize_t(__pyx_v_n); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 518, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 518, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_2);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_2)) __PYX_ERR(0, 518, __pyx_L1_error);
+  __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 518, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_t_2, __pyx_n_s_dtype, __pyx_n_s_double) < 0) __PYX_ERR(0, 518, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_4, __pyx_t_2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 518, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_6 = __Pyx_PyObject_to_MemoryviewSlice_dc_double(__pyx_t_5, PyBUF_WRITABLE); if (unlikely(!__pyx_t_6.memview)) __PYX_ERR(0, 518, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_v_out = __pyx_t_6;
+  __pyx_t_6.memview = NULL;
+  __pyx_t_6.data = NULL;
+
+  /* "sgimc/ops.pyx":520
+ *     cdef double[::1] out = np.empty(n, dtype="double")
+ * 
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for i in range(n):
+ *             resid = predict[i] - target[i]
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      _save = NULL;
+      Py_UNBLOCK_THREADS
+      __Pyx_FastGIL_Remember();
+      #endif
+      /*try:*/ {
+
+        /* "sgimc/ops.pyx":521
+ * 
+ *     with nogil:
+ *         for i in range(n):             # <<<<<<<<<<<<<<
+ *             resid = predict[i] - target[i]
+ *             if resid > epsilon:
+ */
+        __pyx_t_7 = __pyx_v_n;
+        __pyx_t_8 = __pyx_t_7;
+        for (__pyx_t_9 = 0; __pyx_t_9 < __pyx_t_8; __pyx_t_9+=1) {
+          __pyx_v_i = __pyx_t_9;
+
+          /* "sgimc/ops.pyx":522
+ *     with nogil:
+ *         for i in range(n):
+ *             resid = predict[i] - target[i]             # <<<<<<<<<<<<<<
+ *             if resid > epsilon:
+ *                 out[i] = epsilon
+ */
+          __pyx_t_10 = __pyx_v_i;
+          __pyx_t_11 = __pyx_v_i;
+          __pyx_v_resid = ((*((double const  *) ( /* dim=0 */ ((char *) (((double const  *) __pyx_v_predict.data) + __pyx_t_10)) ))) - (*((double const  *) ( /* dim=0 */ ((char *) (((double const  *) __pyx_v_target.data) + __pyx_t_11)) ))));
+
+          /* "sgimc/ops.pyx":523
+ *         for i in range(n):
+ *             resid = predict[i] - target[i]
+ *             if resid > epsilon:             # <<<<<<<<<<<<<<
+ *                 out[i] = epsilon
+ *             elif resid < -epsilon:
+ */
+          __pyx_t_1 = (__pyx_v_resid > __pyx_v_epsilon);
+          if (__pyx_t_1) {
+
+            /* "sgimc/ops.pyx":524
+ *             resid = predict[i] - target[i]
+ *             if resid > epsilon:
+ *                 out[i] = epsilon             # <<<<<<<<<<<<<<
+ *             elif resid < -epsilon:
+ *                 out[i] = -epsilon
+ */
+            __pyx_t_11 = __pyx_v_i;
+            *((double *) ( /* dim=0 */ ((char *) (((double *) __pyx_v_out.data) + __pyx_t_11)) )) = __pyx_v_epsilon;
+
+            /* "sgimc/ops.pyx":523
+ *         for i in range(n):
+ *             resid = predict[i] - target[i]
+ *             if resid > epsilon:             # <<<<<<<<<<<<<<
+ *                 out[i] = epsilon
+ *             elif resid < -epsilon:
+ */
+            goto __pyx_L9;
+          }
+
+          /* "sgimc/ops.pyx":525
+ *             if resid > epsilon:
+ *                 out[i] = epsilon
+ *             elif resid < -epsilon:             # <<<<<<<<<<<<<<
+ *                 out[i] = -epsilon
+ *             else:
+ */
+          __pyx_t_1 = (__pyx_v_resid < (-__pyx_v_epsilon));
+          if (__pyx_t_1) {
+
+            /* "sgimc/ops.pyx":526
+ *                 out[i] = epsilon
+ *             elif resid < -epsilon:
+ *                 out[i] = -epsilon             # <<<<<<<<<<<<<<
+ *             else:
+ *                 out[i] = resid
+ */
+            __pyx_t_11 = __pyx_v_i;
+            *((double *) ( /* dim=0 */ ((char *) (((double *) __pyx_v_out.data) + __pyx_t_11)) )) = (-__pyx_v_epsilon);
+
+            /* "sgimc/ops.pyx":525
+ *             if resid > epsilon:
+ *                 out[i] = epsilon
+ *             elif resid < -epsilon:             # <<<<<<<<<<<<<<
+ *                 out[i] = -epsilon
+ *             else:
+ */
+            goto __pyx_L9;
+          }
+
+          /* "sgimc/ops.pyx":528
+ *                 out[i] = -epsilon
+ *             else:
+ *                 out[i] = resid             # <<<<<<<<<<<<<<
+ *             # end if
+ *         # end for
+ */
+          /*else*/ {
+            __pyx_t_11 = __pyx_v_i;
+            *((double *) ( /* dim=0 */ ((char *) (((double *) __pyx_v_out.data) + __pyx_t_11)) )) = __pyx_v_resid;
+          }
+          __pyx_L9:;
+        }
+      }
+
+      /* "sgimc/ops.pyx":520
+ *     cdef double[::1] out = np.empty(n, dtype="double")
+ * 
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for i in range(n):
+ *             resid = predict[i] - target[i]
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          __Pyx_FastGIL_Forget();
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L6;
+        }
+        __pyx_L6:;
+      }
+  }
+
+  /* "sgimc/ops.pyx":533
+ *     # end with
+ * 
+ *     return out.base             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_5 = __pyx_memoryview_fromslice(__pyx_v_out, 1, (PyObject *(*)(char *)) __pyx_memview_get_double, (int (*)(char *, PyObject *)) __pyx_memview_set_double, 0);; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 533, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_base); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 533, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* "sgimc/ops.pyx":491
+ * 
+ * 
+ * def huber_grad(const double[::1] predict,             # <<<<<<<<<<<<<<
+ *                const double[::1] target,
+ *                double epsilon):
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_6, 1);
+  __Pyx_AddTraceback("sgimc.ops.huber_grad", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_out, 1);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "sgimc/ops.pyx":536
+ * 
+ * 
+ * def logistic_loss(const double[::1] logit, const double[::1] target):             # <<<<<<<<<<<<<<
+ *     """Compute the logistic loss `log(1 + exp(- target * logit))`.
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5sgimc_3ops_19logistic_loss(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_5sgimc_3ops_18logistic_loss, "Compute the logistic loss `log(1 + exp(- target * logit))`.\n\n    Parameters\n    ----------\n    logit : 1d array, shape = [n,]\n        The predicted log-odds.\n\n    target : 1d array, shape = [n,]\n        The `-1 / +1` labels.\n\n    Returns\n    -------\n    out : 1d array, shape = [n,]\n        The elementwise loss values.\n    ");
+static PyMethodDef __pyx_mdef_5sgimc_3ops_19logistic_loss = {"logistic_loss", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_5sgimc_3ops_19logistic_loss, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_5sgimc_3ops_18logistic_loss};
+static PyObject *__pyx_pw_5sgimc_3ops_19logistic_loss(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  __Pyx_memviewslice __pyx_v_logit = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_target = { 0, 0, { 0 }, { 0 }, { 0 } };
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[2] = {0,0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("logistic_loss (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_MACROS
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_logit,&__pyx_n_s_target,0};
+    if (__pyx_kwds) {
+      Py_ssize_t kw_args;
+      switch (__pyx_nargs) {
+        case  2: values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
+      switch (__pyx_nargs) {
+        case  0:
+        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_logit)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
+          kw_args--;
+        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 536, __pyx_L3_error)
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_target)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[1]);
+          kw_args--;
+        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 536, __pyx_L3_error)
+        else {
+          __Pyx_RaiseArgtupleInvalid("logistic_loss", 1, 2, 2, 1); __PYX_ERR(0, 536, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        const Py_ssize_t kwd_pos_args = __pyx_nargs;
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "logistic_loss") < 0)) __PYX_ERR(0, 536, __pyx_L3_error)
+      }
+    } else if (unlikely(__pyx_nargs != 2)) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+      values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
+    }
+    __pyx_v_logit = __Pyx_PyObject_to_MemoryviewSlice_dc_double__const__(values[0], 0); if (unlikely(!__pyx_v_logit.memview)) __PYX_ERR(0, 536, __pyx_L3_error)
+    __pyx_v_target = __Pyx_PyObject_to_MemoryviewSlice_dc_double__const__(values[1], 0); if (unlikely(!__pyx_v_target.memview)) __PYX_ERR(0, 536, __pyx_L3_error)
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("logistic_loss", 1, 2, 2, __pyx_nargs); __PYX_ERR(0, 536, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+    }
+  }
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_logit, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_target, 1);
+  __Pyx_AddTraceback("sgimc.ops.logistic_loss", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_5sgimc_3ops_18logistic_loss(__pyx_self, __pyx_v_logit, __pyx_v_target);
+
+  /* function exit code */
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_logit, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_target, 1);
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+    }
+  }
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5sgimc_3ops_18logistic_loss(CYTHON_UNUSED PyObject *__pyx_self, __Pyx_memviewslice __pyx_v_logit, __Pyx_memviewslice __pyx_v_target) {
+  Py_ssize_t __pyx_v_i;
+  Py_ssize_t __pyx_v_n;
+  double __pyx_v_margin;
+  __Pyx_memviewslice __pyx_v_out = { 0, 0, { 0 }, { 0 }, { 0 } };
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  __Pyx_memviewslice __pyx_t_6 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  Py_ssize_t __pyx_t_7;
+  Py_ssize_t __pyx_t_8;
+  Py_ssize_t __pyx_t_9;
+  Py_ssize_t __pyx_t_10;
+  Py_ssize_t __pyx_t_11;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("logistic_loss", 1);
+
+  /* "sgimc/ops.pyx":552
+ *         The elementwise loss values.
+ *     """
+ *     cdef Py_ssize_t i, n = logit.shape[0]             # <<<<<<<<<<<<<<
+ *     cdef double margin
+ * 
+ */
+  __pyx_v_n = (__pyx_v_logit.shape[0]);
+
+  /* "sgimc/ops.pyx":555
+ *     cdef double margin
+ * 
+ *     if target.shape[0] != n:             # <<<<<<<<<<<<<<
+ *         raise TypeError("""`logit` and `target` must have equal length.""")
+ * 
+ */
+  __pyx_t_1 = ((__pyx_v_target.shape[0]) != __pyx_v_n);
+  if (unlikely(__pyx_t_1)) {
+
+    /* "sgimc/ops.pyx":556
+ * 
+ *     if target.shape[0] != n:
+ *         raise TypeError("""`logit` and `target` must have equal length.""")             # <<<<<<<<<<<<<<
+ * 
+ *     cdef double[::1] out = np.empty(n, dtype="double")
+ */
+    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__14, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 556, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __PYX_ERR(0, 556, __pyx_L1_error)
+
+    /* "sgimc/ops.pyx":555
+ *     cdef double margin
+ * 
+ *     if target.shape[0] != n:             # <<<<<<<<<<<<<<
+ *         raise TypeError("""`logit` and `target` must have equal length.""")
+ * 
+ */
+  }
+
+  /* "sgimc/ops.pyx":558
+ *         raise TypeError("""`logit` and `target` must have equal length.""")
+ * 
+ *     cdef double[::1] out = np.empty(n, dtype="double")             # <<<<<<<<<<<<<<
+ * 
+ *     with nogil:
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 558, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_empty); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 558, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = PyInt_FromSsize_t(__pyx_v_n); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 558, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 558, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_2);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_2)) __PYX_ERR(0, 558, __pyx_L1_error);
+  __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 558, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_t_2, __pyx_n_s_dtype, __pyx_n_s_double) < 0) __PYX_ERR(0, 558, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_4, __pyx_t_2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 558, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_6 = __Pyx_PyObject_to_MemoryviewSlice_dc_double(__pyx_t_5, PyBUF_WRITABLE); if (unlikely(!__pyx_t_6.memview)) __PYX_ERR(0, 558, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_v_out = __pyx_t_6;
+  __pyx_t_6.memview = NULL;
+  __pyx_t_6.data = NULL;
+
+  /* "sgimc/ops.pyx":560
+ *     cdef double[::1] out = np.empty(n, dtype="double")
+ * 
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for i in range(n):
+ *             margin = - target[i] * logit[i]
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      _save = NULL;
+      Py_UNBLOCK_THREADS
+      __Pyx_FastGIL_Remember();
+      #endif
+      /*try:*/ {
+
+        /* "sgimc/ops.pyx":561
+ * 
+ *     with nogil:
+ *         for i in range(n):             # <<<<<<<<<<<<<<
+ *             margin = - target[i] * logit[i]
+ *             out[i] = log1p(exp(-fabs(margin)))
+ */
+        __pyx_t_7 = __pyx_v_n;
+        __pyx_t_8 = __pyx_t_7;
+        for (__pyx_t_9 = 0; __pyx_t_9 < __pyx_t_8; __pyx_t_9+=1) {
+          __pyx_v_i = __pyx_t_9;
+
+          /* "sgimc/ops.pyx":562
+ *     with nogil:
+ *         for i in range(n):
+ *             margin = - target[i] * logit[i]             # <<<<<<<<<<<<<<
+ *             out[i] = log1p(exp(-fabs(margin)))
+ *             if margin > 0:
+ */
+          __pyx_t_10 = __pyx_v_i;
+          __pyx_t_11 = __pyx_v_i;
+          __pyx_v_margin = ((-(*((double const  *) ( /* dim=0 */ ((char *) (((double const  *) __pyx_v_target.data) + __pyx_t_10)) )))) * (*((double const  *) ( /* dim=0 */ ((char *) (((double const  *) __pyx_v_logit.data) + __pyx_t_11)) ))));
+
+          /* "sgimc/ops.pyx":563
+ *         for i in range(n):
+ *             margin = - target[i] * logit[i]
+ *             out[i] = log1p(exp(-fabs(margin)))             # <<<<<<<<<<<<<<
+ *             if margin > 0:
+ *                 out[i] += margin
+ */
+          __pyx_t_11 = __pyx_v_i;
+          *((double *) ( /* dim=0 */ ((char *) (((double *) __pyx_v_out.data) + __pyx_t_11)) )) = log1p(exp((-fabs(__pyx_v_margin))));
+
+          /* "sgimc/ops.pyx":564
+ *             margin = - target[i] * logit[i]
+ *             out[i] = log1p(exp(-fabs(margin)))
+ *             if margin > 0:             # <<<<<<<<<<<<<<
+ *                 out[i] += margin
+ *             # end if
+ */
+          __pyx_t_1 = (__pyx_v_margin > 0.0);
+          if (__pyx_t_1) {
+
+            /* "sgimc/ops.pyx":565
+ *             out[i] = log1p(exp(-fabs(margin)))
+ *             if margin > 0:
+ *                 out[i] += margin             # <<<<<<<<<<<<<<
+ *             # end if
+ *         # end for
+ */
+            __pyx_t_11 = __pyx_v_i;
+            *((double *) ( /* dim=0 */ ((char *) (((double *) __pyx_v_out.data) + __pyx_t_11)) )) += __pyx_v_margin;
+
+            /* "sgimc/ops.pyx":564
+ *             margin = - target[i] * logit[i]
+ *             out[i] = log1p(exp(-fabs(margin)))
+ *             if margin > 0:             # <<<<<<<<<<<<<<
+ *                 out[i] += margin
+ *             # end if
+ */
+          }
+        }
+      }
+
+      /* "sgimc/ops.pyx":560
+ *     cdef double[::1] out = np.empty(n, dtype="double")
+ * 
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for i in range(n):
+ *             margin = - target[i] * logit[i]
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          __Pyx_FastGIL_Forget();
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L6;
+        }
+        __pyx_L6:;
+      }
+  }
+
+  /* "sgimc/ops.pyx":570
+ *     # end with
+ * 
+ *     return out.base             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_5 = __pyx_memoryview_fromslice(__pyx_v_out, 1, (PyObject *(*)(char *)) __pyx_memview_get_double, (int (*)(char *, PyObject *)) __pyx_memview_set_double, 0);; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 570, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_base); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 570, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* "sgimc/ops.pyx":536
+ * 
+ * 
+ * def logistic_loss(const double[::1] logit, const double[::1] target):             # <<<<<<<<<<<<<<
+ *     """Compute the logistic loss `log(1 + exp(- target * logit))`.
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_6, 1);
+  __Pyx_AddTraceback("sgimc.ops.logistic_loss", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_out, 1);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "sgimc/ops.pyx":573
+ * 
+ * 
+ * def logistic_grad(const double[::1] logit, const double[::1] target):             # <<<<<<<<<<<<<<
+ *     """Compute the derivative of the logistic loss w.r.t. `logit`.
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5sgimc_3ops_21logistic_grad(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_5sgimc_3ops_20logistic_grad, "Compute the derivative of the logistic loss w.r.t. `logit`.\n\n    Parameters\n    ----------\n    logit : 1d array, shape = [n,]\n        The predicted log-odds.\n\n    target : 1d array, shape = [n,]\n        The `-1 / +1` labels.\n\n    Returns\n    -------\n    out : 1d array, shape = [n,]\n        The values of `- target * sigmoid(- target * logit)`.\n    ");
+static PyMethodDef __pyx_mdef_5sgimc_3ops_21logistic_grad = {"logistic_grad", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_5sgimc_3ops_21logistic_grad, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_5sgimc_3ops_20logistic_grad};
+static PyObject *__pyx_pw_5sgimc_3ops_21logistic_grad(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  __Pyx_memviewslice __pyx_v_logit = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_target = { 0, 0, { 0 }, { 0 }, { 0 } };
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[2] = {0,0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("logistic_grad (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_MACROS
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_logit,&__pyx_n_s_target,0};
+    if (__pyx_kwds) {
+      Py_ssize_t kw_args;
+      switch (__pyx_nargs) {
+        case  2: values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
+      switch (__pyx_nargs) {
+        case  0:
+        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_logit)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
+          kw_args--;
+        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 573, __pyx_L3_error)
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_target)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[1]);
+          kw_args--;
+        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 573, __pyx_L3_error)
+        else {
+          __Pyx_RaiseArgtupleInvalid("logistic_grad", 1, 2, 2, 1); __PYX_ERR(0, 573, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        const Py_ssize_t kwd_pos_args = __pyx_nargs;
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "logistic_grad") < 0)) __PYX_ERR(0, 573, __pyx_L3_error)
+      }
+    } else if (unlikely(__pyx_nargs != 2)) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+      values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
+    }
+    __pyx_v_logit = __Pyx_PyObject_to_MemoryviewSlice_dc_double__const__(values[0], 0); if (unlikely(!__pyx_v_logit.memview)) __PYX_ERR(0, 573, __pyx_L3_error)
+    __pyx_v_target = __Pyx_PyObject_to_MemoryviewSlice_dc_double__const__(values[1], 0); if (unlikely(!__pyx_v_target.memview)) __PYX_ERR(0, 573, __pyx_L3_error)
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("logistic_grad", 1, 2, 2, __pyx_nargs); __PYX_ERR(0, 573, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+    }
+  }
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_logit, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_target, 1);
+  __Pyx_AddTraceback("sgimc.ops.logistic_grad", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_5sgimc_3ops_20logistic_grad(__pyx_self, __pyx_v_logit, __pyx_v_target);
+
+  /* function exit code */
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_logit, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_target, 1);
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+    }
+  }
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5sgimc_3ops_20logistic_grad(CYTHON_UNUSED PyObject *__pyx_self, __Pyx_memviewslice __pyx_v_logit, __Pyx_memviewslice __pyx_v_target) {
+  Py_ssize_t __pyx_v_i;
+  Py_ssize_t __pyx_v_n;
+  __Pyx_memviewslice __pyx_v_out = { 0, 0, { 0 }, { 0 }, { 0 } };
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  __Pyx_memviewslice __pyx_t_6 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  Py_ssize_t __pyx_t_7;
+  Py_ssize_t __pyx_t_8;
+  Py_ssize_t __pyx_t_9;
+  Py_ssize_t __pyx_t_10;
+  Py_ssize_t __pyx_t_11;
+  Py_ssize_t __pyx_t_12;
+  Py_ssize_t __pyx_t_13;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("logistic_grad", 1);
+
+  /* "sgimc/ops.pyx":589
+ *         The values of `- target * sigmoid(- target * logit)`.
+ *     """
+ *     cdef Py_ssize_t i, n = logit.shape[0]             # <<<<<<<<<<<<<<
+ * 
+ *     if target.shape[0] != n:
+ */
+  __pyx_v_n = (__pyx_v_logit.shape[0]);
+
+  /* "sgimc/ops.pyx":591
+ *     cdef Py_ssize_t i, n = logit.shape[0]
+ * 
+ *     if target.shape[0] != n:             # <<<<<<<<<<<<<<
+ *         raise TypeError("""`logit` and `target` must have equal length.""")
+ * 
+ */
+  __pyx_t_1 = ((__pyx_v_target.shape[0]) != __pyx_v_n);
+  if (unlikely(__pyx_t_1)) {
+
+    /* "sgimc/ops.pyx":592
+ * 
+ *     if target.shape[0] != n:
+ *         raise TypeError("""`logit` and `target` must have equal length.""")             # <<<<<<<<<<<<<<
+ * 
+ *     cdef double[::1] out = np.empty(n, dtype="double")
+ */
+    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__14, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 592, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __PYX_ERR(0, 592, __pyx_L1_error)
+
+    /* "sgimc/ops.pyx":591
+ *     cdef Py_ssize_t i, n = logit.shape[0]
+ * 
+ *     if target.shape[0] != n:             # <<<<<<<<<<<<<<
+ *         raise TypeError("""`logit` and `target` must have equal length.""")
+ * 
+ */
+  }
+
+  /* "sgimc/ops.pyx":594
+ *         raise TypeError("""`logit` and `target` must have equal length.""")
+ * 
+ *     cdef double[::1] out = np.empty(n, dtype="double")             # <<<<<<<<<<<<<<
+ * 
+ *     with nogil:
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 594, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_empty); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 594, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = PyInt_FromSsize_t(__pyx_v_n); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 594, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 594, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_2);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_2)) __PYX_ERR(0, 594, __pyx_L1_error);
+  __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 594, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_t_2, __pyx_n_s_dtype, __pyx_n_s_double) < 0) __PYX_ERR(0, 594, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_4, __pyx_t_2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 594, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_6 = __Pyx_PyObject_to_MemoryviewSlice_dc_double(__pyx_t_5, PyBUF_WRITABLE); if (unlikely(!__pyx_t_6.memview)) __PYX_ERR(0, 594, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_v_out = __pyx_t_6;
+  __pyx_t_6.memview = NULL;
+  __pyx_t_6.data = NULL;
+
+  /* "sgimc/ops.pyx":596
+ *     cdef double[::1] out = np.empty(n, dtype="double")
+ * 
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for i in range(n):
+ *             out[i] = - target[i] * sigmoid(- target[i] * logit[i])
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      _save = NULL;
+      Py_UNBLOCK_THREADS
+      __Pyx_FastGIL_Remember();
+      #endif
+      /*try:*/ {
+
+        /* "sgimc/ops.pyx":597
+ * 
+ *     with nogil:
+ *         for i in range(n):             # <<<<<<<<<<<<<<
+ *             out[i] = - target[i] * sigmoid(- target[i] * logit[i])
+ *         # end for
+ */
+        __pyx_t_7 = __pyx_v_n;
+        __pyx_t_8 = __pyx_t_7;
+        for (__pyx_t_9 = 0; __pyx_t_9 < __pyx_t_8; __pyx_t_9+=1) {
+          __pyx_v_i = __pyx_t_9;
+
+          /* "sgimc/ops.pyx":598
+ *     with nogil:
+ *         for i in range(n):
+ *             out[i] = - target[i] * sigmoid(- target[i] * logit[i])             # <<<<<<<<<<<<<<
+ *         # end for
+ *     # end with
+ */
+          __pyx_t_10 = __pyx_v_i;
+          __pyx_t_11 = __pyx_v_i;
+          __pyx_t_12 = __pyx_v_i;
+          __pyx_t_13 = __pyx_v_i;
+          *((double *) ( /* dim=0 */ ((char *) (((double *) __pyx_v_out.data) + __pyx_t_13)) )) = ((-(*((double const  *) ( /* dim=0 */ ((char *) (((double const  *) __pyx_v_target.data) + __pyx_t_10)) )))) * __pyx_f_5sgimc_3ops_sigmoid(((-(*((double const  *) ( /* dim=0 */ ((char *) (((double const  *) __pyx_v_target.data) + __pyx_t_11)) )))) * (*((double const  *) ( /* dim=0 */ ((char *) (((double const  *) __pyx_v_logit.data) + __pyx_t_12)) ))))));
+        }
+      }
+
+      /* "sgimc/ops.pyx":596
+ *     cdef double[::1] out = np.empty(n, dtype="double")
+ * 
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for i in range(n):
+ *             out[i] = - target[i] * sigmoid(- target[i] * logit[i])
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          __Pyx_FastGIL_Forget();
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L6;
+        }
+        __pyx_L6:;
+      }
+  }
+
+  /* "sgimc/ops.pyx":602
+ *     # end with
+ * 
+ *     return out.base             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_5 = __pyx_memoryview_fromslice(__pyx_v_out, 1, (PyObject *(*)(char *)) __pyx_memview_get_double, (int (*)(char *, PyObject *)) __pyx_memview_set_double, 0);; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 602, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_base); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 602, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* "sgimc/ops.pyx":573
+ * 
+ * 
+ * def logistic_grad(const double[::1] logit, const double[::1] target):             # <<<<<<<<<<<<<<
+ *     """Compute the derivative of the logistic loss w.r.t. `logit`.
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_6, 1);
+  __Pyx_AddTraceback("sgimc.ops.logistic_grad", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_out, 1);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "sgimc/ops.pyx":605
+ * 
+ * 
+ * def logistic_hess(const double[::1] logit):             # <<<<<<<<<<<<<<
+ *     """Compute the second derivative of the logistic loss w.r.t. `logit`.
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5sgimc_3ops_23logistic_hess(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_5sgimc_3ops_22logistic_hess, "Compute the second derivative of the logistic loss w.r.t. `logit`.\n\n    Parameters\n    ----------\n    logit : 1d array, shape = [n,]\n        The predicted log-odds.\n\n    Returns\n    -------\n    out : 1d array, shape = [n,]\n        The values of `p (1 - p)` with `p = sigmoid(logit)`.\n    ");
+static PyMethodDef __pyx_mdef_5sgimc_3ops_23logistic_hess = {"logistic_hess", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_5sgimc_3ops_23logistic_hess, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_5sgimc_3ops_22logistic_hess};
+static PyObject *__pyx_pw_5sgimc_3ops_23logistic_hess(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  __Pyx_memviewslice __pyx_v_logit = { 0, 0, { 0 }, { 0 }, { 0 } };
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[1] = {0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("logistic_hess (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_MACROS
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_logit,0};
+    if (__pyx_kwds) {
+      Py_ssize_t kw_args;
+      switch (__pyx_nargs) {
+        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
+      switch (__pyx_nargs) {
+        case  0:
+        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_logit)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
+          kw_args--;
+        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 605, __pyx_L3_error)
+        else goto __pyx_L5_argtuple_error;
+      }
+      if (unlikely(kw_args > 0)) {
+        const Py_ssize_t kwd_pos_args = __pyx_nargs;
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "logistic_hess") < 0)) __PYX_ERR(0, 605, __pyx_L3_error)
+      }
+    } else if (unlikely(__pyx_nargs != 1)) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+    }
+    __pyx_v_logit = __Pyx_PyObject_to_MemoryviewSlice_dc_double__const__(values[0], 0); if (unlikely(!__pyx_v_logit.memview)) __PYX_ERR(0, 605, __pyx_L3_error)
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("logistic_hess", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 605, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+    }
+  }
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_logit, 1);
+  __Pyx_AddTraceback("sgimc.ops.logistic_hess", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_5sgimc_3ops_22logistic_hess(__pyx_self, __pyx_v_logit);
+
+  /* function exit code */
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_logit, 1);
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+    }
+  }
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5sgimc_3ops_22logistic_hess(CYTHON_UNUSED PyObject *__pyx_self, __Pyx_memviewslice __pyx_v_logit) {
+  Py_ssize_t __pyx_v_i;
+  Py_ssize_t __pyx_v_n;
+  double __pyx_v_z;
+  __Pyx_memviewslice __pyx_v_out = { 0, 0, { 0 }, { 0 }, { 0 } };
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  __Pyx_memviewslice __pyx_t_5 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  Py_ssize_t __pyx_t_6;
+  Py_ssize_t __pyx_t_7;
+  Py_ssize_t __pyx_t_8;
+  Py_ssize_t __pyx_t_9;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("logistic_hess", 1);
+
+  /* "sgimc/ops.pyx":618
+ *         The values of `p (1 - p)` with `p = sigmoid(logit)`.
+ *     """
+ *     cdef Py_ssize_t i, n = logit.shape[0]             # <<<<<<<<<<<<<<
+ *     cdef double z
+ * 
+ */
+  __pyx_v_n = (__pyx_v_logit.shape[0]);
+
+  /* "sgimc/ops.pyx":621
+ *     cdef double z
+ * 
+ *     cdef double[::1] out = np.empty(n, dtype="double")             # <<<<<<<<<<<<<<
+ * 
+ *     with nogil:
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 621, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_empty); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 621, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyInt_FromSsize_t(__pyx_v_n); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 621, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 621, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_1);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_1)) __PYX_ERR(0, 621, __pyx_L1_error);
+  __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 621, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_dtype, __pyx_n_s_double) < 0) __PYX_ERR(0, 621, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_3, __pyx_t_1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 621, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_5 = __Pyx_PyObject_to_MemoryviewSlice_dc_double(__pyx_t_4, PyBUF_WRITABLE); if (unlikely(!__pyx_t_5.memview)) __PYX_ERR(0, 621, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_v_out = __pyx_t_5;
+  __pyx_t_5.memview = NULL;
+  __pyx_t_5.data = NULL;
+
+  /* "sgimc/ops.pyx":623
+ *     cdef double[::1] out = np.empty(n, dtype="double")
+ * 
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for i in range(n):
+ *             # p (1 - p) = e / (1 + e)^2 with e = exp(-|logit|) never overflows
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      _save = NULL;
+      Py_UNBLOCK_THREADS
+      __Pyx_FastGIL_Remember();
+      #endif
+      /*try:*/ {
+
+        /* "sgimc/ops.pyx":624
+ * 
+ *     with nogil:
+ *         for i in range(n):             # <<<<<<<<<<<<<<
+ *             # p (1 - p) = e / (1 + e)^2 with e = exp(-|logit|) never overflows
+ *             z = exp(-fabs(logit[i]))
+ */
+        __pyx_t_6 = __pyx_v_n;
+        __pyx_t_7 = __pyx_t_6;
+        for (__pyx_t_8 = 0; __pyx_t_8 < __pyx_t_7; __pyx_t_8+=1) {
+          __pyx_v_i = __pyx_t_8;
+
+          /* "sgimc/ops.pyx":626
+ *         for i in range(n):
+ *             # p (1 - p) = e / (1 + e)^2 with e = exp(-|logit|) never overflows
+ *             z = exp(-fabs(logit[i]))             # <<<<<<<<<<<<<<
+ *             out[i] = z / ((1. + z) * (1. + z))
+ *         # end for
+ */
+          __pyx_t_9 = __pyx_v_i;
+          __pyx_v_z = exp((-fabs((*((double const  *) ( /* dim=0 */ ((char *) (((double const  *) __pyx_v_logit.data) + __pyx_t_9)) ))))));
+
+          /* "sgimc/ops.pyx":627
+ *             # p (1 - p) = e / (1 + e)^2 with e = exp(-|logit|) never overflows
+ *             z = exp(-fabs(logit[i]))
+ *             out[i] = z / ((1. + z) * (1. + z))             # <<<<<<<<<<<<<<
+ *         # end for
+ *     # end with
+ */
+          __pyx_t_9 = __pyx_v_i;
+          *((double *) ( /* dim=0 */ ((char *) (((double *) __pyx_v_out.data) + __pyx_t_9)) )) = (__pyx_v_z / ((1. + __pyx_v_z) * (1. + __pyx_v_z)));
+        }
+      }
+
+      /* "sgimc/ops.pyx":623
+ *     cdef double[::1] out = np.empty(n, dtype="double")
+ * 
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for i in range(n):
+ *             # p (1 - p) = e / (1 + e)^2 with e = exp(-|logit|) never overflows
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          __Pyx_FastGIL_Forget();
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L5;
+        }
+        __pyx_L5:;
+      }
+  }
+
+  /* "sgimc/ops.pyx":631
+ *     # end with
+ * 
+ *     return out.base             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_4 = __pyx_memoryview_fromslice(__pyx_v_out, 1, (PyObject *(*)(char *)) __pyx_memview_get_double, (int (*)(char *, PyObject *)) __pyx_memview_set_double, 0);; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 631, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_base); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 631, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "sgimc/ops.pyx":605
+ * 
+ * 
+ * def logistic_hess(const double[::1] logit):             # <<<<<<<<<<<<<<
+ *     """Compute the second derivative of the logistic loss w.r.t. `logit`.
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_5, 1);
+  __Pyx_AddTraceback("sgimc.ops.logistic_hess", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_out, 1);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "sgimc/ops.pyx":634
+ * 
+ * 
+ * def _dense_op_d(object R,             # <<<<<<<<<<<<<<
+ *                 double[:, ::1] X,
+ *                 double[:, ::1] Z,
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5sgimc_3ops_25_dense_op_d(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static PyMethodDef __pyx_mdef_5sgimc_3ops_25_dense_op_d = {"_dense_op_d", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_5sgimc_3ops_25_dense_op_d, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_5sgimc_3ops_25_dense_op_d(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  PyObject *__pyx_v_R = 0;
+  __Pyx_memviewslice __pyx_v_X = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_Z = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_D = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_S = { 0, 0, { 0 }, { 0 }, { 0 } };
+  int __pyx_v_n_threads;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[6] = {0,0,0,0,0,0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("_dense_op_d (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_MACROS
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_R,&__pyx_n_s_X,&__pyx_n_s_Z,&__pyx_n_s_D,&__pyx_n_s_S,&__pyx_n_s_n_threads,0};
+    if (__pyx_kwds) {
+      Py_ssize_t kw_args;
+      switch (__pyx_nargs) {
+        case  6: values[5] = __Pyx_Arg_FASTCALL(__pyx_args, 5);
+        CYTHON_FALLTHROUGH;
+        case  5: values[4] = __Pyx_Arg_FASTCALL(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
+        case  4: values[3] = __Pyx_Arg_FASTCALL(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = __Pyx_Arg_FASTCALL(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
+      switch (__pyx_nargs) {
+        case  0:
+        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_R)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
+          kw_args--;
+        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 634, __pyx_L3_error)
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_X)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[1]);
+          kw_args--;
+        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 634, __pyx_L3_error)
+        else {
+          __Pyx_RaiseArgtupleInvalid("_dense_op_d", 0, 5, 6, 1); __PYX_ERR(0, 634, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_Z)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[2]);
+          kw_args--;
+        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 634, __pyx_L3_error)
+        else {
+          __Pyx_RaiseArgtupleInvalid("_dense_op_d", 0, 5, 6, 2); __PYX_ERR(0, 634, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (likely((values[3] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_D)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[3]);
+          kw_args--;
+        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 634, __pyx_L3_error)
+        else {
+          __Pyx_RaiseArgtupleInvalid("_dense_op_d", 0, 5, 6, 3); __PYX_ERR(0, 634, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  4:
+        if (likely((values[4] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_S)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[4]);
+          kw_args--;
+        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 634, __pyx_L3_error)
+        else {
+          __Pyx_RaiseArgtupleInvalid("_dense_op_d", 0, 5, 6, 4); __PYX_ERR(0, 634, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  5:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_n_threads);
+          if (value) { values[5] = __Pyx_Arg_NewRef_FASTCALL(value); kw_args--; }
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 634, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        const Py_ssize_t kwd_pos_args = __pyx_nargs;
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "_dense_op_d") < 0)) __PYX_ERR(0, 634, __pyx_L3_error)
+      }
+    } else {
+      switch (__pyx_nargs) {
+        case  6: values[5] = __Pyx_Arg_FASTCALL(__pyx_args, 5);
+        CYTHON_FALLTHROUGH;
+        case  5: values[4] = __Pyx_Arg_FASTCALL(__pyx_args, 4);
+        values[3] = __Pyx_Arg_FASTCALL(__pyx_args, 3);
+        values[2] = __Pyx_Arg_FASTCALL(__pyx_args, 2);
+        values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
+        values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_R = values[0];
+    __pyx_v_X = __Pyx_PyObject_to_MemoryviewSlice_d_dc_double(values[1], PyBUF_WRITABLE); if (unlikely(!__pyx_v_X.memview)) __PYX_ERR(0, 635, __pyx_L3_error)
+    __pyx_v_Z = __Pyx_PyObject_to_MemoryviewSlice_d_dc_double(values[2], PyBUF_WRITABLE); if (unlikely(!__pyx_v_Z.memview)) __PYX_ERR(0, 636, __pyx_L3_error)
+    __pyx_v_D = __Pyx_PyObject_to_MemoryviewSlice_d_dc_double(values[3], PyBUF_WRITABLE); if (unlikely(!__pyx_v_D.memview)) __PYX_ERR(0, 637, __pyx_L3_error)
+    __pyx_v_S = __Pyx_PyObject_to_MemoryviewSlice_dc_double(values[4], PyBUF_WRITABLE); if (unlikely(!__pyx_v_S.memview)) __PYX_ERR(0, 638, __pyx_L3_error)
+    if (values[5]) {
+      __pyx_v_n_threads = __Pyx_PyInt_As_int(values[5]); if (unlikely((__pyx_v_n_threads == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 639, __pyx_L3_error)
+    } else {
+      __pyx_v_n_threads = ((int)((int)1));
+    }
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("_dense_op_d", 0, 5, 6, __pyx_nargs); __PYX_ERR(0, 634, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+    }
+  }
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_X, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_Z, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_D, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_S, 1);
+  __Pyx_AddTraceback("sgimc.ops._dense_op_d", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_5sgimc_3ops_24_dense_op_d(__pyx_self, __pyx_v_R, __pyx_v_X, __pyx_v_Z, __pyx_v_D, __pyx_v_S, __pyx_v_n_threads);
+
+  /* function exit code */
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_X, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_Z, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_D, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_S, 1);
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+    }
+  }
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5sgimc_3ops_24_dense_op_d(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_R, __Pyx_memviewslice __pyx_v_X, __Pyx_memviewslice __pyx_v_Z, __Pyx_memviewslice __pyx_v_D, __Pyx_memviewslice __pyx_v_S, int __pyx_v_n_threads) {
+  int __pyx_v_errcode;
+  int __pyx_v_n_1;
+  int __pyx_v_n_2;
+  int __pyx_v_d_1;
+  int __pyx_v_k;
+  __Pyx_memviewslice __pyx_v_Sp = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_Sj = { 0, 0, { 0 }, { 0 }, { 0 } };
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  __Pyx_memviewslice __pyx_t_2 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  int __pyx_t_3;
+  Py_ssize_t __pyx_t_4;
+  Py_ssize_t __pyx_t_5;
+  Py_ssize_t __pyx_t_6;
+  Py_ssize_t __pyx_t_7;
+  Py_ssize_t __pyx_t_8;
+  Py_ssize_t __pyx_t_9;
+  Py_ssize_t __pyx_t_10;
+  Py_ssize_t __pyx_t_11;
+  Py_ssize_t __pyx_t_12;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("_dense_op_d", 1);
+
+  /* "sgimc/ops.pyx":640
+ *                 double[::1] S,
+ *                 int n_threads=1):
+ *     cdef int errcode = -1             # <<<<<<<<<<<<<<
+ *     cdef int n_1 = X.shape[0], n_2 = Z.shape[0]
+ *     cdef int d_1 = X.shape[1], k = Z.shape[1]
+ */
+  __pyx_v_errcode = -1;
+
+  /* "sgimc/ops.pyx":641
+ *                 int n_threads=1):
+ *     cdef int errcode = -1
+ *     cdef int n_1 = X.shape[0], n_2 = Z.shape[0]             # <<<<<<<<<<<<<<
+ *     cdef int d_1 = X.shape[1], k = Z.shape[1]
+ *     cdef int[::1] Sp = R.indptr, Sj = R.indices
+ */
+  __pyx_v_n_1 = (__pyx_v_X.shape[0]);
+  __pyx_v_n_2 = (__pyx_v_Z.shape[0]);
+
+  /* "sgimc/ops.pyx":642
+ *     cdef int errcode = -1
+ *     cdef int n_1 = X.shape[0], n_2 = Z.shape[0]
+ *     cdef int d_1 = X.shape[1], k = Z.shape[1]             # <<<<<<<<<<<<<<
+ *     cdef int[::1] Sp = R.indptr, Sj = R.indices
+ * 
+ */
+  __pyx_v_d_1 = (__pyx_v_X.shape[1]);
+  __pyx_v_k = (__pyx_v_Z.shape[1]);
+
+  /* "sgimc/ops.pyx":643
+ *     cdef int n_1 = X.shape[0], n_2 = Z.shape[0]
+ *     cdef int d_1 = X.shape[1], k = Z.shape[1]
+ *     cdef int[::1] Sp = R.indptr, Sj = R.indices             # <<<<<<<<<<<<<<
+ * 
+ *     if n_threads != 1:
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_R, __pyx_n_s_indptr); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 643, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(__pyx_t_1, PyBUF_WRITABLE); if (unlikely(!__pyx_t_2.memview)) __PYX_ERR(0, 643, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v_Sp = __pyx_t_2;
+  __pyx_t_2.memview = NULL;
+  __pyx_t_2.data = NULL;
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_R, __pyx_n_s_indices); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 643, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(__pyx_t_1, PyBUF_WRITABLE); if (unlikely(!__pyx_t_2.memview)) __PYX_ERR(0, 643, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v_Sj = __pyx_t_2;
+  __pyx_t_2.memview = NULL;
+  __pyx_t_2.data = NULL;
+
+  /* "sgimc/ops.pyx":645
+ *     cdef int[::1] Sp = R.indptr, Sj = R.indices
+ * 
+ *     if n_threads != 1:             # <<<<<<<<<<<<<<
+ *         errcode = __omp_dense_op_d(
+ *             n_1, d_1, &X[0, 0],
+ */
+  __pyx_t_3 = (__pyx_v_n_threads != 1);
+  if (__pyx_t_3) {
+
+    /* "sgimc/ops.pyx":647
+ *     if n_threads != 1:
+ *         errcode = __omp_dense_op_d(
+ *             n_1, d_1, &X[0, 0],             # <<<<<<<<<<<<<<
+ *             n_2, k, &Z[0, 0],
+ *             &D[0, 0],
+ */
+    __pyx_t_4 = 0;
+    __pyx_t_5 = 0;
+
+    /* "sgimc/ops.pyx":648
+ *         errcode = __omp_dense_op_d(
+ *             n_1, d_1, &X[0, 0],
+ *             n_2, k, &Z[0, 0],             # <<<<<<<<<<<<<<
+ *             &D[0, 0],
+ *             &Sp[0], &Sj[0], &S[0],
+ */
+    __pyx_t_6 = 0;
+    __pyx_t_7 = 0;
+
+    /* "sgimc/ops.pyx":649
+ *             n_1, d_1, &X[0, 0],
+ *             n_2, k, &Z[0, 0],
+ *             &D[0, 0],             # <<<<<<<<<<<<<<
+ *             &Sp[0], &Sj[0], &S[0],
+ *             n_threads)
+ */
+    __pyx_t_8 = 0;
+    __pyx_t_9 = 0;
+
+    /* "sgimc/ops.pyx":650
+ *             n_2, k, &Z[0, 0],
+ *             &D[0, 0],
+ *             &Sp[0], &Sj[0], &S[0],             # <<<<<<<<<<<<<<
+ *             n_threads)
+ *     else:
+ */
+    __pyx_t_10 = 0;
+    __pyx_t_11 = 0;
+    __pyx_t_12 = 0;
+
+    /* "sgimc/ops.pyx":646
+ * 
+ *     if n_threads != 1:
+ *         errcode = __omp_dense_op_d(             # <<<<<<<<<<<<<<
+ *             n_1, d_1, &X[0, 0],
+ *             n_2, k, &Z[0, 0],
+ */
+    __pyx_v_errcode = omp_dense_op_d(__pyx_v_n_1, __pyx_v_d_1, (&(*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_X.data + __pyx_t_4 * __pyx_v_X.strides[0]) )) + __pyx_t_5)) )))), __pyx_v_n_2, __pyx_v_k, (&(*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_Z.data + __pyx_t_6 * __pyx_v_Z.strides[0]) )) + __pyx_t_7)) )))), (&(*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_D.data + __pyx_t_8 * __pyx_v_D.strides[0]) )) + __pyx_t_9)) )))), (&(*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_Sp.data) + __pyx_t_10)) )))), (&(*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_Sj.data) + __pyx_t_11)) )))), (&(*((double *) ( /* dim=0 */ ((char *) (((double *) __pyx_v_S.data) + __pyx_t_12)) )))), __pyx_v_n_threads);
+
+    /* "sgimc/ops.pyx":645
+ *     cdef int[::1] Sp = R.indptr, Sj = R.indices
+ * 
+ *     if n_threads != 1:             # <<<<<<<<<<<<<<
+ *         errcode = __omp_dense_op_d(
+ *             n_1, d_1, &X[0, 0],
+ */
+    goto __pyx_L3;
+  }
+
+  /* "sgimc/ops.pyx":653
+ *             n_threads)
+ *     else:
+ *         errcode = __op_dense_d(             # <<<<<<<<<<<<<<
+ *             n_1, d_1, &X[0, 0],
+ *             n_2, k, &Z[0, 0],
+ */
+  /*else*/ {
+
+    /* "sgimc/ops.pyx":654
+ *     else:
+ *         errcode = __op_dense_d(
+ *             n_1, d_1, &X[0, 0],             # <<<<<<<<<<<<<<
+ *             n_2, k, &Z[0, 0],
+ *             &D[0, 0],
+ */
+    __pyx_t_12 = 0;
+    __pyx_t_11 = 0;
+
+    /* "sgimc/ops.pyx":655
+ *         errcode = __op_dense_d(
+ *             n_1, d_1, &X[0, 0],
+ *             n_2, k, &Z[0, 0],             # <<<<<<<<<<<<<<
+ *             &D[0, 0],
+ *             &Sp[0], &Sj[0], &S[0])
+ */
+    __pyx_t_10 = 0;
+    __pyx_t_9 = 0;
+
+    /* "sgimc/ops.pyx":656
+ *             n_1, d_1, &X[0, 0],
+ *             n_2, k, &Z[0, 0],
+ *             &D[0, 0],             # <<<<<<<<<<<<<<
+ *             &Sp[0], &Sj[0], &S[0])
+ *     # end if
+ */
+    __pyx_t_8 = 0;
+    __pyx_t_7 = 0;
+
+    /* "sgimc/ops.pyx":657
+ *             n_2, k, &Z[0, 0],
+ *             &D[0, 0],
+ *             &Sp[0], &Sj[0], &S[0])             # <<<<<<<<<<<<<<
+ *     # end if
+ * 
+ */
+    __pyx_t_6 = 0;
+    __pyx_t_5 = 0;
+    __pyx_t_4 = 0;
+
+    /* "sgimc/ops.pyx":653
+ *             n_threads)
+ *     else:
+ *         errcode = __op_dense_d(             # <<<<<<<<<<<<<<
+ *             n_1, d_1, &X[0, 0],
+ *             n_2, k, &Z[0, 0],
+ */
+    __pyx_v_errcode = dense_op_d(__pyx_v_n_1, __pyx_v_d_1, (&(*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_X.data + __pyx_t_12 * __pyx_v_X.strides[0]) )) + __pyx_t_11)) )))), __pyx_v_n_2, __pyx_v_k, (&(*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_Z.data + __pyx_t_10 * __pyx_v_Z.strides[0]) )) + __pyx_t_9)) )))), (&(*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_D.data + __pyx_t_8 * __pyx_v_D.strides[0]) )) + __pyx_t_7)) )))), (&(*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_Sp.data) + __pyx_t_6)) )))), (&(*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_Sj.data) + __pyx_t_5)) )))), (&(*((double *) ( /* dim=0 */ ((char *) (((double *) __pyx_v_S.data) + __pyx_t_4)) )))));
+  }
+  __pyx_L3:;
+
+  /* "sgimc/ops.pyx":660
+ *     # end if
+ * 
+ *     return errcode             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_errcode); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 660, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "sgimc/ops.pyx":634
+ * 
+ * 
+ * def _dense_op_d(object R,             # <<<<<<<<<<<<<<
+ *                 double[:, ::1] X,
+ *                 double[:, ::1] Z,
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_2, 1);
+  __Pyx_AddTraceback("sgimc.ops._dense_op_d", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_Sp, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_Sj, 1);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "sgimc/ops.pyx":663
+ * 
+ * 
+ * def _sparse_op_d(object R,             # <<<<<<<<<<<<<<
+ *                  object X,
+ *                  double[:, ::1] Z,
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5sgimc_3ops_27_sparse_op_d(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static PyMethodDef __pyx_mdef_5sgimc_3ops_27_sparse_op_d = {"_sparse_op_d", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_5sgimc_3ops_27_sparse_op_d, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_5sgimc_3ops_27_sparse_op_d(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  PyObject *__pyx_v_R = 0;
+  PyObject *__pyx_v_X = 0;
+  __Pyx_memviewslice __pyx_v_Z = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_D = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_S = { 0, 0, { 0 }, { 0 }, { 0 } };
+  int __pyx_v_n_threads;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[6] = {0,0,0,0,0,0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("_sparse_op_d (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_MACROS
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_R,&__pyx_n_s_X,&__pyx_n_s_Z,&__pyx_n_s_D,&__pyx_n_s_S,&__pyx_n_s_n_threads,0};
+    if (__pyx_kwds) {
+      Py_ssize_t kw_args;
+      switch (__pyx_nargs) {
+        case  6: values[5] = __Pyx_Arg_FASTCALL(__pyx_args, 5);
+        CYTHON_FALLTHROUGH;
+        case  5: values[4] = __Pyx_Arg_FASTCALL(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
+        case  4: values[3] = __Pyx_Arg_FASTCALL(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = __Pyx_Arg_FASTCALL(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
+      switch (__pyx_nargs) {
+        case  0:
+        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_R)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
+          kw_args--;
+        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 663, __pyx_L3_error)
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_X)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[1]);
+          kw_args--;
+        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 663, __pyx_L3_error)
+        else {
+          __Pyx_RaiseArgtupleInvalid("_sparse_op_d", 0, 5, 6, 1); __PYX_ERR(0, 663, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_Z)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[2]);
+          kw_args--;
+        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 663, __pyx_L3_error)
+        else {
+          __Pyx_RaiseArgtupleInvalid("_sparse_op_d", 0, 5, 6, 2); __PYX_ERR(0, 663, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (likely((values[3] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_D)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[3]);
+          kw_args--;
+        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 663, __pyx_L3_error)
+        else {
+          __Pyx_RaiseArgtupleInvalid("_sparse_op_d", 0, 5, 6, 3); __PYX_ERR(0, 663, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  4:
+        if (likely((values[4] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_S)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[4]);
+          kw_args--;
+        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 663, __pyx_L3_error)
+        else {
+          __Pyx_RaiseArgtupleInvalid("_sparse_op_d", 0, 5, 6, 4); __PYX_ERR(0, 663, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  5:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_n_threads);
+          if (value) { values[5] = __Pyx_Arg_NewRef_FASTCALL(value); kw_args--; }
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 663, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        const Py_ssize_t kwd_pos_args = __pyx_nargs;
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "_sparse_op_d") < 0)) __PYX_ERR(0, 663, __pyx_L3_error)
+      }
+    } else {
+      switch (__pyx_nargs) {
+        case  6: values[5] = __Pyx_Arg_FASTCALL(__pyx_args, 5);
+        CYTHON_FALLTHROUGH;
+        case  5: values[4] = __Pyx_Arg_FASTCALL(__pyx_args, 4);
+        values[3] = __Pyx_Arg_FASTCALL(__pyx_args, 3);
+        values[2] = __Pyx_Arg_FASTCALL(__pyx_args, 2);
+        values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
+        values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_R = values[0];
+    __pyx_v_X = values[1];
+    __pyx_v_Z = __Pyx_PyObject_to_MemoryviewSlice_d_dc_double(values[2], PyBUF_WRITABLE); if (unlikely(!__pyx_v_Z.memview)) __PYX_ERR(0, 665, __pyx_L3_error)
+    __pyx_v_D = __Pyx_PyObject_to_MemoryviewSlice_d_dc_double(values[3], PyBUF_WRITABLE); if (unlikely(!__pyx_v_D.memview)) __PYX_ERR(0, 666, __pyx_L3_error)
+    __pyx_v_S = __Pyx_PyObject_to_MemoryviewSlice_dc_double(values[4], PyBUF_WRITABLE); if (unlikely(!__pyx_v_S.memview)) __PYX_ERR(0, 667, __pyx_L3_error)
+    if (values[5]) {
+      __pyx_v_n_threads = __Pyx_PyInt_As_int(values[5]); if (unlikely((__pyx_v_n_threads == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 668, __pyx_L3_error)
+    } else {
+      __pyx_v_n_threads = ((int)((int)1));
+    }
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("_sparse_op_d", 0, 5, 6, __pyx_nargs); __PYX_ERR(0, 663, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+    }
+  }
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_Z, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_D, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_S, 1);
+  __Pyx_AddTraceback("sgimc.ops._sparse_op_d", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_5sgimc_3ops_26_sparse_op_d(__pyx_self, __pyx_v_R, __pyx_v_X, __pyx_v_Z, __pyx_v_D, __pyx_v_S, __pyx_v_n_threads);
+
+  /* function exit code */
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_Z, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_D, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_S, 1);
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+    }
+  }
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5sgimc_3ops_26_sparse_op_d(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_R, PyObject *__pyx_v_X, __Pyx_memviewslice __pyx_v_Z, __Pyx_memviewslice __pyx_v_D, __Pyx_memviewslice __pyx_v_S, int __pyx_v_n_threads) {
+  int __pyx_v_errcode;
+  int __pyx_v_n_1;
+  int __pyx_v_n_2;
+  int __pyx_v_d_1;
+  int __pyx_v_k;
+  __Pyx_memviewslice __pyx_v_Sp = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_Sj = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_Xp = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_Xj = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_Xx = { 0, 0, { 0 }, { 0 }, { 0 } };
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_t_3;
+  __Pyx_memviewslice __pyx_t_4 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_t_5 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  int __pyx_t_6;
+  Py_ssize_t __pyx_t_7;
+  Py_ssize_t __pyx_t_8;
+  Py_ssize_t __pyx_t_9;
+  Py_ssize_t __pyx_t_10;
+  Py_ssize_t __pyx_t_11;
+  Py_ssize_t __pyx_t_12;
+  Py_ssize_t __pyx_t_13;
+  Py_ssize_t __pyx_t_14;
+  Py_ssize_t __pyx_t_15;
+  Py_ssize_t __pyx_t_16;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("_sparse_op_d", 1);
+
+  /* "sgimc/ops.pyx":669
+ *                  double[::1] S,
+ *                  int n_threads=1):
+ *     cdef int errcode = -1             # <<<<<<<<<<<<<<
+ *     cdef int n_1 = X.shape[0], n_2 = Z.shape[0]
+ *     cdef int d_1 = X.shape[1], k = Z.shape[1]
+ */
+  __pyx_v_errcode = -1;
+
+  /* "sgimc/ops.pyx":670
+ *                  int n_threads=1):
+ *     cdef int errcode = -1
+ *     cdef int n_1 = X.shape[0], n_2 = Z.shape[0]             # <<<<<<<<<<<<<<
+ *     cdef int d_1 = X.shape[1], k = Z.shape[1]
+ *     cdef int[::1] Sp = R.indptr, Sj = R.indices
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_X, __pyx_n_s_shape); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 670, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_GetItemInt(__pyx_t_1, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 670, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_3 = __Pyx_PyInt_As_int(__pyx_t_2); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 670, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_v_n_1 = __pyx_t_3;
+  __pyx_v_n_2 = (__pyx_v_Z.shape[0]);
+
+  /* "sgimc/ops.pyx":671
+ *     cdef int errcode = -1
+ *     cdef int n_1 = X.shape[0], n_2 = Z.shape[0]
+ *     cdef int d_1 = X.shape[1], k = Z.shape[1]             # <<<<<<<<<<<<<<
+ *     cdef int[::1] Sp = R.indptr, Sj = R.indices
+ *     cdef int[::1] Xp = X.indptr, Xj = X.indices
+ */
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_X, __pyx_n_s_shape); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 671, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_1 = __Pyx_GetItemInt(__pyx_t_2, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 671, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_3 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 475, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 671, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_v_d_1 = __pyx_t_3;
   __pyx_v_k = (__pyx_v_Z.shape[1]);
 
-  /* "sgimc/ops.pyx":476
+  /* "sgimc/ops.pyx":672
  *     cdef int n_1 = X.shape[0], n_2 = Z.shape[0]
  *     cdef int d_1 = X.shape[1], k = Z.shape[1]
  *     cdef int[::1] Sp = R.indptr, Sj = R.indices             # <<<<<<<<<<<<<<
  *     cdef int[::1] Xp = X.indptr, Xj = X.indices
  *     cdef double[::1] Xx = X.data
  */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_R, __pyx_n_s_indptr); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 476, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_R, __pyx_n_s_indptr); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 672, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_4 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(__pyx_t_1, PyBUF_WRITABLE); if (unlikely(!__pyx_t_4.memview)) __PYX_ERR(0, 476, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(__pyx_t_1, PyBUF_WRITABLE); if (unlikely(!__pyx_t_4.memview)) __PYX_ERR(0, 672, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_v_Sp = __pyx_t_4;
   __pyx_t_4.memview = NULL;
   __pyx_t_4.data = NULL;
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_R, __pyx_n_s_indices); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 476, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_R, __pyx_n_s_indices); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 672, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_4 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(__pyx_t_1, PyBUF_WRITABLE); if (unlikely(!__pyx_t_4.memview)) __PYX_ERR(0, 476, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(__pyx_t_1, PyBUF_WRITABLE); if (unlikely(!__pyx_t_4.memview)) __PYX_ERR(0, 672, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_v_Sj = __pyx_t_4;
   __pyx_t_4.memview = NULL;
   __pyx_t_4.data = NULL;
 
-  /* "sgimc/ops.pyx":477
+  /* "sgimc/ops.pyx":673
  *     cdef int d_1 = X.shape[1], k = Z.shape[1]
  *     cdef int[::1] Sp = R.indptr, Sj = R.indices
  *     cdef int[::1] Xp = X.indptr, Xj = X.indices             # <<<<<<<<<<<<<<
  *     cdef double[::1] Xx = X.data
  * 
  */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_X, __pyx_n_s_indptr); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 477, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_X, __pyx_n_s_indptr); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 673, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_4 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(__pyx_t_1, PyBUF_WRITABLE); if (unlikely(!__pyx_t_4.memview)) __PYX_ERR(0, 477, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(__pyx_t_1, PyBUF_WRITABLE); if (unlikely(!__pyx_t_4.memview)) __PYX_ERR(0, 673, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_v_Xp = __pyx_t_4;
   __pyx_t_4.memview = NULL;
   __pyx_t_4.data = NULL;
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_X, __pyx_n_s_indices); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 477, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_X, __pyx_n_s_indices); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 673, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_4 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(__pyx_t_1, PyBUF_WRITABLE); if (unlikely(!__pyx_t_4.memview)) __PYX_ERR(0, 477, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(__pyx_t_1, PyBUF_WRITABLE); if (unlikely(!__pyx_t_4.memview)) __PYX_ERR(0, 673, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_v_Xj = __pyx_t_4;
   __pyx_t_4.memview = NULL;
   __pyx_t_4.data = NULL;
 
-  /* "sgimc/ops.pyx":478
+  /* "sgimc/ops.pyx":674
  *     cdef int[::1] Sp = R.indptr, Sj = R.indices
  *     cdef int[::1] Xp = X.indptr, Xj = X.indices
  *     cdef double[::1] Xx = X.data             # <<<<<<<<<<<<<<
  * 
  *     if n_threads != 1:
  */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_X, __pyx_n_s_data); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 478, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_X, __pyx_n_s_data); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 674, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_5 = __Pyx_PyObject_to_MemoryviewSlice_dc_double(__pyx_t_1, PyBUF_WRITABLE); if (unlikely(!__pyx_t_5.memview)) __PYX_ERR(0, 478, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_to_MemoryviewSlice_dc_double(__pyx_t_1, PyBUF_WRITABLE); if (unlikely(!__pyx_t_5.memview)) __PYX_ERR(0, 674, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_v_Xx = __pyx_t_5;
   __pyx_t_5.memview = NULL;
   __pyx_t_5.data = NULL;
 
-  /* "sgimc/ops.pyx":480
+  /* "sgimc/ops.pyx":676
  *     cdef double[::1] Xx = X.data
  * 
  *     if n_threads != 1:             # <<<<<<<<<<<<<<
@@ -24548,7 +26494,7 @@ static PyObject *__pyx_pf_5sgimc_3ops_16_sparse_op_d(CYTHON_UNUSED PyObject *__p
   __pyx_t_6 = (__pyx_v_n_threads != 1);
   if (__pyx_t_6) {
 
-    /* "sgimc/ops.pyx":482
+    /* "sgimc/ops.pyx":678
  *     if n_threads != 1:
  *         errcode = __omp_sparse_op_d(
  *             n_1, d_1, &Xp[0], &Xj[0], &Xx[0],             # <<<<<<<<<<<<<<
@@ -24559,7 +26505,7 @@ static PyObject *__pyx_pf_5sgimc_3ops_16_sparse_op_d(CYTHON_UNUSED PyObject *__p
     __pyx_t_8 = 0;
     __pyx_t_9 = 0;
 
-    /* "sgimc/ops.pyx":483
+    /* "sgimc/ops.pyx":679
  *         errcode = __omp_sparse_op_d(
  *             n_1, d_1, &Xp[0], &Xj[0], &Xx[0],
  *             n_2, k, &Z[0, 0],             # <<<<<<<<<<<<<<
@@ -24569,7 +26515,7 @@ static PyObject *__pyx_pf_5sgimc_3ops_16_sparse_op_d(CYTHON_UNUSED PyObject *__p
     __pyx_t_10 = 0;
     __pyx_t_11 = 0;
 
-    /* "sgimc/ops.pyx":484
+    /* "sgimc/ops.pyx":680
  *             n_1, d_1, &Xp[0], &Xj[0], &Xx[0],
  *             n_2, k, &Z[0, 0],
  *             &D[0, 0],             # <<<<<<<<<<<<<<
@@ -24579,7 +26525,7 @@ static PyObject *__pyx_pf_5sgimc_3ops_16_sparse_op_d(CYTHON_UNUSED PyObject *__p
     __pyx_t_12 = 0;
     __pyx_t_13 = 0;
 
-    /* "sgimc/ops.pyx":485
+    /* "sgimc/ops.pyx":681
  *             n_2, k, &Z[0, 0],
  *             &D[0, 0],
  *             &Sp[0], &Sj[0], &S[0], n_threads)             # <<<<<<<<<<<<<<
@@ -24590,7 +26536,7 @@ static PyObject *__pyx_pf_5sgimc_3ops_16_sparse_op_d(CYTHON_UNUSED PyObject *__p
     __pyx_t_15 = 0;
     __pyx_t_16 = 0;
 
-    /* "sgimc/ops.pyx":481
+    /* "sgimc/ops.pyx":677
  * 
  *     if n_threads != 1:
  *         errcode = __omp_sparse_op_d(             # <<<<<<<<<<<<<<
@@ -24599,7 +26545,7 @@ static PyObject *__pyx_pf_5sgimc_3ops_16_sparse_op_d(CYTHON_UNUSED PyObject *__p
  */
     __pyx_v_errcode = omp_sparse_op_d(__pyx_v_n_1, __pyx_v_d_1, (&(*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_Xp.data) + __pyx_t_7)) )))), (&(*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_Xj.data) + __pyx_t_8)) )))), (&(*((double *) ( /* dim=0 */ ((char *) (((double *) __pyx_v_Xx.data) + __pyx_t_9)) )))), __pyx_v_n_2, __pyx_v_k, (&(*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_Z.data + __pyx_t_10 * __pyx_v_Z.strides[0]) )) + __pyx_t_11)) )))), (&(*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_D.data + __pyx_t_12 * __pyx_v_D.strides[0]) )) + __pyx_t_13)) )))), (&(*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_Sp.data) + __pyx_t_14)) )))), (&(*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_Sj.data) + __pyx_t_15)) )))), (&(*((double *) ( /* dim=0 */ ((char *) (((double *) __pyx_v_S.data) + __pyx_t_16)) )))), __pyx_v_n_threads);
 
-    /* "sgimc/ops.pyx":480
+    /* "sgimc/ops.pyx":676
  *     cdef double[::1] Xx = X.data
  * 
  *     if n_threads != 1:             # <<<<<<<<<<<<<<
@@ -24609,7 +26555,7 @@ static PyObject *__pyx_pf_5sgimc_3ops_16_sparse_op_d(CYTHON_UNUSED PyObject *__p
     goto __pyx_L3;
   }
 
-  /* "sgimc/ops.pyx":487
+  /* "sgimc/ops.pyx":683
  *             &Sp[0], &Sj[0], &S[0], n_threads)
  *     else:
  *         errcode = __sparse_op_d(             # <<<<<<<<<<<<<<
@@ -24618,7 +26564,7 @@ static PyObject *__pyx_pf_5sgimc_3ops_16_sparse_op_d(CYTHON_UNUSED PyObject *__p
  */
   /*else*/ {
 
-    /* "sgimc/ops.pyx":488
+    /* "sgimc/ops.pyx":684
  *     else:
  *         errcode = __sparse_op_d(
  *             n_1, d_1, &Xp[0], &Xj[0], &Xx[0],             # <<<<<<<<<<<<<<
@@ -24629,7 +26575,7 @@ static PyObject *__pyx_pf_5sgimc_3ops_16_sparse_op_d(CYTHON_UNUSED PyObject *__p
     __pyx_t_15 = 0;
     __pyx_t_14 = 0;
 
-    /* "sgimc/ops.pyx":489
+    /* "sgimc/ops.pyx":685
  *         errcode = __sparse_op_d(
  *             n_1, d_1, &Xp[0], &Xj[0], &Xx[0],
  *             n_2, k, &Z[0, 0],             # <<<<<<<<<<<<<<
@@ -24639,7 +26585,7 @@ static PyObject *__pyx_pf_5sgimc_3ops_16_sparse_op_d(CYTHON_UNUSED PyObject *__p
     __pyx_t_13 = 0;
     __pyx_t_12 = 0;
 
-    /* "sgimc/ops.pyx":490
+    /* "sgimc/ops.pyx":686
  *             n_1, d_1, &Xp[0], &Xj[0], &Xx[0],
  *             n_2, k, &Z[0, 0],
  *             &D[0, 0],             # <<<<<<<<<<<<<<
@@ -24649,7 +26595,7 @@ static PyObject *__pyx_pf_5sgimc_3ops_16_sparse_op_d(CYTHON_UNUSED PyObject *__p
     __pyx_t_11 = 0;
     __pyx_t_10 = 0;
 
-    /* "sgimc/ops.pyx":491
+    /* "sgimc/ops.pyx":687
  *             n_2, k, &Z[0, 0],
  *             &D[0, 0],
  *             &Sp[0], &Sj[0], &S[0])             # <<<<<<<<<<<<<<
@@ -24660,7 +26606,7 @@ static PyObject *__pyx_pf_5sgimc_3ops_16_sparse_op_d(CYTHON_UNUSED PyObject *__p
     __pyx_t_8 = 0;
     __pyx_t_7 = 0;
 
-    /* "sgimc/ops.pyx":487
+    /* "sgimc/ops.pyx":683
  *             &Sp[0], &Sj[0], &S[0], n_threads)
  *     else:
  *         errcode = __sparse_op_d(             # <<<<<<<<<<<<<<
@@ -24671,7 +26617,7 @@ static PyObject *__pyx_pf_5sgimc_3ops_16_sparse_op_d(CYTHON_UNUSED PyObject *__p
   }
   __pyx_L3:;
 
-  /* "sgimc/ops.pyx":494
+  /* "sgimc/ops.pyx":690
  *     # end if
  * 
  *     return errcode             # <<<<<<<<<<<<<<
@@ -24679,13 +26625,13 @@ static PyObject *__pyx_pf_5sgimc_3ops_16_sparse_op_d(CYTHON_UNUSED PyObject *__p
  * 
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_errcode); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 494, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_errcode); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 690, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "sgimc/ops.pyx":467
+  /* "sgimc/ops.pyx":663
  * 
  * 
  * def _sparse_op_d(object R,             # <<<<<<<<<<<<<<
@@ -24712,7 +26658,7 @@ static PyObject *__pyx_pf_5sgimc_3ops_16_sparse_op_d(CYTHON_UNUSED PyObject *__p
   return __pyx_r;
 }
 
-/* "sgimc/ops.pyx":497
+/* "sgimc/ops.pyx":693
  * 
  * 
  * def _dense_op_s(object R,             # <<<<<<<<<<<<<<
@@ -24721,15 +26667,15 @@ static PyObject *__pyx_pf_5sgimc_3ops_16_sparse_op_d(CYTHON_UNUSED PyObject *__p
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_5sgimc_3ops_19_dense_op_s(PyObject *__pyx_self, 
+static PyObject *__pyx_pw_5sgimc_3ops_29_dense_op_s(PyObject *__pyx_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-static PyMethodDef __pyx_mdef_5sgimc_3ops_19_dense_op_s = {"_dense_op_s", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_5sgimc_3ops_19_dense_op_s, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_5sgimc_3ops_19_dense_op_s(PyObject *__pyx_self, 
+static PyMethodDef __pyx_mdef_5sgimc_3ops_29_dense_op_s = {"_dense_op_s", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_5sgimc_3ops_29_dense_op_s, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_5sgimc_3ops_29_dense_op_s(PyObject *__pyx_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
@@ -24788,7 +26734,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
           (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 497, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 693, __pyx_L3_error)
         else goto __pyx_L5_argtuple_error;
         CYTHON_FALLTHROUGH;
         case  1:
@@ -24796,9 +26742,9 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
           (void)__Pyx_Arg_NewRef_FASTCALL(values[1]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 497, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 693, __pyx_L3_error)
         else {
-          __Pyx_RaiseArgtupleInvalid("_dense_op_s", 0, 5, 6, 1); __PYX_ERR(0, 497, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("_dense_op_s", 0, 5, 6, 1); __PYX_ERR(0, 693, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  2:
@@ -24806,9 +26752,9 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
           (void)__Pyx_Arg_NewRef_FASTCALL(values[2]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 497, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 693, __pyx_L3_error)
         else {
-          __Pyx_RaiseArgtupleInvalid("_dense_op_s", 0, 5, 6, 2); __PYX_ERR(0, 497, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("_dense_op_s", 0, 5, 6, 2); __PYX_ERR(0, 693, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  3:
@@ -24816,9 +26762,9 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
           (void)__Pyx_Arg_NewRef_FASTCALL(values[3]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 497, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 693, __pyx_L3_error)
         else {
-          __Pyx_RaiseArgtupleInvalid("_dense_op_s", 0, 5, 6, 3); __PYX_ERR(0, 497, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("_dense_op_s", 0, 5, 6, 3); __PYX_ERR(0, 693, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  4:
@@ -24826,21 +26772,21 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
           (void)__Pyx_Arg_NewRef_FASTCALL(values[4]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 497, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 693, __pyx_L3_error)
         else {
-          __Pyx_RaiseArgtupleInvalid("_dense_op_s", 0, 5, 6, 4); __PYX_ERR(0, 497, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("_dense_op_s", 0, 5, 6, 4); __PYX_ERR(0, 693, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  5:
         if (kw_args > 0) {
           PyObject* value = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_n_threads);
           if (value) { values[5] = __Pyx_Arg_NewRef_FASTCALL(value); kw_args--; }
-          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 497, __pyx_L3_error)
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 693, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
         const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "_dense_op_s") < 0)) __PYX_ERR(0, 497, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "_dense_op_s") < 0)) __PYX_ERR(0, 693, __pyx_L3_error)
       }
     } else {
       switch (__pyx_nargs) {
@@ -24856,19 +26802,19 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
       }
     }
     __pyx_v_R = values[0];
-    __pyx_v_X = __Pyx_PyObject_to_MemoryviewSlice_d_dc_double(values[1], PyBUF_WRITABLE); if (unlikely(!__pyx_v_X.memview)) __PYX_ERR(0, 498, __pyx_L3_error)
-    __pyx_v_Z = __Pyx_PyObject_to_MemoryviewSlice_d_dc_double(values[2], PyBUF_WRITABLE); if (unlikely(!__pyx_v_Z.memview)) __PYX_ERR(0, 499, __pyx_L3_error)
-    __pyx_v_S = __Pyx_PyObject_to_MemoryviewSlice_dc_double(values[3], PyBUF_WRITABLE); if (unlikely(!__pyx_v_S.memview)) __PYX_ERR(0, 500, __pyx_L3_error)
-    __pyx_v_D = __Pyx_PyObject_to_MemoryviewSlice_d_dc_double(values[4], PyBUF_WRITABLE); if (unlikely(!__pyx_v_D.memview)) __PYX_ERR(0, 501, __pyx_L3_error)
+    __pyx_v_X = __Pyx_PyObject_to_MemoryviewSlice_d_dc_double(values[1], PyBUF_WRITABLE); if (unlikely(!__pyx_v_X.memview)) __PYX_ERR(0, 694, __pyx_L3_error)
+    __pyx_v_Z = __Pyx_PyObject_to_MemoryviewSlice_d_dc_double(values[2], PyBUF_WRITABLE); if (unlikely(!__pyx_v_Z.memview)) __PYX_ERR(0, 695, __pyx_L3_error)
+    __pyx_v_S = __Pyx_PyObject_to_MemoryviewSlice_dc_double(values[3], PyBUF_WRITABLE); if (unlikely(!__pyx_v_S.memview)) __PYX_ERR(0, 696, __pyx_L3_error)
+    __pyx_v_D = __Pyx_PyObject_to_MemoryviewSlice_d_dc_double(values[4], PyBUF_WRITABLE); if (unlikely(!__pyx_v_D.memview)) __PYX_ERR(0, 697, __pyx_L3_error)
     if (values[5]) {
-      __pyx_v_n_threads = __Pyx_PyInt_As_int(values[5]); if (unlikely((__pyx_v_n_threads == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 502, __pyx_L3_error)
+      __pyx_v_n_threads = __Pyx_PyInt_As_int(values[5]); if (unlikely((__pyx_v_n_threads == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 698, __pyx_L3_error)
     } else {
       __pyx_v_n_threads = ((int)((int)1));
     }
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("_dense_op_s", 0, 5, 6, __pyx_nargs); __PYX_ERR(0, 497, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("_dense_op_s", 0, 5, 6, __pyx_nargs); __PYX_ERR(0, 693, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -24886,7 +26832,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_5sgimc_3ops_18_dense_op_s(__pyx_self, __pyx_v_R, __pyx_v_X, __pyx_v_Z, __pyx_v_S, __pyx_v_D, __pyx_v_n_threads);
+  __pyx_r = __pyx_pf_5sgimc_3ops_28_dense_op_s(__pyx_self, __pyx_v_R, __pyx_v_X, __pyx_v_Z, __pyx_v_S, __pyx_v_D, __pyx_v_n_threads);
 
   /* function exit code */
   __PYX_XCLEAR_MEMVIEW(&__pyx_v_X, 1);
@@ -24903,7 +26849,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_5sgimc_3ops_18_dense_op_s(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_R, __Pyx_memviewslice __pyx_v_X, __Pyx_memviewslice __pyx_v_Z, __Pyx_memviewslice __pyx_v_S, __Pyx_memviewslice __pyx_v_D, int __pyx_v_n_threads) {
+static PyObject *__pyx_pf_5sgimc_3ops_28_dense_op_s(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_R, __Pyx_memviewslice __pyx_v_X, __Pyx_memviewslice __pyx_v_Z, __Pyx_memviewslice __pyx_v_S, __Pyx_memviewslice __pyx_v_D, int __pyx_v_n_threads) {
   int __pyx_v_errcode;
   int __pyx_v_n_1;
   int __pyx_v_n_2;
@@ -24930,7 +26876,7 @@ static PyObject *__pyx_pf_5sgimc_3ops_18_dense_op_s(CYTHON_UNUSED PyObject *__py
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("_dense_op_s", 1);
 
-  /* "sgimc/ops.pyx":503
+  /* "sgimc/ops.pyx":699
  *                 double[:, ::1] D,
  *                 int n_threads=1):
  *     cdef int errcode = -1             # <<<<<<<<<<<<<<
@@ -24939,7 +26885,7 @@ static PyObject *__pyx_pf_5sgimc_3ops_18_dense_op_s(CYTHON_UNUSED PyObject *__py
  */
   __pyx_v_errcode = -1;
 
-  /* "sgimc/ops.pyx":504
+  /* "sgimc/ops.pyx":700
  *                 int n_threads=1):
  *     cdef int errcode = -1
  *     cdef int n_1 = X.shape[0], n_2 = Z.shape[0]             # <<<<<<<<<<<<<<
@@ -24949,7 +26895,7 @@ static PyObject *__pyx_pf_5sgimc_3ops_18_dense_op_s(CYTHON_UNUSED PyObject *__py
   __pyx_v_n_1 = (__pyx_v_X.shape[0]);
   __pyx_v_n_2 = (__pyx_v_Z.shape[0]);
 
-  /* "sgimc/ops.pyx":505
+  /* "sgimc/ops.pyx":701
  *     cdef int errcode = -1
  *     cdef int n_1 = X.shape[0], n_2 = Z.shape[0]
  *     cdef int d_1 = X.shape[1], k = Z.shape[1]             # <<<<<<<<<<<<<<
@@ -24959,29 +26905,29 @@ static PyObject *__pyx_pf_5sgimc_3ops_18_dense_op_s(CYTHON_UNUSED PyObject *__py
   __pyx_v_d_1 = (__pyx_v_X.shape[1]);
   __pyx_v_k = (__pyx_v_Z.shape[1]);
 
-  /* "sgimc/ops.pyx":506
+  /* "sgimc/ops.pyx":702
  *     cdef int n_1 = X.shape[0], n_2 = Z.shape[0]
  *     cdef int d_1 = X.shape[1], k = Z.shape[1]
  *     cdef int[::1] Sp = R.indptr, Sj = R.indices             # <<<<<<<<<<<<<<
  * 
  *     if n_threads != 1:
  */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_R, __pyx_n_s_indptr); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 506, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_R, __pyx_n_s_indptr); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 702, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(__pyx_t_1, PyBUF_WRITABLE); if (unlikely(!__pyx_t_2.memview)) __PYX_ERR(0, 506, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(__pyx_t_1, PyBUF_WRITABLE); if (unlikely(!__pyx_t_2.memview)) __PYX_ERR(0, 702, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_v_Sp = __pyx_t_2;
   __pyx_t_2.memview = NULL;
   __pyx_t_2.data = NULL;
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_R, __pyx_n_s_indices); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 506, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_R, __pyx_n_s_indices); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 702, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(__pyx_t_1, PyBUF_WRITABLE); if (unlikely(!__pyx_t_2.memview)) __PYX_ERR(0, 506, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(__pyx_t_1, PyBUF_WRITABLE); if (unlikely(!__pyx_t_2.memview)) __PYX_ERR(0, 702, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_v_Sj = __pyx_t_2;
   __pyx_t_2.memview = NULL;
   __pyx_t_2.data = NULL;
 
-  /* "sgimc/ops.pyx":508
+  /* "sgimc/ops.pyx":704
  *     cdef int[::1] Sp = R.indptr, Sj = R.indices
  * 
  *     if n_threads != 1:             # <<<<<<<<<<<<<<
@@ -24991,7 +26937,7 @@ static PyObject *__pyx_pf_5sgimc_3ops_18_dense_op_s(CYTHON_UNUSED PyObject *__py
   __pyx_t_3 = (__pyx_v_n_threads != 1);
   if (__pyx_t_3) {
 
-    /* "sgimc/ops.pyx":510
+    /* "sgimc/ops.pyx":706
  *     if n_threads != 1:
  *         errcode = __omp_dense_op_s(
  *             n_1, d_1, &X[0, 0],             # <<<<<<<<<<<<<<
@@ -25001,7 +26947,7 @@ static PyObject *__pyx_pf_5sgimc_3ops_18_dense_op_s(CYTHON_UNUSED PyObject *__py
     __pyx_t_4 = 0;
     __pyx_t_5 = 0;
 
-    /* "sgimc/ops.pyx":511
+    /* "sgimc/ops.pyx":707
  *         errcode = __omp_dense_op_s(
  *             n_1, d_1, &X[0, 0],
  *             n_2, k, &Z[0, 0],             # <<<<<<<<<<<<<<
@@ -25011,7 +26957,7 @@ static PyObject *__pyx_pf_5sgimc_3ops_18_dense_op_s(CYTHON_UNUSED PyObject *__py
     __pyx_t_6 = 0;
     __pyx_t_7 = 0;
 
-    /* "sgimc/ops.pyx":512
+    /* "sgimc/ops.pyx":708
  *             n_1, d_1, &X[0, 0],
  *             n_2, k, &Z[0, 0],
  *             &Sp[0], &Sj[0], &S[0],             # <<<<<<<<<<<<<<
@@ -25022,7 +26968,7 @@ static PyObject *__pyx_pf_5sgimc_3ops_18_dense_op_s(CYTHON_UNUSED PyObject *__py
     __pyx_t_9 = 0;
     __pyx_t_10 = 0;
 
-    /* "sgimc/ops.pyx":513
+    /* "sgimc/ops.pyx":709
  *             n_2, k, &Z[0, 0],
  *             &Sp[0], &Sj[0], &S[0],
  *             &D[0, 0], n_threads)             # <<<<<<<<<<<<<<
@@ -25032,7 +26978,7 @@ static PyObject *__pyx_pf_5sgimc_3ops_18_dense_op_s(CYTHON_UNUSED PyObject *__py
     __pyx_t_11 = 0;
     __pyx_t_12 = 0;
 
-    /* "sgimc/ops.pyx":509
+    /* "sgimc/ops.pyx":705
  * 
  *     if n_threads != 1:
  *         errcode = __omp_dense_op_s(             # <<<<<<<<<<<<<<
@@ -25041,7 +26987,7 @@ static PyObject *__pyx_pf_5sgimc_3ops_18_dense_op_s(CYTHON_UNUSED PyObject *__py
  */
     __pyx_v_errcode = omp_dense_op_s(__pyx_v_n_1, __pyx_v_d_1, (&(*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_X.data + __pyx_t_4 * __pyx_v_X.strides[0]) )) + __pyx_t_5)) )))), __pyx_v_n_2, __pyx_v_k, (&(*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_Z.data + __pyx_t_6 * __pyx_v_Z.strides[0]) )) + __pyx_t_7)) )))), (&(*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_Sp.data) + __pyx_t_8)) )))), (&(*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_Sj.data) + __pyx_t_9)) )))), (&(*((double *) ( /* dim=0 */ ((char *) (((double *) __pyx_v_S.data) + __pyx_t_10)) )))), (&(*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_D.data + __pyx_t_11 * __pyx_v_D.strides[0]) )) + __pyx_t_12)) )))), __pyx_v_n_threads);
 
-    /* "sgimc/ops.pyx":508
+    /* "sgimc/ops.pyx":704
  *     cdef int[::1] Sp = R.indptr, Sj = R.indices
  * 
  *     if n_threads != 1:             # <<<<<<<<<<<<<<
@@ -25051,7 +26997,7 @@ static PyObject *__pyx_pf_5sgimc_3ops_18_dense_op_s(CYTHON_UNUSED PyObject *__py
     goto __pyx_L3;
   }
 
-  /* "sgimc/ops.pyx":515
+  /* "sgimc/ops.pyx":711
  *             &D[0, 0], n_threads)
  *     else:
  *         errcode = __dense_op_s(             # <<<<<<<<<<<<<<
@@ -25060,7 +27006,7 @@ static PyObject *__pyx_pf_5sgimc_3ops_18_dense_op_s(CYTHON_UNUSED PyObject *__py
  */
   /*else*/ {
 
-    /* "sgimc/ops.pyx":516
+    /* "sgimc/ops.pyx":712
  *     else:
  *         errcode = __dense_op_s(
  *             n_1, d_1, &X[0, 0],             # <<<<<<<<<<<<<<
@@ -25070,7 +27016,7 @@ static PyObject *__pyx_pf_5sgimc_3ops_18_dense_op_s(CYTHON_UNUSED PyObject *__py
     __pyx_t_12 = 0;
     __pyx_t_11 = 0;
 
-    /* "sgimc/ops.pyx":517
+    /* "sgimc/ops.pyx":713
  *         errcode = __dense_op_s(
  *             n_1, d_1, &X[0, 0],
  *             n_2, k, &Z[0, 0],             # <<<<<<<<<<<<<<
@@ -25080,7 +27026,7 @@ static PyObject *__pyx_pf_5sgimc_3ops_18_dense_op_s(CYTHON_UNUSED PyObject *__py
     __pyx_t_10 = 0;
     __pyx_t_9 = 0;
 
-    /* "sgimc/ops.pyx":518
+    /* "sgimc/ops.pyx":714
  *             n_1, d_1, &X[0, 0],
  *             n_2, k, &Z[0, 0],
  *             &Sp[0], &Sj[0], &S[0],             # <<<<<<<<<<<<<<
@@ -25091,7 +27037,7 @@ static PyObject *__pyx_pf_5sgimc_3ops_18_dense_op_s(CYTHON_UNUSED PyObject *__py
     __pyx_t_7 = 0;
     __pyx_t_6 = 0;
 
-    /* "sgimc/ops.pyx":519
+    /* "sgimc/ops.pyx":715
  *             n_2, k, &Z[0, 0],
  *             &Sp[0], &Sj[0], &S[0],
  *             &D[0, 0])             # <<<<<<<<<<<<<<
@@ -25101,7 +27047,7 @@ static PyObject *__pyx_pf_5sgimc_3ops_18_dense_op_s(CYTHON_UNUSED PyObject *__py
     __pyx_t_5 = 0;
     __pyx_t_4 = 0;
 
-    /* "sgimc/ops.pyx":515
+    /* "sgimc/ops.pyx":711
  *             &D[0, 0], n_threads)
  *     else:
  *         errcode = __dense_op_s(             # <<<<<<<<<<<<<<
@@ -25112,7 +27058,7 @@ static PyObject *__pyx_pf_5sgimc_3ops_18_dense_op_s(CYTHON_UNUSED PyObject *__py
   }
   __pyx_L3:;
 
-  /* "sgimc/ops.pyx":522
+  /* "sgimc/ops.pyx":718
  *     # end if
  * 
  *     return errcode             # <<<<<<<<<<<<<<
@@ -25120,13 +27066,13 @@ static PyObject *__pyx_pf_5sgimc_3ops_18_dense_op_s(CYTHON_UNUSED PyObject *__py
  * 
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_errcode); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 522, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_errcode); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 718, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "sgimc/ops.pyx":497
+  /* "sgimc/ops.pyx":693
  * 
  * 
  * def _dense_op_s(object R,             # <<<<<<<<<<<<<<
@@ -25148,7 +27094,7 @@ static PyObject *__pyx_pf_5sgimc_3ops_18_dense_op_s(CYTHON_UNUSED PyObject *__py
   return __pyx_r;
 }
 
-/* "sgimc/ops.pyx":525
+/* "sgimc/ops.pyx":721
  * 
  * 
  * def _sparse_op_s(object R,             # <<<<<<<<<<<<<<
@@ -25157,15 +27103,15 @@ static PyObject *__pyx_pf_5sgimc_3ops_18_dense_op_s(CYTHON_UNUSED PyObject *__py
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_5sgimc_3ops_21_sparse_op_s(PyObject *__pyx_self, 
+static PyObject *__pyx_pw_5sgimc_3ops_31_sparse_op_s(PyObject *__pyx_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-static PyMethodDef __pyx_mdef_5sgimc_3ops_21_sparse_op_s = {"_sparse_op_s", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_5sgimc_3ops_21_sparse_op_s, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_5sgimc_3ops_21_sparse_op_s(PyObject *__pyx_self, 
+static PyMethodDef __pyx_mdef_5sgimc_3ops_31_sparse_op_s = {"_sparse_op_s", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_5sgimc_3ops_31_sparse_op_s, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_5sgimc_3ops_31_sparse_op_s(PyObject *__pyx_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
@@ -25224,7 +27170,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
           (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 525, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 721, __pyx_L3_error)
         else goto __pyx_L5_argtuple_error;
         CYTHON_FALLTHROUGH;
         case  1:
@@ -25232,9 +27178,9 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
           (void)__Pyx_Arg_NewRef_FASTCALL(values[1]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 525, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 721, __pyx_L3_error)
         else {
-          __Pyx_RaiseArgtupleInvalid("_sparse_op_s", 0, 5, 6, 1); __PYX_ERR(0, 525, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("_sparse_op_s", 0, 5, 6, 1); __PYX_ERR(0, 721, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  2:
@@ -25242,9 +27188,9 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
           (void)__Pyx_Arg_NewRef_FASTCALL(values[2]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 525, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 721, __pyx_L3_error)
         else {
-          __Pyx_RaiseArgtupleInvalid("_sparse_op_s", 0, 5, 6, 2); __PYX_ERR(0, 525, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("_sparse_op_s", 0, 5, 6, 2); __PYX_ERR(0, 721, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  3:
@@ -25252,9 +27198,9 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
           (void)__Pyx_Arg_NewRef_FASTCALL(values[3]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 525, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 721, __pyx_L3_error)
         else {
-          __Pyx_RaiseArgtupleInvalid("_sparse_op_s", 0, 5, 6, 3); __PYX_ERR(0, 525, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("_sparse_op_s", 0, 5, 6, 3); __PYX_ERR(0, 721, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  4:
@@ -25262,21 +27208,21 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
           (void)__Pyx_Arg_NewRef_FASTCALL(values[4]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 525, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 721, __pyx_L3_error)
         else {
-          __Pyx_RaiseArgtupleInvalid("_sparse_op_s", 0, 5, 6, 4); __PYX_ERR(0, 525, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("_sparse_op_s", 0, 5, 6, 4); __PYX_ERR(0, 721, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  5:
         if (kw_args > 0) {
           PyObject* value = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_n_threads);
           if (value) { values[5] = __Pyx_Arg_NewRef_FASTCALL(value); kw_args--; }
-          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 525, __pyx_L3_error)
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 721, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
         const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "_sparse_op_s") < 0)) __PYX_ERR(0, 525, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "_sparse_op_s") < 0)) __PYX_ERR(0, 721, __pyx_L3_error)
       }
     } else {
       switch (__pyx_nargs) {
@@ -25293,18 +27239,18 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
     }
     __pyx_v_R = values[0];
     __pyx_v_X = values[1];
-    __pyx_v_Z = __Pyx_PyObject_to_MemoryviewSlice_d_dc_double(values[2], PyBUF_WRITABLE); if (unlikely(!__pyx_v_Z.memview)) __PYX_ERR(0, 527, __pyx_L3_error)
-    __pyx_v_S = __Pyx_PyObject_to_MemoryviewSlice_dc_double(values[3], PyBUF_WRITABLE); if (unlikely(!__pyx_v_S.memview)) __PYX_ERR(0, 528, __pyx_L3_error)
-    __pyx_v_D = __Pyx_PyObject_to_MemoryviewSlice_d_dc_double(values[4], PyBUF_WRITABLE); if (unlikely(!__pyx_v_D.memview)) __PYX_ERR(0, 529, __pyx_L3_error)
+    __pyx_v_Z = __Pyx_PyObject_to_MemoryviewSlice_d_dc_double(values[2], PyBUF_WRITABLE); if (unlikely(!__pyx_v_Z.memview)) __PYX_ERR(0, 723, __pyx_L3_error)
+    __pyx_v_S = __Pyx_PyObject_to_MemoryviewSlice_dc_double(values[3], PyBUF_WRITABLE); if (unlikely(!__pyx_v_S.memview)) __PYX_ERR(0, 724, __pyx_L3_error)
+    __pyx_v_D = __Pyx_PyObject_to_MemoryviewSlice_d_dc_double(values[4], PyBUF_WRITABLE); if (unlikely(!__pyx_v_D.memview)) __PYX_ERR(0, 725, __pyx_L3_error)
     if (values[5]) {
-      __pyx_v_n_threads = __Pyx_PyInt_As_int(values[5]); if (unlikely((__pyx_v_n_threads == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 530, __pyx_L3_error)
+      __pyx_v_n_threads = __Pyx_PyInt_As_int(values[5]); if (unlikely((__pyx_v_n_threads == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 726, __pyx_L3_error)
     } else {
       __pyx_v_n_threads = ((int)((int)1));
     }
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("_sparse_op_s", 0, 5, 6, __pyx_nargs); __PYX_ERR(0, 525, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("_sparse_op_s", 0, 5, 6, __pyx_nargs); __PYX_ERR(0, 721, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -25321,7 +27267,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_5sgimc_3ops_20_sparse_op_s(__pyx_self, __pyx_v_R, __pyx_v_X, __pyx_v_Z, __pyx_v_S, __pyx_v_D, __pyx_v_n_threads);
+  __pyx_r = __pyx_pf_5sgimc_3ops_30_sparse_op_s(__pyx_self, __pyx_v_R, __pyx_v_X, __pyx_v_Z, __pyx_v_S, __pyx_v_D, __pyx_v_n_threads);
 
   /* function exit code */
   __PYX_XCLEAR_MEMVIEW(&__pyx_v_Z, 1);
@@ -25337,7 +27283,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_5sgimc_3ops_20_sparse_op_s(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_R, PyObject *__pyx_v_X, __Pyx_memviewslice __pyx_v_Z, __Pyx_memviewslice __pyx_v_S, __Pyx_memviewslice __pyx_v_D, int __pyx_v_n_threads) {
+static PyObject *__pyx_pf_5sgimc_3ops_30_sparse_op_s(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_R, PyObject *__pyx_v_X, __Pyx_memviewslice __pyx_v_Z, __Pyx_memviewslice __pyx_v_S, __Pyx_memviewslice __pyx_v_D, int __pyx_v_n_threads) {
   int __pyx_v_errcode;
   int __pyx_v_n_1;
   int __pyx_v_n_2;
@@ -25371,7 +27317,7 @@ static PyObject *__pyx_pf_5sgimc_3ops_20_sparse_op_s(CYTHON_UNUSED PyObject *__p
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("_sparse_op_s", 1);
 
-  /* "sgimc/ops.pyx":531
+  /* "sgimc/ops.pyx":727
  *                  double[:, ::1] D,
  *                  int n_threads=1):
  *     cdef int errcode = -1             # <<<<<<<<<<<<<<
@@ -25380,100 +27326,100 @@ static PyObject *__pyx_pf_5sgimc_3ops_20_sparse_op_s(CYTHON_UNUSED PyObject *__p
  */
   __pyx_v_errcode = -1;
 
-  /* "sgimc/ops.pyx":532
+  /* "sgimc/ops.pyx":728
  *                  int n_threads=1):
  *     cdef int errcode = -1
  *     cdef int n_1 = X.shape[0], n_2 = Z.shape[0]             # <<<<<<<<<<<<<<
  *     cdef int d_1 = X.shape[1], k = Z.shape[1]
  *     cdef int[::1] Sp = R.indptr, Sj = R.indices
  */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_X, __pyx_n_s_shape); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 532, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_X, __pyx_n_s_shape); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 728, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_GetItemInt(__pyx_t_1, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 532, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_GetItemInt(__pyx_t_1, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 728, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_3 = __Pyx_PyInt_As_int(__pyx_t_2); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 532, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyInt_As_int(__pyx_t_2); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 728, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_v_n_1 = __pyx_t_3;
   __pyx_v_n_2 = (__pyx_v_Z.shape[0]);
 
-  /* "sgimc/ops.pyx":533
+  /* "sgimc/ops.pyx":729
  *     cdef int errcode = -1
  *     cdef int n_1 = X.shape[0], n_2 = Z.shape[0]
  *     cdef int d_1 = X.shape[1], k = Z.shape[1]             # <<<<<<<<<<<<<<
  *     cdef int[::1] Sp = R.indptr, Sj = R.indices
  *     cdef int[::1] Xp = X.indptr, Xj = X.indices
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_X, __pyx_n_s_shape); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 533, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_X, __pyx_n_s_shape); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 729, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_1 = __Pyx_GetItemInt(__pyx_t_2, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 533, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_GetItemInt(__pyx_t_2, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 729, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_3 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 533, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 729, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_v_d_1 = __pyx_t_3;
   __pyx_v_k = (__pyx_v_Z.shape[1]);
 
-  /* "sgimc/ops.pyx":534
+  /* "sgimc/ops.pyx":730
  *     cdef int n_1 = X.shape[0], n_2 = Z.shape[0]
  *     cdef int d_1 = X.shape[1], k = Z.shape[1]
  *     cdef int[::1] Sp = R.indptr, Sj = R.indices             # <<<<<<<<<<<<<<
  *     cdef int[::1] Xp = X.indptr, Xj = X.indices
  *     cdef double[::1] Xx = X.data
  */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_R, __pyx_n_s_indptr); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 534, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_R, __pyx_n_s_indptr); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 730, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_4 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(__pyx_t_1, PyBUF_WRITABLE); if (unlikely(!__pyx_t_4.memview)) __PYX_ERR(0, 534, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(__pyx_t_1, PyBUF_WRITABLE); if (unlikely(!__pyx_t_4.memview)) __PYX_ERR(0, 730, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_v_Sp = __pyx_t_4;
   __pyx_t_4.memview = NULL;
   __pyx_t_4.data = NULL;
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_R, __pyx_n_s_indices); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 534, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_R, __pyx_n_s_indices); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 730, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_4 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(__pyx_t_1, PyBUF_WRITABLE); if (unlikely(!__pyx_t_4.memview)) __PYX_ERR(0, 534, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(__pyx_t_1, PyBUF_WRITABLE); if (unlikely(!__pyx_t_4.memview)) __PYX_ERR(0, 730, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_v_Sj = __pyx_t_4;
   __pyx_t_4.memview = NULL;
   __pyx_t_4.data = NULL;
 
-  /* "sgimc/ops.pyx":535
+  /* "sgimc/ops.pyx":731
  *     cdef int d_1 = X.shape[1], k = Z.shape[1]
  *     cdef int[::1] Sp = R.indptr, Sj = R.indices
  *     cdef int[::1] Xp = X.indptr, Xj = X.indices             # <<<<<<<<<<<<<<
  *     cdef double[::1] Xx = X.data
  * 
  */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_X, __pyx_n_s_indptr); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 535, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_X, __pyx_n_s_indptr); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 731, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_4 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(__pyx_t_1, PyBUF_WRITABLE); if (unlikely(!__pyx_t_4.memview)) __PYX_ERR(0, 535, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(__pyx_t_1, PyBUF_WRITABLE); if (unlikely(!__pyx_t_4.memview)) __PYX_ERR(0, 731, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_v_Xp = __pyx_t_4;
   __pyx_t_4.memview = NULL;
   __pyx_t_4.data = NULL;
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_X, __pyx_n_s_indices); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 535, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_X, __pyx_n_s_indices); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 731, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_4 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(__pyx_t_1, PyBUF_WRITABLE); if (unlikely(!__pyx_t_4.memview)) __PYX_ERR(0, 535, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(__pyx_t_1, PyBUF_WRITABLE); if (unlikely(!__pyx_t_4.memview)) __PYX_ERR(0, 731, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_v_Xj = __pyx_t_4;
   __pyx_t_4.memview = NULL;
   __pyx_t_4.data = NULL;
 
-  /* "sgimc/ops.pyx":536
+  /* "sgimc/ops.pyx":732
  *     cdef int[::1] Sp = R.indptr, Sj = R.indices
  *     cdef int[::1] Xp = X.indptr, Xj = X.indices
  *     cdef double[::1] Xx = X.data             # <<<<<<<<<<<<<<
  * 
  *     if n_threads != 1:
  */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_X, __pyx_n_s_data); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 536, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_X, __pyx_n_s_data); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 732, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_5 = __Pyx_PyObject_to_MemoryviewSlice_dc_double(__pyx_t_1, PyBUF_WRITABLE); if (unlikely(!__pyx_t_5.memview)) __PYX_ERR(0, 536, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_to_MemoryviewSlice_dc_double(__pyx_t_1, PyBUF_WRITABLE); if (unlikely(!__pyx_t_5.memview)) __PYX_ERR(0, 732, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_v_Xx = __pyx_t_5;
   __pyx_t_5.memview = NULL;
   __pyx_t_5.data = NULL;
 
-  /* "sgimc/ops.pyx":538
+  /* "sgimc/ops.pyx":734
  *     cdef double[::1] Xx = X.data
  * 
  *     if n_threads != 1:             # <<<<<<<<<<<<<<
@@ -25483,7 +27429,7 @@ static PyObject *__pyx_pf_5sgimc_3ops_20_sparse_op_s(CYTHON_UNUSED PyObject *__p
   __pyx_t_6 = (__pyx_v_n_threads != 1);
   if (__pyx_t_6) {
 
-    /* "sgimc/ops.pyx":540
+    /* "sgimc/ops.pyx":736
  *     if n_threads != 1:
  *         errcode = __omp_sparse_op_s(
  *             n_1, d_1, &Xp[0], &Xj[0], &Xx[0],             # <<<<<<<<<<<<<<
@@ -25494,7 +27440,7 @@ static PyObject *__pyx_pf_5sgimc_3ops_20_sparse_op_s(CYTHON_UNUSED PyObject *__p
     __pyx_t_8 = 0;
     __pyx_t_9 = 0;
 
-    /* "sgimc/ops.pyx":541
+    /* "sgimc/ops.pyx":737
  *         errcode = __omp_sparse_op_s(
  *             n_1, d_1, &Xp[0], &Xj[0], &Xx[0],
  *             n_2, k, &Z[0, 0],             # <<<<<<<<<<<<<<
@@ -25504,7 +27450,7 @@ static PyObject *__pyx_pf_5sgimc_3ops_20_sparse_op_s(CYTHON_UNUSED PyObject *__p
     __pyx_t_10 = 0;
     __pyx_t_11 = 0;
 
-    /* "sgimc/ops.pyx":542
+    /* "sgimc/ops.pyx":738
  *             n_1, d_1, &Xp[0], &Xj[0], &Xx[0],
  *             n_2, k, &Z[0, 0],
  *             &Sp[0], &Sj[0], &S[0],             # <<<<<<<<<<<<<<
@@ -25515,7 +27461,7 @@ static PyObject *__pyx_pf_5sgimc_3ops_20_sparse_op_s(CYTHON_UNUSED PyObject *__p
     __pyx_t_13 = 0;
     __pyx_t_14 = 0;
 
-    /* "sgimc/ops.pyx":543
+    /* "sgimc/ops.pyx":739
  *             n_2, k, &Z[0, 0],
  *             &Sp[0], &Sj[0], &S[0],
  *             &D[0, 0], n_threads)             # <<<<<<<<<<<<<<
@@ -25525,7 +27471,7 @@ static PyObject *__pyx_pf_5sgimc_3ops_20_sparse_op_s(CYTHON_UNUSED PyObject *__p
     __pyx_t_15 = 0;
     __pyx_t_16 = 0;
 
-    /* "sgimc/ops.pyx":539
+    /* "sgimc/ops.pyx":735
  * 
  *     if n_threads != 1:
  *         errcode = __omp_sparse_op_s(             # <<<<<<<<<<<<<<
@@ -25534,7 +27480,7 @@ static PyObject *__pyx_pf_5sgimc_3ops_20_sparse_op_s(CYTHON_UNUSED PyObject *__p
  */
     __pyx_v_errcode = omp_sparse_op_s(__pyx_v_n_1, __pyx_v_d_1, (&(*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_Xp.data) + __pyx_t_7)) )))), (&(*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_Xj.data) + __pyx_t_8)) )))), (&(*((double *) ( /* dim=0 */ ((char *) (((double *) __pyx_v_Xx.data) + __pyx_t_9)) )))), __pyx_v_n_2, __pyx_v_k, (&(*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_Z.data + __pyx_t_10 * __pyx_v_Z.strides[0]) )) + __pyx_t_11)) )))), (&(*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_Sp.data) + __pyx_t_12)) )))), (&(*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_Sj.data) + __pyx_t_13)) )))), (&(*((double *) ( /* dim=0 */ ((char *) (((double *) __pyx_v_S.data) + __pyx_t_14)) )))), (&(*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_D.data + __pyx_t_15 * __pyx_v_D.strides[0]) )) + __pyx_t_16)) )))), __pyx_v_n_threads);
 
-    /* "sgimc/ops.pyx":538
+    /* "sgimc/ops.pyx":734
  *     cdef double[::1] Xx = X.data
  * 
  *     if n_threads != 1:             # <<<<<<<<<<<<<<
@@ -25544,7 +27490,7 @@ static PyObject *__pyx_pf_5sgimc_3ops_20_sparse_op_s(CYTHON_UNUSED PyObject *__p
     goto __pyx_L3;
   }
 
-  /* "sgimc/ops.pyx":545
+  /* "sgimc/ops.pyx":741
  *             &D[0, 0], n_threads)
  *     else:
  *         errcode = __sparse_op_s(             # <<<<<<<<<<<<<<
@@ -25553,7 +27499,7 @@ static PyObject *__pyx_pf_5sgimc_3ops_20_sparse_op_s(CYTHON_UNUSED PyObject *__p
  */
   /*else*/ {
 
-    /* "sgimc/ops.pyx":546
+    /* "sgimc/ops.pyx":742
  *     else:
  *         errcode = __sparse_op_s(
  *             n_1, d_1, &Xp[0], &Xj[0], &Xx[0],             # <<<<<<<<<<<<<<
@@ -25564,7 +27510,7 @@ static PyObject *__pyx_pf_5sgimc_3ops_20_sparse_op_s(CYTHON_UNUSED PyObject *__p
     __pyx_t_15 = 0;
     __pyx_t_14 = 0;
 
-    /* "sgimc/ops.pyx":547
+    /* "sgimc/ops.pyx":743
  *         errcode = __sparse_op_s(
  *             n_1, d_1, &Xp[0], &Xj[0], &Xx[0],
  *             n_2, k, &Z[0, 0],             # <<<<<<<<<<<<<<
@@ -25574,7 +27520,7 @@ static PyObject *__pyx_pf_5sgimc_3ops_20_sparse_op_s(CYTHON_UNUSED PyObject *__p
     __pyx_t_13 = 0;
     __pyx_t_12 = 0;
 
-    /* "sgimc/ops.pyx":548
+    /* "sgimc/ops.pyx":744
  *             n_1, d_1, &Xp[0], &Xj[0], &Xx[0],
  *             n_2, k, &Z[0, 0],
  *             &Sp[0], &Sj[0], &S[0],             # <<<<<<<<<<<<<<
@@ -25585,7 +27531,7 @@ static PyObject *__pyx_pf_5sgimc_3ops_20_sparse_op_s(CYTHON_UNUSED PyObject *__p
     __pyx_t_10 = 0;
     __pyx_t_9 = 0;
 
-    /* "sgimc/ops.pyx":549
+    /* "sgimc/ops.pyx":745
  *             n_2, k, &Z[0, 0],
  *             &Sp[0], &Sj[0], &S[0],
  *             &D[0, 0])             # <<<<<<<<<<<<<<
@@ -25595,7 +27541,7 @@ static PyObject *__pyx_pf_5sgimc_3ops_20_sparse_op_s(CYTHON_UNUSED PyObject *__p
     __pyx_t_8 = 0;
     __pyx_t_7 = 0;
 
-    /* "sgimc/ops.pyx":545
+    /* "sgimc/ops.pyx":741
  *             &D[0, 0], n_threads)
  *     else:
  *         errcode = __sparse_op_s(             # <<<<<<<<<<<<<<
@@ -25606,19 +27552,19 @@ static PyObject *__pyx_pf_5sgimc_3ops_20_sparse_op_s(CYTHON_UNUSED PyObject *__p
   }
   __pyx_L3:;
 
-  /* "sgimc/ops.pyx":552
+  /* "sgimc/ops.pyx":748
  *     # end if
  * 
  *     return errcode             # <<<<<<<<<<<<<<
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_errcode); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 552, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_errcode); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 748, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "sgimc/ops.pyx":525
+  /* "sgimc/ops.pyx":721
  * 
  * 
  * def _sparse_op_s(object R,             # <<<<<<<<<<<<<<
@@ -26669,7 +28615,7 @@ static int __Pyx_CreateStringTabAndInitStrings(void) {
     {&__pyx_n_s_Z, __pyx_k_Z, sizeof(__pyx_k_Z), 0, 0, 1, 1},
     {&__pyx_kp_u__2, __pyx_k__2, sizeof(__pyx_k__2), 0, 1, 0, 0},
     {&__pyx_n_s__3, __pyx_k__3, sizeof(__pyx_k__3), 0, 0, 1, 1},
-    {&__pyx_n_s__45, __pyx_k__45, sizeof(__pyx_k__45), 0, 0, 1, 1},
+    {&__pyx_n_s__56, __pyx_k__56, sizeof(__pyx_k__56), 0, 0, 1, 1},
     {&__pyx_kp_u__6, __pyx_k__6, sizeof(__pyx_k__6), 0, 1, 0, 0},
     {&__pyx_kp_u__7, __pyx_k__7, sizeof(__pyx_k__7), 0, 1, 0, 0},
     {&__pyx_n_s_abc, __pyx_k_abc, sizeof(__pyx_k_abc), 0, 0, 1, 1},
@@ -26699,10 +28645,12 @@ static int __Pyx_CreateStringTabAndInitStrings(void) {
     {&__pyx_n_s_double, __pyx_k_double, sizeof(__pyx_k_double), 0, 0, 1, 1},
     {&__pyx_n_s_dtype, __pyx_k_dtype, sizeof(__pyx_k_dtype), 0, 0, 1, 1},
     {&__pyx_n_s_dtype_is_object, __pyx_k_dtype_is_object, sizeof(__pyx_k_dtype_is_object), 0, 0, 1, 1},
+    {&__pyx_n_s_empty, __pyx_k_empty, sizeof(__pyx_k_empty), 0, 0, 1, 1},
     {&__pyx_n_s_empty_like, __pyx_k_empty_like, sizeof(__pyx_k_empty_like), 0, 0, 1, 1},
     {&__pyx_kp_u_enable, __pyx_k_enable, sizeof(__pyx_k_enable), 0, 1, 0, 0},
     {&__pyx_n_s_encode, __pyx_k_encode, sizeof(__pyx_k_encode), 0, 0, 1, 1},
     {&__pyx_n_s_enumerate, __pyx_k_enumerate, sizeof(__pyx_k_enumerate), 0, 0, 1, 1},
+    {&__pyx_n_s_epsilon, __pyx_k_epsilon, sizeof(__pyx_k_epsilon), 0, 0, 1, 1},
     {&__pyx_n_s_errcode, __pyx_k_errcode, sizeof(__pyx_k_errcode), 0, 0, 1, 1},
     {&__pyx_n_s_error, __pyx_k_error, sizeof(__pyx_k_error), 0, 0, 1, 1},
     {&__pyx_n_s_flags, __pyx_k_flags, sizeof(__pyx_k_flags), 0, 0, 1, 1},
@@ -26714,6 +28662,8 @@ static int __Pyx_CreateStringTabAndInitStrings(void) {
     {&__pyx_kp_u_got, __pyx_k_got, sizeof(__pyx_k_got), 0, 1, 0, 0},
     {&__pyx_kp_u_got_differing_extents_in_dimensi, __pyx_k_got_differing_extents_in_dimensi, sizeof(__pyx_k_got_differing_extents_in_dimensi), 0, 1, 0, 0},
     {&__pyx_n_s_has_omp, __pyx_k_has_omp, sizeof(__pyx_k_has_omp), 0, 0, 1, 1},
+    {&__pyx_n_s_huber_grad, __pyx_k_huber_grad, sizeof(__pyx_k_huber_grad), 0, 0, 1, 1},
+    {&__pyx_n_s_huber_loss, __pyx_k_huber_loss, sizeof(__pyx_k_huber_loss), 0, 0, 1, 1},
     {&__pyx_n_s_i, __pyx_k_i, sizeof(__pyx_k_i), 0, 0, 1, 1},
     {&__pyx_n_s_id, __pyx_k_id, sizeof(__pyx_k_id), 0, 0, 1, 1},
     {&__pyx_n_s_import, __pyx_k_import, sizeof(__pyx_k_import), 0, 0, 1, 1},
@@ -26727,9 +28677,16 @@ static int __Pyx_CreateStringTabAndInitStrings(void) {
     {&__pyx_kp_s_itemsize_0_for_cython_array, __pyx_k_itemsize_0_for_cython_array, sizeof(__pyx_k_itemsize_0_for_cython_array), 0, 0, 1, 0},
     {&__pyx_n_s_j, __pyx_k_j, sizeof(__pyx_k_j), 0, 0, 1, 1},
     {&__pyx_n_s_k, __pyx_k_k, sizeof(__pyx_k_k), 0, 0, 1, 1},
+    {&__pyx_n_s_logistic_grad, __pyx_k_logistic_grad, sizeof(__pyx_k_logistic_grad), 0, 0, 1, 1},
+    {&__pyx_n_s_logistic_hess, __pyx_k_logistic_hess, sizeof(__pyx_k_logistic_hess), 0, 0, 1, 1},
+    {&__pyx_n_s_logistic_loss, __pyx_k_logistic_loss, sizeof(__pyx_k_logistic_loss), 0, 0, 1, 1},
+    {&__pyx_n_s_logit, __pyx_k_logit, sizeof(__pyx_k_logit), 0, 0, 1, 1},
+    {&__pyx_kp_s_logit_and_target_must_have_equa, __pyx_k_logit_and_target_must_have_equa, sizeof(__pyx_k_logit_and_target_must_have_equa), 0, 0, 1, 0},
     {&__pyx_n_s_main, __pyx_k_main, sizeof(__pyx_k_main), 0, 0, 1, 1},
+    {&__pyx_n_s_margin, __pyx_k_margin, sizeof(__pyx_k_margin), 0, 0, 1, 1},
     {&__pyx_n_s_memview, __pyx_k_memview, sizeof(__pyx_k_memview), 0, 0, 1, 1},
     {&__pyx_n_s_mode, __pyx_k_mode, sizeof(__pyx_k_mode), 0, 0, 1, 1},
+    {&__pyx_n_s_n, __pyx_k_n, sizeof(__pyx_k_n), 0, 0, 1, 1},
     {&__pyx_n_s_n_1, __pyx_k_n_1, sizeof(__pyx_k_n_1), 0, 0, 1, 1},
     {&__pyx_n_s_n_2, __pyx_k_n_2, sizeof(__pyx_k_n_2), 0, 0, 1, 1},
     {&__pyx_n_s_n_threads, __pyx_k_n_threads, sizeof(__pyx_k_n_threads), 0, 0, 1, 1},
@@ -26752,6 +28709,8 @@ static int __Pyx_CreateStringTabAndInitStrings(void) {
     {&__pyx_n_s_out, __pyx_k_out, sizeof(__pyx_k_out), 0, 0, 1, 1},
     {&__pyx_n_s_pack, __pyx_k_pack, sizeof(__pyx_k_pack), 0, 0, 1, 1},
     {&__pyx_n_s_pickle, __pyx_k_pickle, sizeof(__pyx_k_pickle), 0, 0, 1, 1},
+    {&__pyx_n_s_predict, __pyx_k_predict, sizeof(__pyx_k_predict), 0, 0, 1, 1},
+    {&__pyx_kp_s_predict_and_target_must_have_eq, __pyx_k_predict_and_target_must_have_eq, sizeof(__pyx_k_predict_and_target_must_have_eq), 0, 0, 1, 0},
     {&__pyx_n_s_pyx_PickleError, __pyx_k_pyx_PickleError, sizeof(__pyx_k_pyx_PickleError), 0, 0, 1, 1},
     {&__pyx_n_s_pyx_checksum, __pyx_k_pyx_checksum, sizeof(__pyx_k_pyx_checksum), 0, 0, 1, 1},
     {&__pyx_n_s_pyx_result, __pyx_k_pyx_result, sizeof(__pyx_k_pyx_result), 0, 0, 1, 1},
@@ -26764,6 +28723,7 @@ static int __Pyx_CreateStringTabAndInitStrings(void) {
     {&__pyx_n_s_reduce_cython, __pyx_k_reduce_cython, sizeof(__pyx_k_reduce_cython), 0, 0, 1, 1},
     {&__pyx_n_s_reduce_ex, __pyx_k_reduce_ex, sizeof(__pyx_k_reduce_ex), 0, 0, 1, 1},
     {&__pyx_n_s_register, __pyx_k_register, sizeof(__pyx_k_register), 0, 0, 1, 1},
+    {&__pyx_n_s_resid, __pyx_k_resid, sizeof(__pyx_k_resid), 0, 0, 1, 1},
     {&__pyx_n_s_scipy_sparse, __pyx_k_scipy_sparse, sizeof(__pyx_k_scipy_sparse), 0, 0, 1, 1},
     {&__pyx_n_s_setstate, __pyx_k_setstate, sizeof(__pyx_k_setstate), 0, 0, 1, 1},
     {&__pyx_n_s_setstate_cython, __pyx_k_setstate_cython, sizeof(__pyx_k_setstate_cython), 0, 0, 1, 1},
@@ -26786,6 +28746,7 @@ static int __Pyx_CreateStringTabAndInitStrings(void) {
     {&__pyx_kp_s_stringsource, __pyx_k_stringsource, sizeof(__pyx_k_stringsource), 0, 0, 1, 0},
     {&__pyx_n_s_struct, __pyx_k_struct, sizeof(__pyx_k_struct), 0, 0, 1, 1},
     {&__pyx_n_s_sys, __pyx_k_sys, sizeof(__pyx_k_sys), 0, 0, 1, 1},
+    {&__pyx_n_s_target, __pyx_k_target, sizeof(__pyx_k_target), 0, 0, 1, 1},
     {&__pyx_n_s_test, __pyx_k_test, sizeof(__pyx_k_test), 0, 0, 1, 1},
     {&__pyx_n_s_tmp, __pyx_k_tmp, sizeof(__pyx_k_tmp), 0, 0, 1, 1},
     {&__pyx_kp_s_unable_to_allocate_array_data, __pyx_k_unable_to_allocate_array_data, sizeof(__pyx_k_unable_to_allocate_array_data), 0, 0, 1, 0},
@@ -26793,6 +28754,7 @@ static int __Pyx_CreateStringTabAndInitStrings(void) {
     {&__pyx_n_s_unpack, __pyx_k_unpack, sizeof(__pyx_k_unpack), 0, 0, 1, 1},
     {&__pyx_n_s_update, __pyx_k_update, sizeof(__pyx_k_update), 0, 0, 1, 1},
     {&__pyx_n_s_version_info, __pyx_k_version_info, sizeof(__pyx_k_version_info), 0, 0, 1, 1},
+    {&__pyx_n_s_z, __pyx_k_z, sizeof(__pyx_k_z), 0, 0, 1, 1},
     {&__pyx_n_s_zeros, __pyx_k_zeros, sizeof(__pyx_k_zeros), 0, 0, 1, 1},
     {0, 0, 0, 0, 0, 0, 0}
   };
@@ -26810,7 +28772,7 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(void) {
   __pyx_builtin_Ellipsis = __Pyx_GetBuiltinName(__pyx_n_s_Ellipsis); if (!__pyx_builtin_Ellipsis) __PYX_ERR(1, 408, __pyx_L1_error)
   __pyx_builtin_id = __Pyx_GetBuiltinName(__pyx_n_s_id); if (!__pyx_builtin_id) __PYX_ERR(1, 618, __pyx_L1_error)
   __pyx_builtin_IndexError = __Pyx_GetBuiltinName(__pyx_n_s_IndexError); if (!__pyx_builtin_IndexError) __PYX_ERR(1, 914, __pyx_L1_error)
-  __pyx_builtin_ImportError = __Pyx_GetBuiltinName(__pyx_n_s_ImportError); if (!__pyx_builtin_ImportError) __PYX_ERR(2, 1026, __pyx_L1_error)
+  __pyx_builtin_ImportError = __Pyx_GetBuiltinName(__pyx_n_s_ImportError); if (!__pyx_builtin_ImportError) __PYX_ERR(2, 1011, __pyx_L1_error)
   return 0;
   __pyx_L1_error:;
   return -1;
@@ -26857,25 +28819,25 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
   __Pyx_GOTREF(__pyx_tuple__8);
   __Pyx_GIVEREF(__pyx_tuple__8);
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1026
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1011
  *         __pyx_import_array()
  *     except Exception:
  *         raise ImportError("numpy._core.multiarray failed to import")             # <<<<<<<<<<<<<<
  * 
  * cdef inline int import_umath() except -1:
  */
-  __pyx_tuple__9 = PyTuple_Pack(1, __pyx_kp_s_numpy__core_multiarray_failed_to); if (unlikely(!__pyx_tuple__9)) __PYX_ERR(2, 1026, __pyx_L1_error)
+  __pyx_tuple__9 = PyTuple_Pack(1, __pyx_kp_s_numpy__core_multiarray_failed_to); if (unlikely(!__pyx_tuple__9)) __PYX_ERR(2, 1011, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__9);
   __Pyx_GIVEREF(__pyx_tuple__9);
 
-  /* "../miniconda3/envs/SGIMC/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1032
+  /* "../../root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1017
  *         _import_umath()
  *     except Exception:
  *         raise ImportError("numpy._core.umath failed to import")             # <<<<<<<<<<<<<<
  * 
  * cdef inline int import_ufunc() except -1:
  */
-  __pyx_tuple__10 = PyTuple_Pack(1, __pyx_kp_s_numpy__core_umath_failed_to_impo); if (unlikely(!__pyx_tuple__10)) __PYX_ERR(2, 1032, __pyx_L1_error)
+  __pyx_tuple__10 = PyTuple_Pack(1, __pyx_kp_s_numpy__core_umath_failed_to_impo); if (unlikely(!__pyx_tuple__10)) __PYX_ERR(2, 1017, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__10);
   __Pyx_GIVEREF(__pyx_tuple__10);
 
@@ -26901,6 +28863,28 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
   __Pyx_GOTREF(__pyx_tuple__12);
   __Pyx_GIVEREF(__pyx_tuple__12);
 
+  /* "sgimc/ops.pyx":473
+ * 
+ *     if target.shape[0] != n:
+ *         raise TypeError("""`predict` and `target` must have equal length.""")             # <<<<<<<<<<<<<<
+ * 
+ *     cdef double[::1] out = np.empty(n, dtype="double")
+ */
+  __pyx_tuple__13 = PyTuple_Pack(1, __pyx_kp_s_predict_and_target_must_have_eq); if (unlikely(!__pyx_tuple__13)) __PYX_ERR(0, 473, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__13);
+  __Pyx_GIVEREF(__pyx_tuple__13);
+
+  /* "sgimc/ops.pyx":556
+ * 
+ *     if target.shape[0] != n:
+ *         raise TypeError("""`logit` and `target` must have equal length.""")             # <<<<<<<<<<<<<<
+ * 
+ *     cdef double[::1] out = np.empty(n, dtype="double")
+ */
+  __pyx_tuple__14 = PyTuple_Pack(1, __pyx_kp_s_logit_and_target_must_have_equa); if (unlikely(!__pyx_tuple__14)) __PYX_ERR(0, 556, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__14);
+  __Pyx_GIVEREF(__pyx_tuple__14);
+
   /* "View.MemoryView":100
  * cdef object __pyx_collections_abc_Sequence "__pyx_collections_abc_Sequence"
  * try:
@@ -26908,12 +28892,12 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  *         __pyx_collections_abc_Sequence = __import__("collections.abc").abc.Sequence
  *     else:
  */
-  __pyx_tuple__13 = PyTuple_Pack(1, __pyx_n_s_sys); if (unlikely(!__pyx_tuple__13)) __PYX_ERR(1, 100, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__13);
-  __Pyx_GIVEREF(__pyx_tuple__13);
-  __pyx_tuple__14 = PyTuple_Pack(2, __pyx_int_3, __pyx_int_3); if (unlikely(!__pyx_tuple__14)) __PYX_ERR(1, 100, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__14);
-  __Pyx_GIVEREF(__pyx_tuple__14);
+  __pyx_tuple__15 = PyTuple_Pack(1, __pyx_n_s_sys); if (unlikely(!__pyx_tuple__15)) __PYX_ERR(1, 100, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__15);
+  __Pyx_GIVEREF(__pyx_tuple__15);
+  __pyx_tuple__16 = PyTuple_Pack(2, __pyx_int_3, __pyx_int_3); if (unlikely(!__pyx_tuple__16)) __PYX_ERR(1, 100, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__16);
+  __Pyx_GIVEREF(__pyx_tuple__16);
 
   /* "View.MemoryView":101
  * try:
@@ -26922,9 +28906,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  *     else:
  *         __pyx_collections_abc_Sequence = __import__("collections").Sequence
  */
-  __pyx_tuple__15 = PyTuple_Pack(1, __pyx_kp_s_collections_abc); if (unlikely(!__pyx_tuple__15)) __PYX_ERR(1, 101, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__15);
-  __Pyx_GIVEREF(__pyx_tuple__15);
+  __pyx_tuple__17 = PyTuple_Pack(1, __pyx_kp_s_collections_abc); if (unlikely(!__pyx_tuple__17)) __PYX_ERR(1, 101, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__17);
+  __Pyx_GIVEREF(__pyx_tuple__17);
 
   /* "View.MemoryView":103
  *         __pyx_collections_abc_Sequence = __import__("collections.abc").abc.Sequence
@@ -26933,9 +28917,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * except:
  * 
  */
-  __pyx_tuple__16 = PyTuple_Pack(1, __pyx_n_s_collections); if (unlikely(!__pyx_tuple__16)) __PYX_ERR(1, 103, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__16);
-  __Pyx_GIVEREF(__pyx_tuple__16);
+  __pyx_tuple__18 = PyTuple_Pack(1, __pyx_n_s_collections); if (unlikely(!__pyx_tuple__18)) __PYX_ERR(1, 103, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__18);
+  __Pyx_GIVEREF(__pyx_tuple__18);
 
   /* "View.MemoryView":309
  *         return self.name
@@ -26944,9 +28928,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * cdef strided = Enum("<strided and direct>") # default
  * cdef indirect = Enum("<strided and indirect>")
  */
-  __pyx_tuple__17 = PyTuple_Pack(1, __pyx_kp_s_strided_and_direct_or_indirect); if (unlikely(!__pyx_tuple__17)) __PYX_ERR(1, 309, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__17);
-  __Pyx_GIVEREF(__pyx_tuple__17);
+  __pyx_tuple__19 = PyTuple_Pack(1, __pyx_kp_s_strided_and_direct_or_indirect); if (unlikely(!__pyx_tuple__19)) __PYX_ERR(1, 309, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__19);
+  __Pyx_GIVEREF(__pyx_tuple__19);
 
   /* "View.MemoryView":310
  * 
@@ -26955,9 +28939,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * cdef indirect = Enum("<strided and indirect>")
  * 
  */
-  __pyx_tuple__18 = PyTuple_Pack(1, __pyx_kp_s_strided_and_direct); if (unlikely(!__pyx_tuple__18)) __PYX_ERR(1, 310, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__18);
-  __Pyx_GIVEREF(__pyx_tuple__18);
+  __pyx_tuple__20 = PyTuple_Pack(1, __pyx_kp_s_strided_and_direct); if (unlikely(!__pyx_tuple__20)) __PYX_ERR(1, 310, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__20);
+  __Pyx_GIVEREF(__pyx_tuple__20);
 
   /* "View.MemoryView":311
  * cdef generic = Enum("<strided and direct or indirect>")
@@ -26966,9 +28950,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * 
  * 
  */
-  __pyx_tuple__19 = PyTuple_Pack(1, __pyx_kp_s_strided_and_indirect); if (unlikely(!__pyx_tuple__19)) __PYX_ERR(1, 311, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__19);
-  __Pyx_GIVEREF(__pyx_tuple__19);
+  __pyx_tuple__21 = PyTuple_Pack(1, __pyx_kp_s_strided_and_indirect); if (unlikely(!__pyx_tuple__21)) __PYX_ERR(1, 311, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__21);
+  __Pyx_GIVEREF(__pyx_tuple__21);
 
   /* "View.MemoryView":314
  * 
@@ -26977,9 +28961,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * cdef indirect_contiguous = Enum("<contiguous and indirect>")
  * 
  */
-  __pyx_tuple__20 = PyTuple_Pack(1, __pyx_kp_s_contiguous_and_direct); if (unlikely(!__pyx_tuple__20)) __PYX_ERR(1, 314, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__20);
-  __Pyx_GIVEREF(__pyx_tuple__20);
+  __pyx_tuple__22 = PyTuple_Pack(1, __pyx_kp_s_contiguous_and_direct); if (unlikely(!__pyx_tuple__22)) __PYX_ERR(1, 314, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__22);
+  __Pyx_GIVEREF(__pyx_tuple__22);
 
   /* "View.MemoryView":315
  * 
@@ -26988,19 +28972,19 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * 
  * 
  */
-  __pyx_tuple__21 = PyTuple_Pack(1, __pyx_kp_s_contiguous_and_indirect); if (unlikely(!__pyx_tuple__21)) __PYX_ERR(1, 315, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__21);
-  __Pyx_GIVEREF(__pyx_tuple__21);
+  __pyx_tuple__23 = PyTuple_Pack(1, __pyx_kp_s_contiguous_and_indirect); if (unlikely(!__pyx_tuple__23)) __PYX_ERR(1, 315, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__23);
+  __Pyx_GIVEREF(__pyx_tuple__23);
 
   /* "(tree fragment)":1
  * def __pyx_unpickle_Enum(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
  *     cdef object __pyx_PickleError
  *     cdef object __pyx_result
  */
-  __pyx_tuple__22 = PyTuple_Pack(5, __pyx_n_s_pyx_type, __pyx_n_s_pyx_checksum, __pyx_n_s_pyx_state, __pyx_n_s_pyx_PickleError, __pyx_n_s_pyx_result); if (unlikely(!__pyx_tuple__22)) __PYX_ERR(1, 1, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__22);
-  __Pyx_GIVEREF(__pyx_tuple__22);
-  __pyx_codeobj__23 = (PyObject*)__Pyx_PyCode_New(3, 0, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__22, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_pyx_unpickle_Enum, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__23)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __pyx_tuple__24 = PyTuple_Pack(5, __pyx_n_s_pyx_type, __pyx_n_s_pyx_checksum, __pyx_n_s_pyx_state, __pyx_n_s_pyx_PickleError, __pyx_n_s_pyx_result); if (unlikely(!__pyx_tuple__24)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__24);
+  __Pyx_GIVEREF(__pyx_tuple__24);
+  __pyx_codeobj__25 = (PyObject*)__Pyx_PyCode_New(3, 0, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__24, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_pyx_unpickle_Enum, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__25)) __PYX_ERR(1, 1, __pyx_L1_error)
 
   /* "sgimc/ops.pyx":32
  * 
@@ -27009,7 +28993,7 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  *     """Check if compiled with OMP support."""
  *     return __has_omp() > 0
  */
-  __pyx_codeobj__24 = (PyObject*)__Pyx_PyCode_New(0, 0, 0, 0, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_sgimc_ops_pyx, __pyx_n_s_has_omp, 32, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__24)) __PYX_ERR(0, 32, __pyx_L1_error)
+  __pyx_codeobj__26 = (PyObject*)__Pyx_PyCode_New(0, 0, 0, 0, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_sgimc_ops_pyx, __pyx_n_s_has_omp, 32, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__26)) __PYX_ERR(0, 32, __pyx_L1_error)
 
   /* "sgimc/ops.pyx":37
  * 
@@ -27018,10 +29002,10 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  *     """Compute the `op_d` operation returning data for a sparse matrix.
  * 
  */
-  __pyx_tuple__25 = PyTuple_Pack(7, __pyx_n_s_R, __pyx_n_s_X, __pyx_n_s_Z, __pyx_n_s_D, __pyx_n_s_n_threads, __pyx_n_s_S, __pyx_n_s_errcode); if (unlikely(!__pyx_tuple__25)) __PYX_ERR(0, 37, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__25);
-  __Pyx_GIVEREF(__pyx_tuple__25);
-  __pyx_codeobj__26 = (PyObject*)__Pyx_PyCode_New(5, 0, 0, 7, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__25, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_sgimc_ops_pyx, __pyx_n_s_op_d, 37, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__26)) __PYX_ERR(0, 37, __pyx_L1_error)
+  __pyx_tuple__27 = PyTuple_Pack(7, __pyx_n_s_R, __pyx_n_s_X, __pyx_n_s_Z, __pyx_n_s_D, __pyx_n_s_n_threads, __pyx_n_s_S, __pyx_n_s_errcode); if (unlikely(!__pyx_tuple__27)) __PYX_ERR(0, 37, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__27);
+  __Pyx_GIVEREF(__pyx_tuple__27);
+  __pyx_codeobj__28 = (PyObject*)__Pyx_PyCode_New(5, 0, 0, 7, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__27, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_sgimc_ops_pyx, __pyx_n_s_op_d, 37, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__28)) __PYX_ERR(0, 37, __pyx_L1_error)
 
   /* "sgimc/ops.pyx":89
  * 
@@ -27030,10 +29014,10 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  *     """Compute the `op_s` operation returning dense matrix.
  * 
  */
-  __pyx_tuple__27 = PyTuple_Pack(9, __pyx_n_s_R, __pyx_n_s_X, __pyx_n_s_Z, __pyx_n_s_S, __pyx_n_s_n_threads, __pyx_n_s_d_1, __pyx_n_s_k, __pyx_n_s_D, __pyx_n_s_errcode); if (unlikely(!__pyx_tuple__27)) __PYX_ERR(0, 89, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__27);
-  __Pyx_GIVEREF(__pyx_tuple__27);
-  __pyx_codeobj__28 = (PyObject*)__Pyx_PyCode_New(5, 0, 0, 9, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__27, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_sgimc_ops_pyx, __pyx_n_s_op_s, 89, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__28)) __PYX_ERR(0, 89, __pyx_L1_error)
+  __pyx_tuple__29 = PyTuple_Pack(9, __pyx_n_s_R, __pyx_n_s_X, __pyx_n_s_Z, __pyx_n_s_S, __pyx_n_s_n_threads, __pyx_n_s_d_1, __pyx_n_s_k, __pyx_n_s_D, __pyx_n_s_errcode); if (unlikely(!__pyx_tuple__29)) __PYX_ERR(0, 89, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__29);
+  __Pyx_GIVEREF(__pyx_tuple__29);
+  __pyx_codeobj__30 = (PyObject*)__Pyx_PyCode_New(5, 0, 0, 9, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__29, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_sgimc_ops_pyx, __pyx_n_s_op_s, 89, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__30)) __PYX_ERR(0, 89, __pyx_L1_error)
 
   /* "sgimc/ops.pyx":140
  * 
@@ -27042,10 +29026,10 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  *     """Compute the `op_d` operation for a diagonal matrix `D`.
  * 
  */
-  __pyx_tuple__29 = PyTuple_Pack(11, __pyx_n_s_R, __pyx_n_s_X, __pyx_n_s_Z, __pyx_n_s_D, __pyx_n_s_n_1, __pyx_n_s_n_2, __pyx_n_s_k, __pyx_n_s_Sp, __pyx_n_s_Sj, __pyx_n_s_S, __pyx_n_s_errcode); if (unlikely(!__pyx_tuple__29)) __PYX_ERR(0, 140, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__29);
-  __Pyx_GIVEREF(__pyx_tuple__29);
-  __pyx_codeobj__30 = (PyObject*)__Pyx_PyCode_New(4, 0, 0, 11, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__29, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_sgimc_ops_pyx, __pyx_n_s_diag_op_d, 140, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__30)) __PYX_ERR(0, 140, __pyx_L1_error)
+  __pyx_tuple__31 = PyTuple_Pack(11, __pyx_n_s_R, __pyx_n_s_X, __pyx_n_s_Z, __pyx_n_s_D, __pyx_n_s_n_1, __pyx_n_s_n_2, __pyx_n_s_k, __pyx_n_s_Sp, __pyx_n_s_Sj, __pyx_n_s_S, __pyx_n_s_errcode); if (unlikely(!__pyx_tuple__31)) __PYX_ERR(0, 140, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__31);
+  __Pyx_GIVEREF(__pyx_tuple__31);
+  __pyx_codeobj__32 = (PyObject*)__Pyx_PyCode_New(4, 0, 0, 11, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__31, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_sgimc_ops_pyx, __pyx_n_s_diag_op_d, 140, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__32)) __PYX_ERR(0, 140, __pyx_L1_error)
 
   /* "sgimc/ops.pyx":193
  * 
@@ -27054,10 +29038,10 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  *     """Compute the `op_s` operation returning the main diagonal of the matrix.
  * 
  */
-  __pyx_tuple__31 = PyTuple_Pack(11, __pyx_n_s_R, __pyx_n_s_X, __pyx_n_s_Z, __pyx_n_s_S, __pyx_n_s_n_1, __pyx_n_s_n_2, __pyx_n_s_k, __pyx_n_s_Sp, __pyx_n_s_Sj, __pyx_n_s_D, __pyx_n_s_errcode); if (unlikely(!__pyx_tuple__31)) __PYX_ERR(0, 193, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__31);
-  __Pyx_GIVEREF(__pyx_tuple__31);
-  __pyx_codeobj__32 = (PyObject*)__Pyx_PyCode_New(4, 0, 0, 11, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__31, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_sgimc_ops_pyx, __pyx_n_s_diag_op_s, 193, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__32)) __PYX_ERR(0, 193, __pyx_L1_error)
+  __pyx_tuple__33 = PyTuple_Pack(11, __pyx_n_s_R, __pyx_n_s_X, __pyx_n_s_Z, __pyx_n_s_S, __pyx_n_s_n_1, __pyx_n_s_n_2, __pyx_n_s_k, __pyx_n_s_Sp, __pyx_n_s_Sj, __pyx_n_s_D, __pyx_n_s_errcode); if (unlikely(!__pyx_tuple__33)) __PYX_ERR(0, 193, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__33);
+  __Pyx_GIVEREF(__pyx_tuple__33);
+  __pyx_codeobj__34 = (PyObject*)__Pyx_PyCode_New(4, 0, 0, 11, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__33, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_sgimc_ops_pyx, __pyx_n_s_diag_op_s, 193, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__34)) __PYX_ERR(0, 193, __pyx_L1_error)
 
   /* "sgimc/ops.pyx":290
  * 
@@ -27066,10 +29050,10 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  *     """Perform L2 group-lass shrinkage on the matrix `D`.
  * 
  */
-  __pyx_tuple__33 = PyTuple_Pack(13, __pyx_n_s_D, __pyx_n_s_C_lasso, __pyx_n_s_C_group, __pyx_n_s_C_ridge, __pyx_n_s_d_1, __pyx_n_s_k, __pyx_n_s_one, __pyx_n_s_i, __pyx_n_s_j, __pyx_n_s_shrinkage, __pyx_n_s_nrm, __pyx_n_s_tmp, __pyx_n_s_out); if (unlikely(!__pyx_tuple__33)) __PYX_ERR(0, 290, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__33);
-  __Pyx_GIVEREF(__pyx_tuple__33);
-  __pyx_codeobj__34 = (PyObject*)__Pyx_PyCode_New(4, 0, 0, 13, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__33, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_sgimc_ops_pyx, __pyx_n_s_shrink, 290, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__34)) __PYX_ERR(0, 290, __pyx_L1_error)
+  __pyx_tuple__35 = PyTuple_Pack(13, __pyx_n_s_D, __pyx_n_s_C_lasso, __pyx_n_s_C_group, __pyx_n_s_C_ridge, __pyx_n_s_d_1, __pyx_n_s_k, __pyx_n_s_one, __pyx_n_s_i, __pyx_n_s_j, __pyx_n_s_shrinkage, __pyx_n_s_nrm, __pyx_n_s_tmp, __pyx_n_s_out); if (unlikely(!__pyx_tuple__35)) __PYX_ERR(0, 290, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__35);
+  __Pyx_GIVEREF(__pyx_tuple__35);
+  __pyx_codeobj__36 = (PyObject*)__Pyx_PyCode_New(4, 0, 0, 13, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__35, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_sgimc_ops_pyx, __pyx_n_s_shrink, 290, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__36)) __PYX_ERR(0, 290, __pyx_L1_error)
 
   /* "sgimc/ops.pyx":368
  * 
@@ -27078,58 +29062,115 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  *     """Perform L2 group-lass shrinkage on a vector `D`.
  * 
  */
-  __pyx_tuple__35 = PyTuple_Pack(11, __pyx_n_s_D, __pyx_n_s_C_lasso, __pyx_n_s_C_group, __pyx_n_s_C_ridge, __pyx_n_s_k, __pyx_n_s_one, __pyx_n_s_i, __pyx_n_s_shrinkage, __pyx_n_s_nrm, __pyx_n_s_tmp, __pyx_n_s_out); if (unlikely(!__pyx_tuple__35)) __PYX_ERR(0, 368, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__35);
-  __Pyx_GIVEREF(__pyx_tuple__35);
-  __pyx_codeobj__36 = (PyObject*)__Pyx_PyCode_New(4, 0, 0, 11, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__35, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_sgimc_ops_pyx, __pyx_n_s_shrink_row, 368, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__36)) __PYX_ERR(0, 368, __pyx_L1_error)
+  __pyx_tuple__37 = PyTuple_Pack(11, __pyx_n_s_D, __pyx_n_s_C_lasso, __pyx_n_s_C_group, __pyx_n_s_C_ridge, __pyx_n_s_k, __pyx_n_s_one, __pyx_n_s_i, __pyx_n_s_shrinkage, __pyx_n_s_nrm, __pyx_n_s_tmp, __pyx_n_s_out); if (unlikely(!__pyx_tuple__37)) __PYX_ERR(0, 368, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__37);
+  __Pyx_GIVEREF(__pyx_tuple__37);
+  __pyx_codeobj__38 = (PyObject*)__Pyx_PyCode_New(4, 0, 0, 11, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__37, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_sgimc_ops_pyx, __pyx_n_s_shrink_row, 368, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__38)) __PYX_ERR(0, 368, __pyx_L1_error)
 
-  /* "sgimc/ops.pyx":438
+  /* "sgimc/ops.pyx":448
+ * 
+ * 
+ * def huber_loss(const double[::1] predict,             # <<<<<<<<<<<<<<
+ *                const double[::1] target,
+ *                double epsilon):
+ */
+  __pyx_tuple__39 = PyTuple_Pack(7, __pyx_n_s_predict, __pyx_n_s_target, __pyx_n_s_epsilon, __pyx_n_s_i, __pyx_n_s_n, __pyx_n_s_resid, __pyx_n_s_out); if (unlikely(!__pyx_tuple__39)) __PYX_ERR(0, 448, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__39);
+  __Pyx_GIVEREF(__pyx_tuple__39);
+  __pyx_codeobj__40 = (PyObject*)__Pyx_PyCode_New(3, 0, 0, 7, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__39, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_sgimc_ops_pyx, __pyx_n_s_huber_loss, 448, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__40)) __PYX_ERR(0, 448, __pyx_L1_error)
+
+  /* "sgimc/ops.pyx":491
+ * 
+ * 
+ * def huber_grad(const double[::1] predict,             # <<<<<<<<<<<<<<
+ *                const double[::1] target,
+ *                double epsilon):
+ */
+  __pyx_codeobj__41 = (PyObject*)__Pyx_PyCode_New(3, 0, 0, 7, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__39, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_sgimc_ops_pyx, __pyx_n_s_huber_grad, 491, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__41)) __PYX_ERR(0, 491, __pyx_L1_error)
+
+  /* "sgimc/ops.pyx":536
+ * 
+ * 
+ * def logistic_loss(const double[::1] logit, const double[::1] target):             # <<<<<<<<<<<<<<
+ *     """Compute the logistic loss `log(1 + exp(- target * logit))`.
+ * 
+ */
+  __pyx_tuple__42 = PyTuple_Pack(6, __pyx_n_s_logit, __pyx_n_s_target, __pyx_n_s_i, __pyx_n_s_n, __pyx_n_s_margin, __pyx_n_s_out); if (unlikely(!__pyx_tuple__42)) __PYX_ERR(0, 536, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__42);
+  __Pyx_GIVEREF(__pyx_tuple__42);
+  __pyx_codeobj__43 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 6, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__42, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_sgimc_ops_pyx, __pyx_n_s_logistic_loss, 536, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__43)) __PYX_ERR(0, 536, __pyx_L1_error)
+
+  /* "sgimc/ops.pyx":573
+ * 
+ * 
+ * def logistic_grad(const double[::1] logit, const double[::1] target):             # <<<<<<<<<<<<<<
+ *     """Compute the derivative of the logistic loss w.r.t. `logit`.
+ * 
+ */
+  __pyx_tuple__44 = PyTuple_Pack(5, __pyx_n_s_logit, __pyx_n_s_target, __pyx_n_s_i, __pyx_n_s_n, __pyx_n_s_out); if (unlikely(!__pyx_tuple__44)) __PYX_ERR(0, 573, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__44);
+  __Pyx_GIVEREF(__pyx_tuple__44);
+  __pyx_codeobj__45 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__44, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_sgimc_ops_pyx, __pyx_n_s_logistic_grad, 573, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__45)) __PYX_ERR(0, 573, __pyx_L1_error)
+
+  /* "sgimc/ops.pyx":605
+ * 
+ * 
+ * def logistic_hess(const double[::1] logit):             # <<<<<<<<<<<<<<
+ *     """Compute the second derivative of the logistic loss w.r.t. `logit`.
+ * 
+ */
+  __pyx_tuple__46 = PyTuple_Pack(5, __pyx_n_s_logit, __pyx_n_s_i, __pyx_n_s_n, __pyx_n_s_z, __pyx_n_s_out); if (unlikely(!__pyx_tuple__46)) __PYX_ERR(0, 605, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__46);
+  __Pyx_GIVEREF(__pyx_tuple__46);
+  __pyx_codeobj__47 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__46, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_sgimc_ops_pyx, __pyx_n_s_logistic_hess, 605, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__47)) __PYX_ERR(0, 605, __pyx_L1_error)
+
+  /* "sgimc/ops.pyx":634
  * 
  * 
  * def _dense_op_d(object R,             # <<<<<<<<<<<<<<
  *                 double[:, ::1] X,
  *                 double[:, ::1] Z,
  */
-  __pyx_tuple__37 = PyTuple_Pack(13, __pyx_n_s_R, __pyx_n_s_X, __pyx_n_s_Z, __pyx_n_s_D, __pyx_n_s_S, __pyx_n_s_n_threads, __pyx_n_s_errcode, __pyx_n_s_n_1, __pyx_n_s_n_2, __pyx_n_s_d_1, __pyx_n_s_k, __pyx_n_s_Sp, __pyx_n_s_Sj); if (unlikely(!__pyx_tuple__37)) __PYX_ERR(0, 438, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__37);
-  __Pyx_GIVEREF(__pyx_tuple__37);
-  __pyx_codeobj__38 = (PyObject*)__Pyx_PyCode_New(6, 0, 0, 13, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__37, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_sgimc_ops_pyx, __pyx_n_s_dense_op_d, 438, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__38)) __PYX_ERR(0, 438, __pyx_L1_error)
+  __pyx_tuple__48 = PyTuple_Pack(13, __pyx_n_s_R, __pyx_n_s_X, __pyx_n_s_Z, __pyx_n_s_D, __pyx_n_s_S, __pyx_n_s_n_threads, __pyx_n_s_errcode, __pyx_n_s_n_1, __pyx_n_s_n_2, __pyx_n_s_d_1, __pyx_n_s_k, __pyx_n_s_Sp, __pyx_n_s_Sj); if (unlikely(!__pyx_tuple__48)) __PYX_ERR(0, 634, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__48);
+  __Pyx_GIVEREF(__pyx_tuple__48);
+  __pyx_codeobj__49 = (PyObject*)__Pyx_PyCode_New(6, 0, 0, 13, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__48, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_sgimc_ops_pyx, __pyx_n_s_dense_op_d, 634, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__49)) __PYX_ERR(0, 634, __pyx_L1_error)
 
-  /* "sgimc/ops.pyx":467
+  /* "sgimc/ops.pyx":663
  * 
  * 
  * def _sparse_op_d(object R,             # <<<<<<<<<<<<<<
  *                  object X,
  *                  double[:, ::1] Z,
  */
-  __pyx_tuple__39 = PyTuple_Pack(16, __pyx_n_s_R, __pyx_n_s_X, __pyx_n_s_Z, __pyx_n_s_D, __pyx_n_s_S, __pyx_n_s_n_threads, __pyx_n_s_errcode, __pyx_n_s_n_1, __pyx_n_s_n_2, __pyx_n_s_d_1, __pyx_n_s_k, __pyx_n_s_Sp, __pyx_n_s_Sj, __pyx_n_s_Xp, __pyx_n_s_Xj, __pyx_n_s_Xx); if (unlikely(!__pyx_tuple__39)) __PYX_ERR(0, 467, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__39);
-  __Pyx_GIVEREF(__pyx_tuple__39);
-  __pyx_codeobj__40 = (PyObject*)__Pyx_PyCode_New(6, 0, 0, 16, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__39, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_sgimc_ops_pyx, __pyx_n_s_sparse_op_d, 467, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__40)) __PYX_ERR(0, 467, __pyx_L1_error)
+  __pyx_tuple__50 = PyTuple_Pack(16, __pyx_n_s_R, __pyx_n_s_X, __pyx_n_s_Z, __pyx_n_s_D, __pyx_n_s_S, __pyx_n_s_n_threads, __pyx_n_s_errcode, __pyx_n_s_n_1, __pyx_n_s_n_2, __pyx_n_s_d_1, __pyx_n_s_k, __pyx_n_s_Sp, __pyx_n_s_Sj, __pyx_n_s_Xp, __pyx_n_s_Xj, __pyx_n_s_Xx); if (unlikely(!__pyx_tuple__50)) __PYX_ERR(0, 663, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__50);
+  __Pyx_GIVEREF(__pyx_tuple__50);
+  __pyx_codeobj__51 = (PyObject*)__Pyx_PyCode_New(6, 0, 0, 16, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__50, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_sgimc_ops_pyx, __pyx_n_s_sparse_op_d, 663, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__51)) __PYX_ERR(0, 663, __pyx_L1_error)
 
-  /* "sgimc/ops.pyx":497
+  /* "sgimc/ops.pyx":693
  * 
  * 
  * def _dense_op_s(object R,             # <<<<<<<<<<<<<<
  *                 double[:, ::1] X,
  *                 double[:, ::1] Z,
  */
-  __pyx_tuple__41 = PyTuple_Pack(13, __pyx_n_s_R, __pyx_n_s_X, __pyx_n_s_Z, __pyx_n_s_S, __pyx_n_s_D, __pyx_n_s_n_threads, __pyx_n_s_errcode, __pyx_n_s_n_1, __pyx_n_s_n_2, __pyx_n_s_d_1, __pyx_n_s_k, __pyx_n_s_Sp, __pyx_n_s_Sj); if (unlikely(!__pyx_tuple__41)) __PYX_ERR(0, 497, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__41);
-  __Pyx_GIVEREF(__pyx_tuple__41);
-  __pyx_codeobj__42 = (PyObject*)__Pyx_PyCode_New(6, 0, 0, 13, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__41, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_sgimc_ops_pyx, __pyx_n_s_dense_op_s, 497, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__42)) __PYX_ERR(0, 497, __pyx_L1_error)
+  __pyx_tuple__52 = PyTuple_Pack(13, __pyx_n_s_R, __pyx_n_s_X, __pyx_n_s_Z, __pyx_n_s_S, __pyx_n_s_D, __pyx_n_s_n_threads, __pyx_n_s_errcode, __pyx_n_s_n_1, __pyx_n_s_n_2, __pyx_n_s_d_1, __pyx_n_s_k, __pyx_n_s_Sp, __pyx_n_s_Sj); if (unlikely(!__pyx_tuple__52)) __PYX_ERR(0, 693, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__52);
+  __Pyx_GIVEREF(__pyx_tuple__52);
+  __pyx_codeobj__53 = (PyObject*)__Pyx_PyCode_New(6, 0, 0, 13, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__52, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_sgimc_ops_pyx, __pyx_n_s_dense_op_s, 693, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__53)) __PYX_ERR(0, 693, __pyx_L1_error)
 
-  /* "sgimc/ops.pyx":525
+  /* "sgimc/ops.pyx":721
  * 
  * 
  * def _sparse_op_s(object R,             # <<<<<<<<<<<<<<
  *                  object X,
  *                  double[:, ::1] Z,
  */
-  __pyx_tuple__43 = PyTuple_Pack(16, __pyx_n_s_R, __pyx_n_s_X, __pyx_n_s_Z, __pyx_n_s_S, __pyx_n_s_D, __pyx_n_s_n_threads, __pyx_n_s_errcode, __pyx_n_s_n_1, __pyx_n_s_n_2, __pyx_n_s_d_1, __pyx_n_s_k, __pyx_n_s_Sp, __pyx_n_s_Sj, __pyx_n_s_Xp, __pyx_n_s_Xj, __pyx_n_s_Xx); if (unlikely(!__pyx_tuple__43)) __PYX_ERR(0, 525, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__43);
-  __Pyx_GIVEREF(__pyx_tuple__43);
-  __pyx_codeobj__44 = (PyObject*)__Pyx_PyCode_New(6, 0, 0, 16, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__43, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_sgimc_ops_pyx, __pyx_n_s_sparse_op_s, 525, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__44)) __PYX_ERR(0, 525, __pyx_L1_error)
+  __pyx_tuple__54 = PyTuple_Pack(16, __pyx_n_s_R, __pyx_n_s_X, __pyx_n_s_Z, __pyx_n_s_S, __pyx_n_s_D, __pyx_n_s_n_threads, __pyx_n_s_errcode, __pyx_n_s_n_1, __pyx_n_s_n_2, __pyx_n_s_d_1, __pyx_n_s_k, __pyx_n_s_Sp, __pyx_n_s_Sj, __pyx_n_s_Xp, __pyx_n_s_Xj, __pyx_n_s_Xx); if (unlikely(!__pyx_tuple__54)) __PYX_ERR(0, 721, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__54);
+  __Pyx_GIVEREF(__pyx_tuple__54);
+  __pyx_codeobj__55 = (PyObject*)__Pyx_PyCode_New(6, 0, 0, 16, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__54, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_sgimc_ops_pyx, __pyx_n_s_sparse_op_s, 721, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__55)) __PYX_ERR(0, 721, __pyx_L1_error)
   __Pyx_RefNannyFinishContext();
   return 0;
   __pyx_L1_error:;
@@ -27387,23 +29428,23 @@ static int __Pyx_modinit_type_import_code(void) {
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_ptype_7cpython_7complex_complex = __Pyx_ImportType_3_0_11(__pyx_t_1, __Pyx_BUILTIN_MODULE_NAME, "complex", sizeof(PyComplexObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_11(PyComplexObject),__Pyx_ImportType_CheckSize_Warn_3_0_11); if (!__pyx_ptype_7cpython_7complex_complex) __PYX_ERR(6, 15, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = PyImport_ImportModule("numpy"); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 271, __pyx_L1_error)
+  __pyx_t_1 = PyImport_ImportModule("numpy"); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 229, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_ptype_5numpy_dtype = __Pyx_ImportType_3_0_11(__pyx_t_1, "numpy", "dtype", sizeof(PyArray_Descr), __PYX_GET_STRUCT_ALIGNMENT_3_0_11(PyArray_Descr),__Pyx_ImportType_CheckSize_Ignore_3_0_11); if (!__pyx_ptype_5numpy_dtype) __PYX_ERR(2, 271, __pyx_L1_error)
-  __pyx_ptype_5numpy_flatiter = __Pyx_ImportType_3_0_11(__pyx_t_1, "numpy", "flatiter", sizeof(PyArrayIterObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_11(PyArrayIterObject),__Pyx_ImportType_CheckSize_Ignore_3_0_11); if (!__pyx_ptype_5numpy_flatiter) __PYX_ERR(2, 316, __pyx_L1_error)
-  __pyx_ptype_5numpy_broadcast = __Pyx_ImportType_3_0_11(__pyx_t_1, "numpy", "broadcast", sizeof(PyArrayMultiIterObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_11(PyArrayMultiIterObject),__Pyx_ImportType_CheckSize_Ignore_3_0_11); if (!__pyx_ptype_5numpy_broadcast) __PYX_ERR(2, 320, __pyx_L1_error)
-  __pyx_ptype_5numpy_ndarray = __Pyx_ImportType_3_0_11(__pyx_t_1, "numpy", "ndarray", sizeof(PyArrayObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_11(PyArrayObject),__Pyx_ImportType_CheckSize_Ignore_3_0_11); if (!__pyx_ptype_5numpy_ndarray) __PYX_ERR(2, 359, __pyx_L1_error)
-  __pyx_ptype_5numpy_generic = __Pyx_ImportType_3_0_11(__pyx_t_1, "numpy", "generic", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_11(PyObject),__Pyx_ImportType_CheckSize_Warn_3_0_11); if (!__pyx_ptype_5numpy_generic) __PYX_ERR(2, 848, __pyx_L1_error)
-  __pyx_ptype_5numpy_number = __Pyx_ImportType_3_0_11(__pyx_t_1, "numpy", "number", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_11(PyObject),__Pyx_ImportType_CheckSize_Warn_3_0_11); if (!__pyx_ptype_5numpy_number) __PYX_ERR(2, 850, __pyx_L1_error)
-  __pyx_ptype_5numpy_integer = __Pyx_ImportType_3_0_11(__pyx_t_1, "numpy", "integer", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_11(PyObject),__Pyx_ImportType_CheckSize_Warn_3_0_11); if (!__pyx_ptype_5numpy_integer) __PYX_ERR(2, 852, __pyx_L1_error)
-  __pyx_ptype_5numpy_signedinteger = __Pyx_ImportType_3_0_11(__pyx_t_1, "numpy", "signedinteger", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_11(PyObject),__Pyx_ImportType_CheckSize_Warn_3_0_11); if (!__pyx_ptype_5numpy_signedinteger) __PYX_ERR(2, 854, __pyx_L1_error)
-  __pyx_ptype_5numpy_unsignedinteger = __Pyx_ImportType_3_0_11(__pyx_t_1, "numpy", "unsignedinteger", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_11(PyObject),__Pyx_ImportType_CheckSize_Warn_3_0_11); if (!__pyx_ptype_5numpy_unsignedinteger) __PYX_ERR(2, 856, __pyx_L1_error)
-  __pyx_ptype_5numpy_inexact = __Pyx_ImportType_3_0_11(__pyx_t_1, "numpy", "inexact", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_11(PyObject),__Pyx_ImportType_CheckSize_Warn_3_0_11); if (!__pyx_ptype_5numpy_inexact) __PYX_ERR(2, 858, __pyx_L1_error)
-  __pyx_ptype_5numpy_floating = __Pyx_ImportType_3_0_11(__pyx_t_1, "numpy", "floating", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_11(PyObject),__Pyx_ImportType_CheckSize_Warn_3_0_11); if (!__pyx_ptype_5numpy_floating) __PYX_ERR(2, 860, __pyx_L1_error)
-  __pyx_ptype_5numpy_complexfloating = __Pyx_ImportType_3_0_11(__pyx_t_1, "numpy", "complexfloating", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_11(PyObject),__Pyx_ImportType_CheckSize_Warn_3_0_11); if (!__pyx_ptype_5numpy_complexfloating) __PYX_ERR(2, 862, __pyx_L1_error)
-  __pyx_ptype_5numpy_flexible = __Pyx_ImportType_3_0_11(__pyx_t_1, "numpy", "flexible", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_11(PyObject),__Pyx_ImportType_CheckSize_Warn_3_0_11); if (!__pyx_ptype_5numpy_flexible) __PYX_ERR(2, 864, __pyx_L1_error)
-  __pyx_ptype_5numpy_character = __Pyx_ImportType_3_0_11(__pyx_t_1, "numpy", "character", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_11(PyObject),__Pyx_ImportType_CheckSize_Warn_3_0_11); if (!__pyx_ptype_5numpy_character) __PYX_ERR(2, 866, __pyx_L1_error)
-  __pyx_ptype_5numpy_ufunc = __Pyx_ImportType_3_0_11(__pyx_t_1, "numpy", "ufunc", sizeof(PyUFuncObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_11(PyUFuncObject),__Pyx_ImportType_CheckSize_Ignore_3_0_11); if (!__pyx_ptype_5numpy_ufunc) __PYX_ERR(2, 930, __pyx_L1_error)
+  __pyx_ptype_5numpy_dtype = __Pyx_ImportType_3_0_11(__pyx_t_1, "numpy", "dtype", sizeof(PyArray_Descr), __PYX_GET_STRUCT_ALIGNMENT_3_0_11(PyArray_Descr),__Pyx_ImportType_CheckSize_Ignore_3_0_11); if (!__pyx_ptype_5numpy_dtype) __PYX_ERR(2, 229, __pyx_L1_error)
+  __pyx_ptype_5numpy_flatiter = __Pyx_ImportType_3_0_11(__pyx_t_1, "numpy", "flatiter", sizeof(PyArrayIterObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_11(PyArrayIterObject),__Pyx_ImportType_CheckSize_Ignore_3_0_11); if (!__pyx_ptype_5numpy_flatiter) __PYX_ERR(2, 274, __pyx_L1_error)
+  __pyx_ptype_5numpy_broadcast = __Pyx_ImportType_3_0_11(__pyx_t_1, "numpy", "broadcast", sizeof(PyArrayMultiIterObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_11(PyArrayMultiIterObject),__Pyx_ImportType_CheckSize_Ignore_3_0_11); if (!__pyx_ptype_5numpy_broadcast) __PYX_ERR(2, 278, __pyx_L1_error)
+  __pyx_ptype_5numpy_ndarray = __Pyx_ImportType_3_0_11(__pyx_t_1, "numpy", "ndarray", sizeof(PyArrayObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_11(PyArrayObject),__Pyx_ImportType_CheckSize_Ignore_3_0_11); if (!__pyx_ptype_5numpy_ndarray) __PYX_ERR(2, 317, __pyx_L1_error)
+  __pyx_ptype_5numpy_generic = __Pyx_ImportType_3_0_11(__pyx_t_1, "numpy", "generic", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_11(PyObject),__Pyx_ImportType_CheckSize_Warn_3_0_11); if (!__pyx_ptype_5numpy_generic) __PYX_ERR(2, 826, __pyx_L1_error)
+  __pyx_ptype_5numpy_number = __Pyx_ImportType_3_0_11(__pyx_t_1, "numpy", "number", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_11(PyObject),__Pyx_ImportType_CheckSize_Warn_3_0_11); if (!__pyx_ptype_5numpy_number) __PYX_ERR(2, 828, __pyx_L1_error)
+  __pyx_ptype_5numpy_integer = __Pyx_ImportType_3_0_11(__pyx_t_1, "numpy", "integer", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_11(PyObject),__Pyx_ImportType_CheckSize_Warn_3_0_11); if (!__pyx_ptype_5numpy_integer) __PYX_ERR(2, 830, __pyx_L1_error)
+  __pyx_ptype_5numpy_signedinteger = __Pyx_ImportType_3_0_11(__pyx_t_1, "numpy", "signedinteger", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_11(PyObject),__Pyx_ImportType_CheckSize_Warn_3_0_11); if (!__pyx_ptype_5numpy_signedinteger) __PYX_ERR(2, 832, __pyx_L1_error)
+  __pyx_ptype_5numpy_unsignedinteger = __Pyx_ImportType_3_0_11(__pyx_t_1, "numpy", "unsignedinteger", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_11(PyObject),__Pyx_ImportType_CheckSize_Warn_3_0_11); if (!__pyx_ptype_5numpy_unsignedinteger) __PYX_ERR(2, 834, __pyx_L1_error)
+  __pyx_ptype_5numpy_inexact = __Pyx_ImportType_3_0_11(__pyx_t_1, "numpy", "inexact", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_11(PyObject),__Pyx_ImportType_CheckSize_Warn_3_0_11); if (!__pyx_ptype_5numpy_inexact) __PYX_ERR(2, 836, __pyx_L1_error)
+  __pyx_ptype_5numpy_floating = __Pyx_ImportType_3_0_11(__pyx_t_1, "numpy", "floating", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_11(PyObject),__Pyx_ImportType_CheckSize_Warn_3_0_11); if (!__pyx_ptype_5numpy_floating) __PYX_ERR(2, 838, __pyx_L1_error)
+  __pyx_ptype_5numpy_complexfloating = __Pyx_ImportType_3_0_11(__pyx_t_1, "numpy", "complexfloating", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_11(PyObject),__Pyx_ImportType_CheckSize_Warn_3_0_11); if (!__pyx_ptype_5numpy_complexfloating) __PYX_ERR(2, 840, __pyx_L1_error)
+  __pyx_ptype_5numpy_flexible = __Pyx_ImportType_3_0_11(__pyx_t_1, "numpy", "flexible", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_11(PyObject),__Pyx_ImportType_CheckSize_Warn_3_0_11); if (!__pyx_ptype_5numpy_flexible) __PYX_ERR(2, 842, __pyx_L1_error)
+  __pyx_ptype_5numpy_character = __Pyx_ImportType_3_0_11(__pyx_t_1, "numpy", "character", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_11(PyObject),__Pyx_ImportType_CheckSize_Warn_3_0_11); if (!__pyx_ptype_5numpy_character) __PYX_ERR(2, 844, __pyx_L1_error)
+  __pyx_ptype_5numpy_ufunc = __Pyx_ImportType_3_0_11(__pyx_t_1, "numpy", "ufunc", sizeof(PyUFuncObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_11(PyUFuncObject),__Pyx_ImportType_CheckSize_Ignore_3_0_11); if (!__pyx_ptype_5numpy_ufunc) __PYX_ERR(2, 908, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_RefNannyFinishContext();
   return 0;
@@ -27749,12 +29790,12 @@ if (!__Pyx_RefNanny) {
  *         __pyx_collections_abc_Sequence = __import__("collections.abc").abc.Sequence
  *     else:
  */
-      __pyx_t_4 = __Pyx_PyObject_Call(__pyx_builtin___import__, __pyx_tuple__13, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 100, __pyx_L2_error)
+      __pyx_t_4 = __Pyx_PyObject_Call(__pyx_builtin___import__, __pyx_tuple__15, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 100, __pyx_L2_error)
       __Pyx_GOTREF(__pyx_t_4);
       __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_version_info); if (unlikely(!__pyx_t_5)) __PYX_ERR(1, 100, __pyx_L2_error)
       __Pyx_GOTREF(__pyx_t_5);
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __pyx_t_4 = PyObject_RichCompare(__pyx_t_5, __pyx_tuple__14, Py_GE); __Pyx_XGOTREF(__pyx_t_4); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 100, __pyx_L2_error)
+      __pyx_t_4 = PyObject_RichCompare(__pyx_t_5, __pyx_tuple__16, Py_GE); __Pyx_XGOTREF(__pyx_t_4); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 100, __pyx_L2_error)
       __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
       __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely((__pyx_t_6 < 0))) __PYX_ERR(1, 100, __pyx_L2_error)
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
@@ -27767,7 +29808,7 @@ if (!__Pyx_RefNanny) {
  *     else:
  *         __pyx_collections_abc_Sequence = __import__("collections").Sequence
  */
-        __pyx_t_4 = __Pyx_PyObject_Call(__pyx_builtin___import__, __pyx_tuple__15, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 101, __pyx_L2_error)
+        __pyx_t_4 = __Pyx_PyObject_Call(__pyx_builtin___import__, __pyx_tuple__17, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 101, __pyx_L2_error)
         __Pyx_GOTREF(__pyx_t_4);
         __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_abc); if (unlikely(!__pyx_t_5)) __PYX_ERR(1, 101, __pyx_L2_error)
         __Pyx_GOTREF(__pyx_t_5);
@@ -27798,7 +29839,7 @@ if (!__Pyx_RefNanny) {
  * 
  */
       /*else*/ {
-        __pyx_t_4 = __Pyx_PyObject_Call(__pyx_builtin___import__, __pyx_tuple__16, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 103, __pyx_L2_error)
+        __pyx_t_4 = __Pyx_PyObject_Call(__pyx_builtin___import__, __pyx_tuple__18, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 103, __pyx_L2_error)
         __Pyx_GOTREF(__pyx_t_4);
         __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_Sequence); if (unlikely(!__pyx_t_5)) __PYX_ERR(1, 103, __pyx_L2_error)
         __Pyx_GOTREF(__pyx_t_5);
@@ -27963,7 +30004,7 @@ if (!__Pyx_RefNanny) {
  * cdef strided = Enum("<strided and direct>") # default
  * cdef indirect = Enum("<strided and indirect>")
  */
-  __pyx_t_7 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__17, NULL); if (unlikely(!__pyx_t_7)) __PYX_ERR(1, 309, __pyx_L1_error)
+  __pyx_t_7 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__19, NULL); if (unlikely(!__pyx_t_7)) __PYX_ERR(1, 309, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_7);
   __Pyx_XGOTREF(generic);
   __Pyx_DECREF_SET(generic, __pyx_t_7);
@@ -27977,7 +30018,7 @@ if (!__Pyx_RefNanny) {
  * cdef indirect = Enum("<strided and indirect>")
  * 
  */
-  __pyx_t_7 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__18, NULL); if (unlikely(!__pyx_t_7)) __PYX_ERR(1, 310, __pyx_L1_error)
+  __pyx_t_7 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__20, NULL); if (unlikely(!__pyx_t_7)) __PYX_ERR(1, 310, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_7);
   __Pyx_XGOTREF(strided);
   __Pyx_DECREF_SET(strided, __pyx_t_7);
@@ -27991,7 +30032,7 @@ if (!__Pyx_RefNanny) {
  * 
  * 
  */
-  __pyx_t_7 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__19, NULL); if (unlikely(!__pyx_t_7)) __PYX_ERR(1, 311, __pyx_L1_error)
+  __pyx_t_7 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__21, NULL); if (unlikely(!__pyx_t_7)) __PYX_ERR(1, 311, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_7);
   __Pyx_XGOTREF(indirect);
   __Pyx_DECREF_SET(indirect, __pyx_t_7);
@@ -28005,7 +30046,7 @@ if (!__Pyx_RefNanny) {
  * cdef indirect_contiguous = Enum("<contiguous and indirect>")
  * 
  */
-  __pyx_t_7 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__20, NULL); if (unlikely(!__pyx_t_7)) __PYX_ERR(1, 314, __pyx_L1_error)
+  __pyx_t_7 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__22, NULL); if (unlikely(!__pyx_t_7)) __PYX_ERR(1, 314, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_7);
   __Pyx_XGOTREF(contiguous);
   __Pyx_DECREF_SET(contiguous, __pyx_t_7);
@@ -28019,7 +30060,7 @@ if (!__Pyx_RefNanny) {
  * 
  * 
  */
-  __pyx_t_7 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__21, NULL); if (unlikely(!__pyx_t_7)) __PYX_ERR(1, 315, __pyx_L1_error)
+  __pyx_t_7 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__23, NULL); if (unlikely(!__pyx_t_7)) __PYX_ERR(1, 315, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_7);
   __Pyx_XGOTREF(indirect_contiguous);
   __Pyx_DECREF_SET(indirect_contiguous, __pyx_t_7);
@@ -28256,7 +30297,7 @@ if (!__Pyx_RefNanny) {
  * 
  * from scipy.sparse import csr_matrix             # <<<<<<<<<<<<<<
  * 
- * from libc.math cimport fabs, sqrt
+ * from libc.math cimport fabs, sqrt, exp, log1p
  */
   __pyx_t_7 = PyList_New(1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 14, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_7);
@@ -28288,7 +30329,7 @@ if (!__Pyx_RefNanny) {
  *     """Check if compiled with OMP support."""
  *     return __has_omp() > 0
  */
-  __pyx_t_4 = __Pyx_CyFunction_New(&__pyx_mdef_5sgimc_3ops_1has_omp, 0, __pyx_n_s_has_omp, NULL, __pyx_n_s_sgimc_ops, __pyx_d, ((PyObject *)__pyx_codeobj__24)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 32, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_CyFunction_New(&__pyx_mdef_5sgimc_3ops_1has_omp, 0, __pyx_n_s_has_omp, NULL, __pyx_n_s_sgimc_ops, __pyx_d, ((PyObject *)__pyx_codeobj__26)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 32, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   if (PyDict_SetItem(__pyx_d, __pyx_n_s_has_omp, __pyx_t_4) < 0) __PYX_ERR(0, 32, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
@@ -28307,7 +30348,7 @@ if (!__Pyx_RefNanny) {
   __Pyx_GIVEREF(__pyx_t_4);
   if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_4)) __PYX_ERR(0, 37, __pyx_L1_error);
   __pyx_t_4 = 0;
-  __pyx_t_4 = __Pyx_CyFunction_New(&__pyx_mdef_5sgimc_3ops_3op_d, 0, __pyx_n_s_op_d, NULL, __pyx_n_s_sgimc_ops, __pyx_d, ((PyObject *)__pyx_codeobj__26)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 37, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_CyFunction_New(&__pyx_mdef_5sgimc_3ops_3op_d, 0, __pyx_n_s_op_d, NULL, __pyx_n_s_sgimc_ops, __pyx_d, ((PyObject *)__pyx_codeobj__28)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 37, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_4, __pyx_t_7);
   __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
@@ -28328,7 +30369,7 @@ if (!__Pyx_RefNanny) {
   __Pyx_GIVEREF(__pyx_t_4);
   if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_4)) __PYX_ERR(0, 89, __pyx_L1_error);
   __pyx_t_4 = 0;
-  __pyx_t_4 = __Pyx_CyFunction_New(&__pyx_mdef_5sgimc_3ops_5op_s, 0, __pyx_n_s_op_s, NULL, __pyx_n_s_sgimc_ops, __pyx_d, ((PyObject *)__pyx_codeobj__28)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 89, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_CyFunction_New(&__pyx_mdef_5sgimc_3ops_5op_s, 0, __pyx_n_s_op_s, NULL, __pyx_n_s_sgimc_ops, __pyx_d, ((PyObject *)__pyx_codeobj__30)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 89, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_4, __pyx_t_7);
   __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
@@ -28342,7 +30383,7 @@ if (!__Pyx_RefNanny) {
  *     """Compute the `op_d` operation for a diagonal matrix `D`.
  * 
  */
-  __pyx_t_4 = __Pyx_CyFunction_New(&__pyx_mdef_5sgimc_3ops_7diag_op_d, 0, __pyx_n_s_diag_op_d, NULL, __pyx_n_s_sgimc_ops, __pyx_d, ((PyObject *)__pyx_codeobj__30)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 140, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_CyFunction_New(&__pyx_mdef_5sgimc_3ops_7diag_op_d, 0, __pyx_n_s_diag_op_d, NULL, __pyx_n_s_sgimc_ops, __pyx_d, ((PyObject *)__pyx_codeobj__32)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 140, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   if (PyDict_SetItem(__pyx_d, __pyx_n_s_diag_op_d, __pyx_t_4) < 0) __PYX_ERR(0, 140, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
@@ -28354,7 +30395,7 @@ if (!__Pyx_RefNanny) {
  *     """Compute the `op_s` operation returning the main diagonal of the matrix.
  * 
  */
-  __pyx_t_4 = __Pyx_CyFunction_New(&__pyx_mdef_5sgimc_3ops_9diag_op_s, 0, __pyx_n_s_diag_op_s, NULL, __pyx_n_s_sgimc_ops, __pyx_d, ((PyObject *)__pyx_codeobj__32)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 193, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_CyFunction_New(&__pyx_mdef_5sgimc_3ops_9diag_op_s, 0, __pyx_n_s_diag_op_s, NULL, __pyx_n_s_sgimc_ops, __pyx_d, ((PyObject *)__pyx_codeobj__34)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 193, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   if (PyDict_SetItem(__pyx_d, __pyx_n_s_diag_op_s, __pyx_t_4) < 0) __PYX_ERR(0, 193, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
@@ -28366,7 +30407,7 @@ if (!__Pyx_RefNanny) {
  *     """Perform L2 group-lass shrinkage on the matrix `D`.
  * 
  */
-  __pyx_t_4 = __Pyx_CyFunction_New(&__pyx_mdef_5sgimc_3ops_11shrink, 0, __pyx_n_s_shrink, NULL, __pyx_n_s_sgimc_ops, __pyx_d, ((PyObject *)__pyx_codeobj__34)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 290, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_CyFunction_New(&__pyx_mdef_5sgimc_3ops_11shrink, 0, __pyx_n_s_shrink, NULL, __pyx_n_s_sgimc_ops, __pyx_d, ((PyObject *)__pyx_codeobj__36)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 290, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   if (PyDict_SetItem(__pyx_d, __pyx_n_s_shrink, __pyx_t_4) < 0) __PYX_ERR(0, 290, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
@@ -28378,125 +30419,185 @@ if (!__Pyx_RefNanny) {
  *     """Perform L2 group-lass shrinkage on a vector `D`.
  * 
  */
-  __pyx_t_4 = __Pyx_CyFunction_New(&__pyx_mdef_5sgimc_3ops_13shrink_row, 0, __pyx_n_s_shrink_row, NULL, __pyx_n_s_sgimc_ops, __pyx_d, ((PyObject *)__pyx_codeobj__36)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 368, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_CyFunction_New(&__pyx_mdef_5sgimc_3ops_13shrink_row, 0, __pyx_n_s_shrink_row, NULL, __pyx_n_s_sgimc_ops, __pyx_d, ((PyObject *)__pyx_codeobj__38)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 368, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   if (PyDict_SetItem(__pyx_d, __pyx_n_s_shrink_row, __pyx_t_4) < 0) __PYX_ERR(0, 368, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
-  /* "sgimc/ops.pyx":443
+  /* "sgimc/ops.pyx":448
+ * 
+ * 
+ * def huber_loss(const double[::1] predict,             # <<<<<<<<<<<<<<
+ *                const double[::1] target,
+ *                double epsilon):
+ */
+  __pyx_t_4 = __Pyx_CyFunction_New(&__pyx_mdef_5sgimc_3ops_15huber_loss, 0, __pyx_n_s_huber_loss, NULL, __pyx_n_s_sgimc_ops, __pyx_d, ((PyObject *)__pyx_codeobj__40)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 448, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_huber_loss, __pyx_t_4) < 0) __PYX_ERR(0, 448, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "sgimc/ops.pyx":491
+ * 
+ * 
+ * def huber_grad(const double[::1] predict,             # <<<<<<<<<<<<<<
+ *                const double[::1] target,
+ *                double epsilon):
+ */
+  __pyx_t_4 = __Pyx_CyFunction_New(&__pyx_mdef_5sgimc_3ops_17huber_grad, 0, __pyx_n_s_huber_grad, NULL, __pyx_n_s_sgimc_ops, __pyx_d, ((PyObject *)__pyx_codeobj__41)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 491, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_huber_grad, __pyx_t_4) < 0) __PYX_ERR(0, 491, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "sgimc/ops.pyx":536
+ * 
+ * 
+ * def logistic_loss(const double[::1] logit, const double[::1] target):             # <<<<<<<<<<<<<<
+ *     """Compute the logistic loss `log(1 + exp(- target * logit))`.
+ * 
+ */
+  __pyx_t_4 = __Pyx_CyFunction_New(&__pyx_mdef_5sgimc_3ops_19logistic_loss, 0, __pyx_n_s_logistic_loss, NULL, __pyx_n_s_sgimc_ops, __pyx_d, ((PyObject *)__pyx_codeobj__43)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 536, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_logistic_loss, __pyx_t_4) < 0) __PYX_ERR(0, 536, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "sgimc/ops.pyx":573
+ * 
+ * 
+ * def logistic_grad(const double[::1] logit, const double[::1] target):             # <<<<<<<<<<<<<<
+ *     """Compute the derivative of the logistic loss w.r.t. `logit`.
+ * 
+ */
+  __pyx_t_4 = __Pyx_CyFunction_New(&__pyx_mdef_5sgimc_3ops_21logistic_grad, 0, __pyx_n_s_logistic_grad, NULL, __pyx_n_s_sgimc_ops, __pyx_d, ((PyObject *)__pyx_codeobj__45)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 573, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_logistic_grad, __pyx_t_4) < 0) __PYX_ERR(0, 573, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "sgimc/ops.pyx":605
+ * 
+ * 
+ * def logistic_hess(const double[::1] logit):             # <<<<<<<<<<<<<<
+ *     """Compute the second derivative of the logistic loss w.r.t. `logit`.
+ * 
+ */
+  __pyx_t_4 = __Pyx_CyFunction_New(&__pyx_mdef_5sgimc_3ops_23logistic_hess, 0, __pyx_n_s_logistic_hess, NULL, __pyx_n_s_sgimc_ops, __pyx_d, ((PyObject *)__pyx_codeobj__47)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 605, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_logistic_hess, __pyx_t_4) < 0) __PYX_ERR(0, 605, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "sgimc/ops.pyx":639
  *                 double[:, ::1] D,
  *                 double[::1] S,
  *                 int n_threads=1):             # <<<<<<<<<<<<<<
  *     cdef int errcode = -1
  *     cdef int n_1 = X.shape[0], n_2 = Z.shape[0]
  */
-  __pyx_t_4 = __Pyx_PyInt_From_int(((int)1)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 443, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyInt_From_int(((int)1)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 639, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
 
-  /* "sgimc/ops.pyx":438
+  /* "sgimc/ops.pyx":634
  * 
  * 
  * def _dense_op_d(object R,             # <<<<<<<<<<<<<<
  *                 double[:, ::1] X,
  *                 double[:, ::1] Z,
  */
-  __pyx_t_7 = PyTuple_New(1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 438, __pyx_L1_error)
+  __pyx_t_7 = PyTuple_New(1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 634, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_7);
   __Pyx_GIVEREF(__pyx_t_4);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_4)) __PYX_ERR(0, 438, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_4)) __PYX_ERR(0, 634, __pyx_L1_error);
   __pyx_t_4 = 0;
-  __pyx_t_4 = __Pyx_CyFunction_New(&__pyx_mdef_5sgimc_3ops_15_dense_op_d, 0, __pyx_n_s_dense_op_d, NULL, __pyx_n_s_sgimc_ops, __pyx_d, ((PyObject *)__pyx_codeobj__38)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 438, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_CyFunction_New(&__pyx_mdef_5sgimc_3ops_25_dense_op_d, 0, __pyx_n_s_dense_op_d, NULL, __pyx_n_s_sgimc_ops, __pyx_d, ((PyObject *)__pyx_codeobj__49)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 634, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_4, __pyx_t_7);
   __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_dense_op_d, __pyx_t_4) < 0) __PYX_ERR(0, 438, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_dense_op_d, __pyx_t_4) < 0) __PYX_ERR(0, 634, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
-  /* "sgimc/ops.pyx":472
+  /* "sgimc/ops.pyx":668
  *                  double[:, ::1] D,
  *                  double[::1] S,
  *                  int n_threads=1):             # <<<<<<<<<<<<<<
  *     cdef int errcode = -1
  *     cdef int n_1 = X.shape[0], n_2 = Z.shape[0]
  */
-  __pyx_t_4 = __Pyx_PyInt_From_int(((int)1)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 472, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyInt_From_int(((int)1)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 668, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
 
-  /* "sgimc/ops.pyx":467
+  /* "sgimc/ops.pyx":663
  * 
  * 
  * def _sparse_op_d(object R,             # <<<<<<<<<<<<<<
  *                  object X,
  *                  double[:, ::1] Z,
  */
-  __pyx_t_7 = PyTuple_New(1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 467, __pyx_L1_error)
+  __pyx_t_7 = PyTuple_New(1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 663, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_7);
   __Pyx_GIVEREF(__pyx_t_4);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_4)) __PYX_ERR(0, 467, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_4)) __PYX_ERR(0, 663, __pyx_L1_error);
   __pyx_t_4 = 0;
-  __pyx_t_4 = __Pyx_CyFunction_New(&__pyx_mdef_5sgimc_3ops_17_sparse_op_d, 0, __pyx_n_s_sparse_op_d, NULL, __pyx_n_s_sgimc_ops, __pyx_d, ((PyObject *)__pyx_codeobj__40)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 467, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_CyFunction_New(&__pyx_mdef_5sgimc_3ops_27_sparse_op_d, 0, __pyx_n_s_sparse_op_d, NULL, __pyx_n_s_sgimc_ops, __pyx_d, ((PyObject *)__pyx_codeobj__51)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 663, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_4, __pyx_t_7);
   __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_sparse_op_d, __pyx_t_4) < 0) __PYX_ERR(0, 467, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_sparse_op_d, __pyx_t_4) < 0) __PYX_ERR(0, 663, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
-  /* "sgimc/ops.pyx":502
+  /* "sgimc/ops.pyx":698
  *                 double[::1] S,
  *                 double[:, ::1] D,
  *                 int n_threads=1):             # <<<<<<<<<<<<<<
  *     cdef int errcode = -1
  *     cdef int n_1 = X.shape[0], n_2 = Z.shape[0]
  */
-  __pyx_t_4 = __Pyx_PyInt_From_int(((int)1)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 502, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyInt_From_int(((int)1)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 698, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
 
-  /* "sgimc/ops.pyx":497
+  /* "sgimc/ops.pyx":693
  * 
  * 
  * def _dense_op_s(object R,             # <<<<<<<<<<<<<<
  *                 double[:, ::1] X,
  *                 double[:, ::1] Z,
  */
-  __pyx_t_7 = PyTuple_New(1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 497, __pyx_L1_error)
+  __pyx_t_7 = PyTuple_New(1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 693, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_7);
   __Pyx_GIVEREF(__pyx_t_4);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_4)) __PYX_ERR(0, 497, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_4)) __PYX_ERR(0, 693, __pyx_L1_error);
   __pyx_t_4 = 0;
-  __pyx_t_4 = __Pyx_CyFunction_New(&__pyx_mdef_5sgimc_3ops_19_dense_op_s, 0, __pyx_n_s_dense_op_s, NULL, __pyx_n_s_sgimc_ops, __pyx_d, ((PyObject *)__pyx_codeobj__42)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 497, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_CyFunction_New(&__pyx_mdef_5sgimc_3ops_29_dense_op_s, 0, __pyx_n_s_dense_op_s, NULL, __pyx_n_s_sgimc_ops, __pyx_d, ((PyObject *)__pyx_codeobj__53)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 693, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_4, __pyx_t_7);
   __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_dense_op_s, __pyx_t_4) < 0) __PYX_ERR(0, 497, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_dense_op_s, __pyx_t_4) < 0) __PYX_ERR(0, 693, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
-  /* "sgimc/ops.pyx":530
+  /* "sgimc/ops.pyx":726
  *                  double[::1] S,
  *                  double[:, ::1] D,
  *                  int n_threads=1):             # <<<<<<<<<<<<<<
  *     cdef int errcode = -1
  *     cdef int n_1 = X.shape[0], n_2 = Z.shape[0]
  */
-  __pyx_t_4 = __Pyx_PyInt_From_int(((int)1)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 530, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyInt_From_int(((int)1)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 726, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
 
-  /* "sgimc/ops.pyx":525
+  /* "sgimc/ops.pyx":721
  * 
  * 
  * def _sparse_op_s(object R,             # <<<<<<<<<<<<<<
  *                  object X,
  *                  double[:, ::1] Z,
  */
-  __pyx_t_7 = PyTuple_New(1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 525, __pyx_L1_error)
+  __pyx_t_7 = PyTuple_New(1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 721, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_7);
   __Pyx_GIVEREF(__pyx_t_4);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_4)) __PYX_ERR(0, 525, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_4)) __PYX_ERR(0, 721, __pyx_L1_error);
   __pyx_t_4 = 0;
-  __pyx_t_4 = __Pyx_CyFunction_New(&__pyx_mdef_5sgimc_3ops_21_sparse_op_s, 0, __pyx_n_s_sparse_op_s, NULL, __pyx_n_s_sgimc_ops, __pyx_d, ((PyObject *)__pyx_codeobj__44)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 525, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_CyFunction_New(&__pyx_mdef_5sgimc_3ops_31_sparse_op_s, 0, __pyx_n_s_sparse_op_s, NULL, __pyx_n_s_sgimc_ops, __pyx_d, ((PyObject *)__pyx_codeobj__55)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 721, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_4, __pyx_t_7);
   __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_sparse_op_s, __pyx_t_4) < 0) __PYX_ERR(0, 525, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_sparse_op_s, __pyx_t_4) < 0) __PYX_ERR(0, 721, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
   /* "sgimc/ops.pyx":1
@@ -34120,6 +36221,29 @@ __pyx_fail:
     return result;
 }
 
+/* ObjectToMemviewSlice */
+  static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dc_double__const__(PyObject *obj, int writable_flag) {
+    __Pyx_memviewslice result = { 0, 0, { 0 }, { 0 }, { 0 } };
+    __Pyx_BufFmt_StackElem stack[1];
+    int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_CONTIG) };
+    int retcode;
+    if (obj == Py_None) {
+        result.memview = (struct __pyx_memoryview_obj *) Py_None;
+        return result;
+    }
+    retcode = __Pyx_ValidateAndInit_memviewslice(axes_specs, __Pyx_IS_C_CONTIG,
+                                                 (PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) | writable_flag, 1,
+                                                 &__Pyx_TypeInfo_double__const__, stack,
+                                                 &result, obj);
+    if (unlikely(retcode == -1))
+        goto __pyx_fail;
+    return result;
+__pyx_fail:
+    result.memview = NULL;
+    result.data = NULL;
+    return result;
+}
+
 /* MemviewDtypeToObject */
   static CYTHON_INLINE PyObject *__pyx_memview_get_double(const char *itemp) {
     return (PyObject *) PyFloat_FromDouble(*(double *) itemp);
@@ -35772,7 +37896,7 @@ __Pyx_PyType_GetName(PyTypeObject* tp)
     if (unlikely(name == NULL) || unlikely(!PyUnicode_Check(name))) {
         PyErr_Clear();
         Py_XDECREF(name);
-        name = __Pyx_NewRef(__pyx_n_s__45);
+        name = __Pyx_NewRef(__pyx_n_s__56);
     }
     return name;
 }
@@ -13,7 +13,7 @@ from cpython cimport bool
 
 from scipy.sparse import csr_matrix
 
-from libc.math cimport fabs, sqrt
+from libc.math cimport fabs, sqrt, exp, log1p
 from libc.string cimport memcpy
 
 from scipy.linalg.cython_blas cimport dnrm2
@@ -435,6 +435,202 @@ def shrink_row(double[::1] D, double C_lasso, double C_group, double C_ridge):
     return out.base
 
 
+cdef inline double sigmoid(double x) noexcept nogil:
+    """Compute the logistic sigmoid without overflow."""
+    cdef double z
+    if x >= 0:
+        return 1. / (1. + exp(-x))
+    # end if
+    z = exp(x)
+    return z / (1. + z)
+
+
+def huber_loss(const double[::1] predict,
+               const double[::1] target,
+               double epsilon):
+    """Compute the Huber loss of the residuals `predict - target`.
+
+    Parameters
+    ----------
+    predict : 1d array, shape = [n,]
+        The predicted values.
+
+    target : 1d array, shape = [n,]
+        The target values.
+
+    epsilon : float
+        Positive threshold, at which the loss turns from quadratic to linear.
+
+    Returns
+    -------
+    out : 1d array, shape = [n,]
+        The elementwise loss values.
+    """
+    cdef Py_ssize_t i, n = predict.shape[0]
+    cdef double resid
+
+    if target.shape[0] != n:
+        raise TypeError("""`predict` and `target` must have equal length.""")
+
+    cdef double[::1] out = np.empty(n, dtype="double")
+
+    with nogil:
+        for i in range(n):
+            resid = fabs(predict[i] - target[i])
+            if resid > epsilon:
+                out[i] = epsilon * (resid - epsilon / 2)
+            else:
+                out[i] = 0.5 * resid * resid
+            # end if
+        # end for
+    # end with
+
+    return out.base
+
+
+def huber_grad(const double[::1] predict,
+               const double[::1] target,
+               double epsilon):
+    """Compute the derivative of the Huber loss w.r.t. `predict`.
+
+    Parameters
+    ----------
+    predict : 1d array, shape = [n,]
+        The predicted values.
+
+    target : 1d array, shape = [n,]
+        The target values.
+
+    epsilon : float
+        Positive threshold, at which the loss turns from quadratic to linear.
+
+    Returns
+    -------
+    out : 1d array, shape = [n,]
+        The residuals clipped to `[-epsilon, epsilon]`.
+    """
+    cdef Py_ssize_t i, n = predict.shape[0]
+    cdef double resid
+
+    if target.shape[0] != n:
+        raise TypeError("""`predict` and `target` must have equal length.""")
+
+    cdef double[::1] out = np.empty(n, dtype="double")
+
+    with nogil:
+        for i in range(n):
+            resid = predict[i] - target[i]
+            if resid > epsilon:
+                out[i] = epsilon
+            elif resid < -epsilon:
+                out[i] = -epsilon
+            else:
+                out[i] = resid
+            # end if
+        # end for
+    # end with
+
+    return out.base
+
+
+def logistic_loss(const double[::1] logit, const double[::1] target):
+    """Compute the logistic loss `log(1 + exp(- target * logit))`.
+
+    Parameters
+    ----------
+    logit : 1d array, shape = [n,]
+        The predicted log-odds.
+
+    target : 1d array, shape = [n,]
+        The `-1 / +1` labels.
+
+    Returns
+    -------
+    out : 1d array, shape = [n,]
+        The elementwise loss values.
+    """
+    cdef Py_ssize_t i, n = logit.shape[0]
+    cdef double margin
+
+    if target.shape[0] != n:
+        raise TypeError("""`logit` and `target` must have equal length.""")
+
+    cdef double[::1] out = np.empty(n, dtype="double")
+
+    with nogil:
+        for i in range(n):
+            margin = - target[i] * logit[i]
+            out[i] = log1p(exp(-fabs(margin)))
+            if margin > 0:
+                out[i] += margin
+            # end if
+        # end for
+    # end with
+
+    return out.base
+
+
+def logistic_grad(const double[::1] logit, const double[::1] target):
+    """Compute the derivative of the logistic loss w.r.t. `logit`.
+
+    Parameters
+    ----------
+    logit : 1d array, shape = [n,]
+        The predicted log-odds.
+
+    target : 1d array, shape = [n,]
+        The `-1 / +1` labels.
+
+    Returns
+    -------
+    out : 1d array, shape = [n,]
+        The values of `- target * sigmoid(- target * logit)`.
+    """
+    cdef Py_ssize_t i, n = logit.shape[0]
+
+    if target.shape[0] != n:
+        raise TypeError("""`logit` and `target` must have equal length.""")
+
+    cdef double[::1] out = np.empty(n, dtype="double")
+
+    with nogil:
+        for i in range(n):
+            out[i] = - target[i] * sigmoid(- target[i] * logit[i])
+        # end for
+    # end with
+
+    return out.base
+
+
+def logistic_hess(const double[::1] logit):
+    """Compute the second derivative of the logistic loss w.r.t. `logit`.
+
+    Parameters
+    ----------
+    logit : 1d array, shape = [n,]
+        The predicted log-odds.
+
+    Returns
+    -------
+    out : 1d array, shape = [n,]
+        The values of `p (1 - p)` with `p = sigmoid(logit)`.
+    """
+    cdef Py_ssize_t i, n = logit.shape[0]
+    cdef double z
+
+    cdef double[::1] out = np.empty(n, dtype="double")
+
+    with nogil:
+        for i in range(n):
+            # p (1 - p) = e / (1 + e)^2 with e = exp(-|logit|) never overflows
+            z = exp(-fabs(logit[i]))
+            out[i] = z / ((1. + z) * (1. + z))
+        # end for
+    # end with
+
+    return out.base
+
+
 def _dense_op_d(object R,
                 double[:, ::1] X,
                 double[:, ::1] Z,
@@ -4,7 +4,20 @@ from sklearn.metrics import mean_squared_error, accuracy_score
 
 from .base import QuadraticApproximation
 
-from scipy.special import expit
+from ..ops import huber_loss, huber_grad
+from ..ops import logistic_loss, logistic_grad, logistic_hess
+
+
+def _flatten(x):
+    """Get a flat contiguous double array for the kernels in `ops`."""
+    return np.ascontiguousarray(x, dtype=np.float64).reshape(-1)
+
+
+def _kernel(kernel, predict, target, *args):
+    """Apply an elementwise loss kernel to arrays of any conforming shape."""
+    predict, target = np.broadcast_arrays(predict, target)
+    out = kernel(_flatten(predict), _flatten(target), *args)
+    return out.reshape(predict.shape)
 
 
 class QAObjectiveL2Loss(QuadraticApproximation):
@@ -30,8 +43,12 @@ class QAObjectiveL2Loss(QuadraticApproximation):
 
     @staticmethod
     def h_func(predict, target):
-        """Get the Hessian statistics."""
-        return np.ones(len(target), dtype="double")
+        """Get the Hessian statistics.
+
+        The Hessian of the L2 loss is identically one, so a scalar is
+        returned, which broadcasts against the observed entries.
+        """
+        return np.float64(1.)
 
     @staticmethod
     def score(predict, target):
@@ -54,27 +71,19 @@ class QAObjectiveHuberLoss(QAObjectiveL2Loss):
 
     def v_func(self, predict, target):
         """Get the loss values."""
-        eps = self.epsilon
-
-        resid = abs(predict - target)
-        return np.where(resid > eps,
-                        eps * (resid - eps / 2),
-                        0.5 * resid**2)
+        return _kernel(huber_loss, predict, target, self.epsilon)
 
     def g_func(self, predict, target):
         """Get the gradient statistics."""
-        eps = self.epsilon
-
-        resid = predict - target
-        return np.where(abs(resid) > eps,
-                        eps * np.sign(resid),
-                        resid)
+        return _kernel(huber_grad, predict, target, self.epsilon)
 
     def h_func(self, predict, target):
         """Get the Hessian statistics."""
-        eps = self.epsilon
+        out = np.subtract(predict, target)
+        np.abs(out, out=out)
 
-        return (abs(predict - target) <= eps) * 1.
+        # the comparison writes its 0/1 result straight into the float buffer
+        return np.less_equal(out, self.epsilon, out=out)
 
 
 class QAObjectiveLogLoss(QuadraticApproximation):
@@ -91,18 +100,17 @@ class QAObjectiveLogLoss(QuadraticApproximation):
     @staticmethod
     def v_func(logit, target):
         """Get the loss values."""
-        return np.logaddexp(0, - target * logit)
+        return _kernel(logistic_loss, logit, target)
 
     @staticmethod
     def g_func(logit, target):
         """Get the gradient statistics."""
-        return - target * expit(-logit * target)
+        return _kernel(logistic_grad, logit, target)
 
     @staticmethod
     def h_func(logit, target):
         """Get the Hessian statistics."""
-        prob = expit(logit)
-        return prob * (1 - prob)
+        return logistic_hess(_flatten(logit)).reshape(np.shape(logit))
 
     @staticmethod
     def score(logit, target):
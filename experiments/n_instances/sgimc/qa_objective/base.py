@@ -51,7 +51,8 @@ class QuadraticApproximation(object):
         self.YH = np.ascontiguousarray(
             safe_sparse_dot(Y, H, dense_output=True))
 
-        self.R = R.tocsr()
+        # the loss kernels in `ops` expect double precision targets
+        self.R = R.tocsr().astype(np.float64, copy=False)
 
         self.update(W)
 
@@ -1,17 +1,24 @@
 """Utility functions."""
+import io
 import os
 import time
 import gzip
 import pickle
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
-from scipy.sparse import coo_matrix
+from scipy.sparse import csr_matrix
 from sklearn.utils import check_random_state
+from sklearn.utils.random import sample_without_replacement
+from sklearn.utils.extmath import safe_sparse_dot
 from sklearn.model_selection._split import _validate_shuffle_split
 import matplotlib.pyplot as plt
 
 from . import IMCProblem
 
+# buffer size for the (de)compressing streams in `save` and `load`
+_IO_BUFFER_SIZE = 1 << 20
+
 
 def make_imc_data(n_1, d_1, n_2, d_2, k, scale=0.05, noise=0, random_state=None,
                   binarize=False, return_noisy_only=True):
@@ -34,14 +41,19 @@ def make_imc_data(n_1, d_1, n_2, d_2, k, scale=0.05, noise=0, random_state=None,
     W, H = np.eye(d_1, k), np.eye(d_2, k)
 
     R = np.dot(np.dot(X, W), np.dot(Y, H).T)
-    R_noise = R.copy()
     if noise > 0:
-        R_noise += random_state.normal(scale=noise, size=(n_1, n_2))
+        # add the signal to the drawn noise inplace, instead of to a copy
+        R_noise = random_state.normal(scale=noise, size=(n_1, n_2))
+        R_noise += R
+
+    else:
+        R_noise = R if return_noisy_only else R.copy()
 
     if binarize:
         # We use $\pm 1$ labels in the classification problem.
-        R = np.where(R >= 0, 1., -1.)
-        R_noise = np.where(R_noise >= 0, 1., -1.)
+        np.copysign(1., R_noise, out=R_noise)
+        if not return_noisy_only:
+            np.copysign(1., R, out=R)
 
     if return_noisy_only:
         return X, W, Y, H, R_noise
@@ -49,23 +61,40 @@ def make_imc_data(n_1, d_1, n_2, d_2, k, scale=0.05, noise=0, random_state=None,
         return X, W, Y, H, R_noise, R
 
 
+def _csr_from_mask(R, mask):
+    """Build a CSR matrix from the elements of `R` selected by `mask`.
+
+    The nonzero entries of a boolean mask are already in row-major order
+    and unique, so the CSR structure is built directly, bypassing the COO
+    conversion with its sorting and duplicate summation.
+    """
+    nnz_row = np.count_nonzero(mask, axis=1)
+    index_dtype = np.int32 if nnz_row.sum() < 2**31 else np.int64
+
+    indptr = np.zeros(R.shape[0] + 1, dtype=index_dtype)
+    np.cumsum(nnz_row, out=indptr[1:])
+
+    # pick the column numbers directly, skipping the row indices (and the
+    #  int64 arrays) that `np.nonzero` would allocate
+    columns = np.arange(R.shape[1], dtype=index_dtype)
+    indices = np.broadcast_to(columns, mask.shape)[mask]
+    data = np.asarray(R[mask], dtype=np.float64)
+
+    return csr_matrix((data, indices, indptr), shape=R.shape)
+
+
 def sparsify(R, sparsity=0.10, random_state=None):
     """Sparsify the given matrix."""
     random_state = check_random_state(random_state)
 
     mask = random_state.uniform(size=R.shape) < sparsity
-    R_coo = coo_matrix((R[mask], np.nonzero(mask)),
-                       shape=R.shape, dtype=np.float64)
 
-    return R_coo.tocsr(), mask
+    return _csr_from_mask(R, mask), mask
 
 
 def sparsify_with_mask(R, mask):
     """Sparcify the given matrix with the mask."""
-    R_coo = coo_matrix((R[mask], np.nonzero(mask)),
-                       shape=R.shape, dtype=np.float64)
-
-    return R_coo.tocsr()
+    return _csr_from_mask(R, mask)
 
 
 def save(obj, path, filename=None, gz=None):
@@ -87,9 +116,11 @@ def save(obj, path, filename=None, gz=None):
         If None, then does not apply compression while pickling. Otherwise
         must be an integer 0-9 which determines the level of GZip compression:
         the lower the level the less thorough but the more faster the
-        compression is. Value `0` produces a GZip archive with no compression
-        whatsoever, whereas the value of `9` produces the most compressed
-        archive.
+        compression is. Value `0` is treated as `None` and produces a plain
+        pickle, since a GZip archive with no compression whatsoever only adds
+        framing and checksum overhead, whereas the value of `9` produces the
+        most compressed archive. Level `1` is usually much faster than `9`
+        at a small cost in size.
 
     Returns
     -------
@@ -103,7 +134,13 @@ def save(obj, path, filename=None, gz=None):
     if not os.path.isdir(path):
         os.makedirs(path)
 
-    open_ = open if gz is None else lambda f, m: gzip.open(f, m, gz)
+    if not gz:
+        gz, open_ = None, open
+    else:
+        # buffer the small writes of the pickler ahead of the compressor
+        def open_(f, m):
+            return io.BufferedWriter(gzip.open(f, m, compresslevel=gz),
+                                     buffer_size=_IO_BUFFER_SIZE)
     if filename is None:
         filename_ = "%s-%s.%s" % (path, time.strftime("%Y%m%d_%H%M%S"),
                                   "pic" if gz is None else "gz")
@@ -112,7 +149,9 @@ def save(obj, path, filename=None, gz=None):
                                 '.pic' if gz is None else '.gz')
 
     with open_(filename_, "wb+") as f:
-        pickle.dump(obj, f)
+        # protocol 4+ frames large arrays and 5 streams their buffers
+        #  straight into `f` without an intermediate copy
+        pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
     if filename is None:
         return filename_
 
@@ -130,7 +169,13 @@ def load(filename):
     object: a python object
         The recovered pythonic object.
     """
-    open_ = open if not filename.endswith(".gz") else gzip.open
+    if not filename.endswith(".gz"):
+        open_ = open
+    else:
+        # serve the many small reads of the unpickler from a large buffer
+        def open_(f, m):
+            return io.BufferedReader(gzip.open(f, m),
+                                     buffer_size=_IO_BUFFER_SIZE)
 
     with open_(filename, "rb") as f:
         obj = pickle.load(f)
@@ -145,7 +190,17 @@ def mc_split(R, n_splits=1, test_size='default', train_size=None, random_state=N
 
     rng = check_random_state(random_state)
     for i in range(n_splits):
-        permutation = rng.permutation(n_samples)
+        if n_train + n_test < 0.01 * n_samples:
+            # draw just the tiny subset, not all `n_samples`: the sampler
+            #  does not guarantee random order, hence the shuffle.
+            permutation = sample_without_replacement(
+                n_samples, n_train + n_test, method="tracking_selection",
+                random_state=rng)
+            rng.shuffle(permutation)
+
+        else:
+            permutation = rng.permutation(n_samples)
+
         ind_test = permutation[:n_test]
         ind_train = permutation[n_test:(n_test + n_train)]
 
@@ -154,16 +209,72 @@ def mc_split(R, n_splits=1, test_size='default', train_size=None, random_state=N
 
 def get_submatrix(mat, indices):
     """Extracts a sparse submatrix from a dense one accorind to the provided indices."""
-    nz_ij = np.unravel_index(indices, mat.shape)
-    subm = coo_matrix((mat.flat[indices], nz_ij), shape=mat.shape)
-    return subm.tocsr()
+    n_rows, n_cols = mat.shape
+    index_dtype = np.int32 if len(indices) < 2**31 else np.int64
+
+    # sorted flat indices are in row-major order, i.e. already CSR ordered
+    indices = np.sort(indices)
+    indptr = np.searchsorted(indices, np.arange(n_rows + 1) * n_cols)
+
+    cols = np.empty(len(indices), dtype=index_dtype)
+    np.remainder(indices, n_cols, out=cols)
+
+    return csr_matrix((mat.flat[indices], cols,
+                       indptr.astype(index_dtype, copy=False)),
+                      shape=mat.shape)
 
 
 # =================== some questionable functions =========================================
 
 
-def performance(problem, W, H, C, R_full):
-    """Compute the performance of the IMC estimates."""
+def _history_sparsity_variation(W):
+    """Get the share of zeros and the step norm of each iterate of `W`.
+
+    The history `W` has the iterations along the leading axis. It is
+    traversed once, one iterate at a time, so that only temporaries of the
+    size of a single `W[i]` are ever allocated.
+    """
+    n_iterations = W.shape[0]
+
+    sparsity, variation = np.zeros((2, n_iterations), dtype=np.float64)
+    for i in range(n_iterations):
+        W_i = W[i]
+        # `np.isclose(W_i, 0)` reduces to `|W_i| <= atol` with atol = 1e-8
+        sparsity[i] = np.count_nonzero(abs(W_i) <= 1e-8) / float(W_i.size)
+        if i > 0:
+            variation[i - 1] = np.linalg.norm(W_i - W_prev, "fro")
+        W_prev = W_i
+
+    return sparsity, variation
+
+
+def _n_workers(n_jobs):
+    """Resolve `n_jobs` like `get_max_threads` in `src/threads.c`.
+
+    Positive values are capped by the number of usable cores, negative values
+    leave `-n_jobs - 1` cores free, and zero means a single thread.
+    """
+    if hasattr(os, "sched_getaffinity"):
+        # the cores this process may run on, as seen by OpenMP
+        max_threads = len(os.sched_getaffinity(0))
+    else:
+        max_threads = os.cpu_count() or 1
+
+    if n_jobs > 0:
+        return min(max_threads, n_jobs)
+
+    if n_jobs < 0:
+        return max(1, max_threads + (n_jobs + 1))
+
+    return 1
+
+
+def performance(problem, W, H, C, R_full, n_jobs=1):
+    """Compute the performance of the IMC estimates.
+
+    Set `n_jobs` to evaluate the full matrix for several iterations in
+    parallel threads, at the cost of about three `n_1 x n_2` arrays each.
+    """
 
     assert isinstance(problem, IMCProblem), \
         """`problem` must be an IMC problem."""
@@ -175,19 +286,24 @@ def performance(problem, W, H, C, R_full):
     n_iterations = W.shape[-1]
     assert W.shape[-1] == H.shape[-1], """Mismatching number of iterations."""
 
-    # sparsitry coefficients
-    sparsity_W = np.isclose(W, 0).mean(axis=(0, 1))
-    sparsity_H = np.isclose(H, 0).mean(axis=(0, 1))
+    # Put the iterations on the leading axis, so that each iterate `W[i]`
+    #  is a contiguous block and the reductions below are unit-stride.
+    W = np.ascontiguousarray(np.moveaxis(W, -1, 0))
+    H = np.ascontiguousarray(np.moveaxis(H, -1, 0))
 
-    # Regularization -- components
-    reg_ridge = (0.5 * np.linalg.norm(W, "fro", axis=(0, 1))**2 +
-                 0.5 * np.linalg.norm(H, "fro", axis=(0, 1))**2)
+    # sparsitry coefficients and sequential forbenius norm of the matrices
+    sparsity_W, div_W = _history_sparsity_variation(W)
+    sparsity_H, div_H = _history_sparsity_variation(H)
 
-    reg_group = (np.linalg.norm(W, 2, axis=1).sum(axis=0) +
-                 np.linalg.norm(H, 2, axis=1).sum(axis=0))
+    # Regularization -- components: the einsum fuses the squaring into the
+    #  row-wise reduction, so no full-size `W * W` temporary is made.
+    W_sq = np.einsum("tij,tij->ti", W, W)
+    H_sq = np.einsum("tij,tij->ti", H, H)
+    reg_ridge = 0.5 * (W_sq.sum(axis=-1) + H_sq.sum(axis=-1))
 
-    reg_lasso = (np.linalg.norm(W.reshape(-1, W.shape[-1]), 1, axis=0) +
-                 np.linalg.norm(H.reshape(-1, H.shape[-1]), 1, axis=0))
+    reg_group = np.sqrt(W_sq).sum(axis=-1) + np.sqrt(H_sq).sum(axis=-1)
+
+    reg_lasso = abs(W).sum(axis=(1, 2)) + abs(H).sum(axis=(1, 2))
 
     # Regularization -- full
     C_lasso, C_group, C_ridge = C
@@ -195,25 +311,45 @@ def performance(problem, W, H, C, R_full):
                          C_lasso * reg_lasso +
                          C_ridge * reg_ridge)
 
-    # sequential forbenius norm of the matrices
-    div_W = np.r_[np.linalg.norm(np.diff(W, axis=-1),
-                                 "fro", axis=(0, 1)), 0]
-    div_H = np.r_[np.linalg.norm(np.diff(H, axis=-1),
-                                 "fro", axis=(0, 1)), 0]
-
     # Objective value on the train data
-    v_val_train = np.array([problem.value(W[..., i], H[..., i])
+    v_val_train = np.array([problem.value(W[i], H[i])
                             for i in range(n_iterations)])
 
-    # Objective on the full matrix (expensive!)
-    v_val_full = np.array([
-        problem.loss(problem.prediction(W[..., i], H[..., i]).ravel(),
-                     R_full.ravel()).sum() for i in range(n_iterations)])
-
-    # Score on the full matrix (expensive!)
-    score_full = np.array([
-        problem.score(problem.prediction(W[..., i], H[..., i]).ravel(),
-                      R_full.ravel()) for i in range(n_iterations)])
+    # Side-feature products for all iterations at once: one (sparse) GEMM
+    #  against the side-by-side iterates `[W_0, ..., W_{T-1}]`. The rows of
+    #  the `(n, T, k)` result are unit-stride in `k`, so each `XW[:, i]` goes
+    #  to BLAS without a copy.
+    XW = safe_sparse_dot(problem._X, np.concatenate(W, axis=-1),
+                         dense_output=True)
+    XW = XW.reshape(-1, n_iterations, W.shape[-1])
+    YH = safe_sparse_dot(problem._Y, np.concatenate(H, axis=-1),
+                         dense_output=True)
+    YH = YH.reshape(-1, n_iterations, H.shape[-1])
+
+    # flatten the target once: `ravel` silently copies non-contiguous inputs
+    R_flat = np.ascontiguousarray(R_full, dtype=np.float64).reshape(-1)
+
+    # Objective and score on the full matrix (expensive!): each worker
+    #  predicts into its own buffer; BLAS and the ufuncs release the GIL.
+    v_val_full = np.empty(n_iterations, dtype=np.float64)
+    score_full = np.empty(n_iterations, dtype=np.float64)
+
+    def full_matrix_metrics(iterations):
+        predict = np.empty((XW.shape[0], YH.shape[0]),
+                           dtype=np.result_type(XW, YH))
+        predict_flat = predict.reshape(-1)
+        for i in iterations:
+            np.dot(XW[:, i], YH[:, i].T, out=predict)
+            v_val_full[i] = problem.loss(predict_flat, R_flat).sum()
+            score_full[i] = problem.score(predict_flat, R_flat)
+
+    n_workers = min(_n_workers(n_jobs), n_iterations)
+    chunks = np.array_split(np.arange(n_iterations), n_workers)
+    if n_workers > 1:
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            list(executor.map(full_matrix_metrics, chunks))
+    else:
+        full_matrix_metrics(chunks[0])
 
     metrics = np.stack([v_val_train, regularizer_value,
                         score_full, v_val_full,